@@ -10,6 +10,11 @@ from mist_client import AgentBase
 from .commands import dispatch
 from .manifest import MANIFEST
 
+try:  # optional: pip install notes-agent[fast]
+    import uvloop
+except ImportError:
+    uvloop = None
+
 
 class NotesAgent(AgentBase):
     """Notes agent that handles note-taking, topics, aggregation, and synthesis."""
@@ -27,4 +32,7 @@ def main() -> None:
         format="%(asctime)s %(levelname)s %(name)s: %(message)s",
     )
     agent = NotesAgent()
-    asyncio.run(agent.run())
+    if uvloop is not None:
+        uvloop.run(agent.run())
+    else:
+        asyncio.run(agent.run())
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
+from collections import defaultdict
 from typing import Any
 
 from mist_client import BrokerClient
@@ -12,53 +14,53 @@ from mist_client.protocol import Message
 from .notes import _format_entries
 from .prompts import AGGREGATE_ASSIGNMENT_PROMPT
 
+# Entries per classification prompt; larger buffers fan out concurrently,
+# at most CLASSIFY_CONCURRENCY prompts at a time.
+CLASSIFY_BATCH_SIZE = 50
+CLASSIFY_CONCURRENCY = 4
+
+# Runs of characters that may not appear in a slug.
+_NON_SLUG_RE = re.compile(r"[^a-z0-9]+")
+# ASCII fast path: one translate pass maps every non-slug character to "-".
+_SLUG_TABLE = str.maketrans({
+    c: chr(c) if chr(c) in "abcdefghijklmnopqrstuvwxyz0123456789" else "-"
+    for c in range(128)
+})
+
 
 def _slugify(heading: str) -> str:
     """Lowercase, replace non-alnum with hyphens, collapse, strip."""
-    slug = re.sub(r"[^a-z0-9]+", "-", heading.lower())
-    return slug.strip("-")
+    lowered = heading.lower()
+    if lowered.isascii():
+        return "-".join(filter(None, lowered.translate(_SLUG_TABLE).split("-")))
+    return _NON_SLUG_RE.sub("-", lowered).strip("-")
 
 
 def _strip_code_fences(text: str) -> str:
     """Remove ```json ... ``` wrapping."""
     text = text.strip()
+    if not text.startswith("```") and not text.endswith("```"):
+        return text  # common case: no fences, skip the regexes
     text = re.sub(r"^```(?:json)?\s*\n?", "", text)
     text = re.sub(r"\n?```\s*$", "", text)
     return text.strip()
 
 
-def _extract_json_array(text: str) -> str | None:
-    """Find the first top-level JSON array in text."""
-    start = text.find("[")
-    if start == -1:
-        return None
-    depth = 0
-    in_string = False
-    escape = False
-    for i in range(start, len(text)):
-        ch = text[i]
-        if escape:
-            escape = False
-            continue
-        if ch == "\\":
-            escape = True
-            continue
-        if ch == '"':
-            in_string = not in_string
-            continue
-        if in_string:
-            continue
-        if ch == "[":
-            depth += 1
-        elif ch == "]":
-            depth -= 1
-            if depth == 0:
-                return text[start:i + 1]
-    return None
+# Shared decoder for raw_decode: parses an array in place inside a larger string.
+_JSON_DECODER = json.JSONDecoder()
 
 
-def _parse_assignments(raw: str) -> list[dict]:
+def _parse_assignments(raw: str | bytes) -> list[dict]:
     """Parse JSON assignment array from LLM output."""
+    # Well-formed output parses as-is; json.loads takes bytes without a decode.
+    try:
+        result = json.loads(raw)
+        if isinstance(result, list):
+            return result
+    except ValueError:  # JSONDecodeError, or UnicodeDecodeError on bytes
+        pass
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8", errors="replace")
     cleaned = _strip_code_fences(raw)
     try:
         result = json.loads(cleaned)
@@ -66,10 +68,11 @@ def _parse_assignments(raw: str) -> list[dict]:
             return result
     except json.JSONDecodeError:
         pass
-    arr = _extract_json_array(raw)
-    if arr:
+    # Array embedded in prose: decode from the first '[' without slicing it out
+    start = raw.find("[")
+    if start != -1:
         try:
-            result = json.loads(arr)
+            result, _ = _JSON_DECODER.raw_decode(raw, start)
             if isinstance(result, list):
                 return result
         except json.JSONDecodeError:
@@ -77,6 +80,34 @@ def _parse_assignments(raw: str) -> list[dict]:
     return []
 
 
+async def _classify_batch(
+    client: BrokerClient, existing_text: str, batch: list[dict], offset: int,
+    limit: asyncio.Semaphore,
+) -> list[dict]:
+    """Classify one slice of the buffer, shifting indices by *offset*."""
+    prompt = AGGREGATE_ASSIGNMENT_PROMPT.format(
+        existing_topics=existing_text,
+        new_entries=_format_entries(batch),
+    )
+
+    # Retry up to 3 times on unparseable output
+    assignments = []
+    async with limit:
+        for attempt in range(3):
+            result = await client.llm_chat(prompt, command="aggregate")
+            assignments = _parse_assignments(result)
+            if assignments:
+                break
+
+    for a in assignments:
+        idx = a.get("index")
+        if isinstance(idx, int) and 0 <= idx < len(batch):
+            a["index"] = idx + offset
+        else:
+            a["index"] = None
+    return assignments
+
+
 async def handle_aggregate(client: BrokerClient, msg: Message) -> None:
     """Classify buffer entries into topics and route them."""
     entries = await client.parse_buffer()
@@ -95,81 +126,75 @@ async def handle_aggregate(client: BrokerClient, msg: Message) -> None:
     else:
         existing_text = "(no existing topics)"
 
-    formatted = _format_entries(entries)
-    prompt = AGGREGATE_ASSIGNMENT_PROMPT.format(
-        existing_topics=existing_text,
-        new_entries=formatted,
-    )
-
-    # Classify via LLM (retry up to 3 times)
-    assignments = []
-    for attempt in range(3):
-        result = await client.llm_chat(prompt, command="aggregate")
-        assignments = _parse_assignments(result)
-        if assignments:
-            break
+    # Classify in fixed-size batches, concurrently; indices are batch-local
+    limit = asyncio.Semaphore(CLASSIFY_CONCURRENCY)
+    batches = await asyncio.gather(*(
+        _classify_batch(client, existing_text, entries[i:i + CLASSIFY_BATCH_SIZE], i, limit)
+        for i in range(0, len(entries), CLASSIFY_BATCH_SIZE)
+    ))
+    assignments = [a for batch in batches for a in batch]
 
     if not assignments:
         await client.respond_error(msg, "Failed to parse LLM classification output.")
         return
 
-    # Identify proposed new topics
+    # Batches propose topics independently; merge every proposal by slug
+    # first, so routing sees them all whichever batch or position they
+    # came from. A proposal whose slug already exists joins that topic.
     existing_slugs = {t.get("slug") for t in index}
-    new_topics: dict[str, str] = {}  # name -> slug
-    for a in assignments:
+    new_topics: dict[str, str] = {}  # slug -> name
+    name_to_slug: dict[str, str] = {}
+    valid = [
+        a for a in assignments
+        if isinstance(a.get("index"), int) and 0 <= a["index"] < len(entries)
+    ]
+    for a in valid:
         new_name = a.get("new_topic")
-        if new_name and new_name != "__skip__":
-            slug = _slugify(new_name)
-            if slug and slug not in existing_slugs and new_name not in new_topics:
-                new_topics[new_name] = slug
-
-    # Create new topics (auto-accept in v2)
-    for name, slug in new_topics.items():
-        await client.add_topic(name, slug)
-
-    # Refresh index after creating topics
-    index = await client.load_topic_index()
-    all_slugs = {t.get("slug") for t in index}
+        if new_name and new_name != "__skip__" and new_name not in name_to_slug:
+            slug = name_to_slug[new_name] = _slugify(new_name)
+            if slug and slug not in existing_slugs:
+                new_topics.setdefault(slug, new_name)
 
-    # Route entries to topics
-    topic_entries: dict[str, list[dict]] = {}
+    # Group entries by target slug
+    topic_entries: defaultdict[str, list[dict]] = defaultdict(list)
     routed_count = 0
-    handled_indices: set[int] = set()
-
-    for a in assignments:
-        idx = a.get("index")
-        if idx is None or idx < 0 or idx >= len(entries):
-            continue
+    handled = bytearray(len(entries))  # 1 = routed or skipped
 
+    for a in valid:
+        idx = a["index"]
         slug = a.get("topic_slug")
         new_name = a.get("new_topic")
 
         if slug == "__skip__":
-            handled_indices.add(idx)
+            handled[idx] = 1
             continue
 
         if new_name:
-            target_slug = new_topics.get(new_name)
-        elif slug and slug in all_slugs:
-            target_slug = slug
+            if new_name == "__skip__":
+                continue
+            target_slug = name_to_slug[new_name]
         else:
+            target_slug = slug
+        if not target_slug or (
+            target_slug not in existing_slugs and target_slug not in new_topics
+        ):
             continue
 
-        if not target_slug:
-            continue
-
-        if target_slug not in topic_entries:
-            topic_entries[target_slug] = []
         topic_entries[target_slug].append(entries[idx])
-        handled_indices.add(idx)
+        handled[idx] = 1
         routed_count += 1
 
-    # Append entries to topic buffers
-    for slug, ents in topic_entries.items():
-        await client.append_to_topic_buffer(slug, ents)
+    # Create new topics (auto-accept in v2); no need to re-read the index
+    for slug, name in new_topics.items():
+        index.append(await client.add_topic(name, slug))
+
+    # Append entries to topic buffers; independent per topic, so pipeline them
+    async with asyncio.TaskGroup() as tg:
+        for slug, ents in topic_entries.items():
+            tg.create_task(client.append_to_topic_buffer(slug, ents))
 
     # Rewrite buffer with unhandled entries
-    leftover = [entries[i] for i in range(len(entries)) if i not in handled_indices]
+    leftover = [e for e, done in zip(entries, handled) if not done]
     if leftover:
         await client._service_request("storage", "write_buffer", {"entries": leftover})
     else:
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from typing import Any, Iterable
 
 from mist_client import BrokerClient
 from mist_client.protocol import Message
@@ -10,12 +11,13 @@ from mist_client.protocol import Message
 from .prompts import RECALL_PROMPT
 
 
-def _format_entries(entries: list[dict]) -> str:
+def _format_entries(entries: Iterable[dict]) -> str:
     """Format log entries as '[timestamp] (source) text' lines."""
-    return "\n".join(
+    # A list (not a generator) lets str.join size the result in one pass.
+    return "\n".join([
         f"[{e.get('time', '')}] ({e.get('source', '')}) {e.get('text', '')}"
         for e in entries
-    )
+    ])
 
 
 async def handle_note(client: BrokerClient, msg: Message, text: str) -> None:
@@ -26,14 +28,14 @@ async def handle_note(client: BrokerClient, msg: Message, text: str) -> None:
 
 async def handle_notes(client: BrokerClient, msg: Message, count: int = 10) -> None:
     """Show the last N notes from the buffer."""
-    entries = await client.parse_buffer()
-    note_entries = [e for e in entries if e.get("source") == "note"]
+    # Filtered and tailed by the broker, so only *count* entries cross the socket
+    note_entries = await client.tail_buffer(count, source="note")
     if not note_entries:
         await client.respond_text(msg, "No notes yet.")
         return
 
     lines = []
-    for e in note_entries[-count:]:
+    for e in note_entries:
         lines.append(f"[{e.get('time', '')}] {e.get('text', '')}")
     await client.respond_text(msg, "\n".join(lines))
 
@@ -84,9 +86,12 @@ async def handle_topic_view(client: BrokerClient, msg: Message, slug: str) -> No
 
     actual_slug = topic.get("slug", slug)
     name = topic.get("name", actual_slug)
-    synthesis = await client.load_topic_synthesis(actual_slug)
-    notes = await client.list_topic_notes(actual_slug)
-    buffer = await client.load_topic_buffer(actual_slug)
+    # Independent broker round-trips: issue them together
+    synthesis, notes, buffer = await asyncio.gather(
+        client.load_topic_synthesis(actual_slug),
+        client.list_topic_notes(actual_slug),
+        client.load_topic_buffer(actual_slug),
+    )
 
     # Return structured data the UI can render
     await client._send_response(msg, "topic_detail", {
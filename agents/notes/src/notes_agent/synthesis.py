@@ -9,6 +9,11 @@ from .notes import _format_entries
 from .prompts import TOPIC_RESYNTH_PROMPT, TOPIC_SYNC_PROMPT
 
 
+async def _load_topic_buffers(client: BrokerClient, index: list[dict]) -> list[list[dict]]:
+    """Fetch every topic's buffer in one request, in index order."""
+    return await client.load_topic_buffers([t.get("slug", "") for t in index])
+
+
 async def handle_sync(client: BrokerClient, msg: Message) -> None:
     """Incrementally update each topic's synthesis with new entries."""
     await client.respond_progress(msg, "Syncing synthesis...")
@@ -21,12 +26,12 @@ async def handle_sync(client: BrokerClient, msg: Message) -> None:
     high_water = await client.get_last_sync_time()
     updated_topics = []
     latest_time = high_water
+    buffers = await _load_topic_buffers(client, index)
 
-    for topic in index:
+    for topic, entries in zip(index, buffers):
         slug = topic.get("slug", "")
         name = topic.get("name", slug)
 
-        entries = await client.load_topic_buffer(slug)
         if high_water:
             entries = [e for e in entries if e.get("time", "") > high_water]
         if not entries:
@@ -74,12 +79,12 @@ async def handle_resynth(client: BrokerClient, msg: Message) -> None:
 
     latest_time = None
     updated_topics = []
+    buffers = await _load_topic_buffers(client, index)
 
-    for topic in index:
+    for topic, entries in zip(index, buffers):
         slug = topic.get("slug", "")
         name = topic.get("name", slug)
 
-        entries = await client.load_topic_buffer(slug)
         if not entries:
             continue
 
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from unittest.mock import AsyncMock
 
 import pytest
 
+from notes_agent import aggregate
 from notes_agent.aggregate import (
-    _extract_json_array,
+    CLASSIFY_BATCH_SIZE,
+    handle_aggregate,
     _parse_assignments,
     _slugify,
     _strip_code_fences,
@@ -34,19 +37,6 @@ class TestStripCodeFences:
         assert _strip_code_fences('```json\n[{"a": 1}]\n```') == '[{"a": 1}]'
 
 
-class TestExtractJsonArray:
-    def test_simple(self):
-        result = _extract_json_array('text [1, 2, 3] more')
-        assert result == "[1, 2, 3]"
-
-    def test_nested(self):
-        result = _extract_json_array('[{"a": [1, 2]}, {"b": 3}]')
-        assert result == '[{"a": [1, 2]}, {"b": 3}]'
-
-    def test_no_array(self):
-        assert _extract_json_array("no arrays here") is None
-
-
 class TestParseAssignments:
     def test_valid_json(self):
         raw = '[{"index": 0, "topic_slug": "ml"}]'
@@ -65,5 +55,141 @@ class TestParseAssignments:
         result = _parse_assignments(raw)
         assert len(result) == 1
 
+    def test_nested_with_trailing_text(self):
+        raw = 'Result: [{"index": 0, "tags": [1, 2]}] and [3]'
+        assert _parse_assignments(raw) == [{"index": 0, "tags": [1, 2]}]
+
+    def test_brackets_inside_strings(self):
+        raw = 'x [{"index": 0, "new_topic": "]\\"["}] y'
+        assert _parse_assignments(raw) == [{"index": 0, "new_topic": ']"['}]
+
     def test_invalid(self):
         assert _parse_assignments("not json") == []
+
+    def test_bytes_input(self):
+        raw = b'[{"index": 0, "topic_slug": "ml"}]'
+        assert _parse_assignments(raw) == [{"index": 0, "topic_slug": "ml"}]
+
+    def test_bytes_code_fenced(self):
+        raw = '```json\n[{"index": 0, "new_topic": "Café"}]\n```'.encode()
+        result = _parse_assignments(raw)
+        assert result[0]["new_topic"] == "Café"
+
+
+class TestHandleAggregate:
+    def _client(self, entries, index, llm_output):
+        client = AsyncMock()
+        client.parse_buffer.return_value = entries
+        client.load_topic_index.return_value = index
+        client.llm_chat.return_value = llm_output
+        client.add_topic.side_effect = lambda name, slug: {
+            "id": 99, "name": name, "slug": slug,
+        }
+        return client
+
+    async def test_routes_to_new_topic_without_reloading_index(self):
+        entries = [
+            {"time": "t0", "source": "note", "text": "gradient descent"},
+            {"time": "t1", "source": "note", "text": "sourdough"},
+        ]
+        index = [{"id": 1, "name": "ML", "slug": "ml", "created": ""}]
+        llm = json.dumps([
+            {"index": 0, "topic_slug": "ml"},
+            {"index": 1, "new_topic": "Baking"},
+        ])
+        client = self._client(entries, index, llm)
+        await handle_aggregate(client, None)
+
+        client.load_topic_index.assert_awaited_once()
+        client.add_topic.assert_awaited_once_with("Baking", "baking")
+        appended = {c.args[0]: c.args[1] for c in client.append_to_topic_buffer.await_args_list}
+        assert appended == {"ml": [entries[0]], "baking": [entries[1]]}
+        client.clear_buffer.assert_awaited_once()
+        assert "across 2 topics (1 new)" in client.respond_text.await_args.args[1]
+
+    async def test_unrouted_entries_stay_in_buffer(self):
+        entries = [
+            {"time": "t0", "source": "note", "text": "a"},
+            {"time": "t1", "source": "note", "text": "b"},
+            {"time": "t2", "source": "note", "text": "c"},
+        ]
+        index = [{"id": 1, "name": "ML", "slug": "ml", "created": ""}]
+        llm = json.dumps([
+            {"index": 0, "topic_slug": "__skip__"},
+            {"index": 2, "topic_slug": "ml"},
+        ])
+        client = self._client(entries, index, llm)
+        await handle_aggregate(client, None)
+
+        client._service_request.assert_awaited_once_with(
+            "storage", "write_buffer", {"entries": [entries[1]]},
+        )
+        client.clear_buffer.assert_not_awaited()
+
+    async def test_large_buffer_is_classified_in_batches(self):
+        entries = [
+            {"time": f"t{i}", "source": "note", "text": f"entry {i}"}
+            for i in range(CLASSIFY_BATCH_SIZE + 5)
+        ]
+        index = [{"id": 1, "name": "ML", "slug": "ml", "created": ""}]
+        llm = json.dumps([{"index": 0, "topic_slug": "ml"}])
+        client = self._client(entries, index, llm)
+        await handle_aggregate(client, None)
+
+        assert client.llm_chat.await_count == 2
+        client.append_to_topic_buffer.assert_awaited_once_with(
+            "ml", [entries[0], entries[CLASSIFY_BATCH_SIZE]],
+        )
+
+    async def test_new_topic_created_once_per_slug(self):
+        entries = [
+            {"time": "t0", "source": "note", "text": "a"},
+            {"time": "t1", "source": "note", "text": "b"},
+        ]
+        llm = json.dumps([
+            {"index": 0, "new_topic": "Baking"},
+            {"index": 1, "new_topic": "baking!"},
+            {"index": 7, "new_topic": "Orphan"},
+        ])
+        client = self._client(entries, [], llm)
+        await handle_aggregate(client, None)
+
+        client.add_topic.assert_awaited_once_with("Baking", "baking")
+        client.append_to_topic_buffer.assert_awaited_once_with("baking", entries)
+
+    async def test_proposals_merged_before_routing(self):
+        entries = [{"time": f"t{i}", "source": "note", "text": str(i)} for i in range(4)]
+        index = [{"id": 1, "name": "ML", "slug": "ml", "created": ""}]
+        llm = json.dumps([
+            {"index": 0, "topic_slug": "baking"},  # before the proposal below
+            {"index": 1, "new_topic": "Baking"},
+            {"index": 2, "new_topic": "BAKING"},
+            {"index": 3, "new_topic": "ML"},  # slug of an existing topic
+        ])
+        client = self._client(entries, index, llm)
+        await handle_aggregate(client, None)
+
+        client.add_topic.assert_awaited_once_with("Baking", "baking")
+        appended = {c.args[0]: c.args[1] for c in client.append_to_topic_buffer.await_args_list}
+        assert appended == {"baking": entries[:3], "ml": [entries[3]]}
+
+    async def test_classification_concurrency_is_capped(self, monkeypatch):
+        monkeypatch.setattr(aggregate, "CLASSIFY_CONCURRENCY", 2)
+        entries = [
+            {"time": f"t{i}", "source": "note", "text": f"entry {i}"}
+            for i in range(CLASSIFY_BATCH_SIZE * 5)
+        ]
+        running = peak = 0
+
+        async def llm_chat(prompt, command):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return "[]"
+
+        client = self._client(entries, [], "[]")
+        client.llm_chat.side_effect = llm_chat
+        await handle_aggregate(client, None)
+        assert peak == 2
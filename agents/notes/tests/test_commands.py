@@ -41,6 +41,9 @@ class FakeBrokerClient:
     async def parse_buffer(self):
         return []
 
+    async def tail_buffer(self, count, source=None):
+        return []
+
     async def clear_buffer(self):
         return True
 
@@ -56,6 +59,9 @@ class FakeBrokerClient:
     async def load_topic_buffer(self, slug):
         return []
 
+    async def load_topic_buffers(self, slugs):
+        return [[] for _ in slugs]
+
     async def append_to_topic_buffer(self, slug, entries):
         return True
 
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+from unittest.mock import AsyncMock
+
 import pytest
 
 from mist_client.protocol import Message, MSG_COMMAND, MSG_RESPONSE, RESP_TEXT, RESP_LIST
 
-from notes_agent.notes import _format_entries, handle_note, handle_notes, handle_topics
+from notes_agent.notes import (
+    _format_entries, handle_note, handle_notes, handle_topic_view, handle_topics,
+)
 
 
 class FakeClient:
@@ -25,6 +29,10 @@ class FakeClient:
     async def parse_buffer(self):
         return self._buffer
 
+    async def tail_buffer(self, count, source=None):
+        entries = [e for e in self._buffer if source is None or e["source"] == source]
+        return entries[-count:]
+
     async def load_topic_index(self):
         return []
 
@@ -90,6 +98,16 @@ class TestHandleNotes:
         # Terminal entries should be excluded
         assert "not a note" not in text
 
+    async def test_keeps_last_count_in_order(self):
+        client = FakeClient()
+        client._buffer = [
+            {"time": f"t{i}", "source": "note", "text": f"note {i}"} for i in range(5)
+        ]
+        msg = _cmd()
+        await handle_notes(client, msg, count=2)
+        text = client.sent[0].payload["content"]["text"]
+        assert text == "[t3] note 3\n[t4] note 4"
+
 
 class TestHandleTopics:
     async def test_empty(self):
@@ -97,3 +115,21 @@ class TestHandleTopics:
         msg = _cmd()
         await handle_topics(client, msg)
         assert "No topics" in client.sent[0].payload["content"]["text"]
+
+
+class TestHandleTopicView:
+    async def test_returns_topic_detail(self):
+        client = AsyncMock()
+        client.find_topic.return_value = {"id": 1, "slug": "ml", "name": "ML"}
+        client.load_topic_synthesis.return_value = "summary"
+        client.list_topic_notes.return_value = ["a.md"]
+        client.load_topic_buffer.return_value = [{"time": "t", "source": "s", "text": "x"}]
+        msg = _cmd()
+        await handle_topic_view(client, msg, "ml")
+        client._send_response.assert_awaited_once_with(msg, "topic_detail", {
+            "slug": "ml",
+            "name": "ML",
+            "synthesis": "summary",
+            "notes": ["a.md"],
+            "buffer_count": 1,
+        })
@@ -4,19 +4,38 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from mist_client import AgentBase
 
 from .commands import dispatch
 from .manifest import MANIFEST
 
+try:  # optional: pip install science-agent[fast]
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Threads for blocking arXiv/S2 calls, which spend their time waiting on
+# the network rather than the CPU.
+IO_WORKERS = 32
+
 
 class ScienceAgent(AgentBase):
     """Science agent for searching and managing scientific articles."""
 
+    # Commands are independent network lookups; let them overlap.
+    max_concurrent_commands = 16
+
     def manifest(self) -> dict:
         return MANIFEST
 
+    async def run(self) -> None:
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="science-io"),
+        )
+        await super().run()
+
     async def handle_command(self, msg) -> None:
         await dispatch(self.client, msg)
 
@@ -27,4 +46,7 @@ def main() -> None:
         format="%(asctime)s %(levelname)s %(name)s: %(message)s",
     )
     agent = ScienceAgent()
-    asyncio.run(agent.run())
+    if uvloop is not None:
+        uvloop.run(agent.run())
+    else:
+        asyncio.run(agent.run())
@@ -0,0 +1,59 @@
+"""In-process cache for parsed API responses."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+# Search results go stale; single-paper lookups effectively never do.
+SEARCH_TTL = 3600.0
+
+
+def _copy(value: Any) -> Any:
+    """Copy the lists and dicts of a parsed (JSON-shaped) response."""
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    return value
+
+
+class ResponseCache:
+    """URL-keyed LRU cache with optional per-entry TTL. Thread-safe.
+
+    The API clients run on worker threads, so every access takes the
+    lock. Values are copied in and out, so callers may mutate results
+    without changing what later hits see.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self._max_entries = max_entries
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for *key*, or None if absent or expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+        return _copy(value)
+
+    def put(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store *value*; it expires after *ttl* seconds if given."""
+        expires = time.monotonic() + ttl if ttl is not None else float("inf")
+        value = _copy(value)
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
@@ -0,0 +1,107 @@
+"""Keep-alive HTTP shared by the API clients, stdlib only.
+
+Requests that must go through a proxy (``HTTP(S)_PROXY``, minus
+``NO_PROXY`` hosts) are handed to urllib instead, which handles proxies.
+"""
+
+import http.client
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+
+_HEADERS = {"User-Agent": "MIST/0.1"}
+_MAX_REDIRECTS = 5
+
+# One connection per (thread, host): the clients run on worker threads
+# and http.client connections are not thread-safe.
+_local = threading.local()
+
+
+def _connection(scheme: str, host: str, timeout: float) -> http.client.HTTPConnection:
+    pool = _local.__dict__.setdefault("pool", {})
+    conn = pool.get((scheme, host))
+    if conn is None:
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = pool[(scheme, host)] = cls(host, timeout=timeout)
+    conn.timeout = timeout  # for the next connect
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    return conn
+
+
+def _uses_proxy(parts: urllib.parse.SplitResult) -> bool:
+    """True if urllib would route this URL through a configured proxy."""
+    if not urllib.request.getproxies().get(parts.scheme):
+        return False
+    return not urllib.request.proxy_bypass(parts.hostname or "")
+
+
+def _send_urllib(
+    method: str, url: str, body: bytes | None, headers: dict, timeout: float,
+) -> tuple[http.client.HTTPResponse, bytes]:
+    """Proxied fallback: a one-off urlopen (which follows redirects itself)."""
+    req = urllib.request.Request(url, data=body, headers=headers, method=method)
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return resp, resp.read()
+
+
+def _drop(scheme: str, host: str) -> None:
+    conn = _local.__dict__.get("pool", {}).pop((scheme, host), None)
+    if conn is not None:
+        conn.close()
+
+
+def _send(
+    method: str, url: str, body: bytes | None, headers: dict, timeout: float,
+) -> tuple[http.client.HTTPResponse, bytes]:
+    """One request/response on this thread's connection to *url*'s host."""
+    parts = urllib.parse.urlsplit(url)
+    if _uses_proxy(parts):
+        return _send_urllib(method, url, body, headers, timeout)
+    target = parts.path or "/"
+    if parts.query:
+        target += "?" + parts.query
+    # A pooled connection may have been closed by the server while
+    # idle; retry once on a fresh one.
+    for attempt in range(2):
+        conn = _connection(parts.scheme, parts.netloc, timeout)
+        try:
+            conn.request(method, target, body=body, headers=headers)
+            resp = conn.getresponse()
+            data = resp.read()
+            break
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            _drop(parts.scheme, parts.netloc)
+            if attempt:
+                raise
+        except Exception:
+            _drop(parts.scheme, parts.netloc)
+            raise
+    if resp.will_close:
+        _drop(parts.scheme, parts.netloc)
+    if resp.status >= 400:
+        raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+    return resp, data
+
+
+def get(url: str, timeout: float = 15) -> bytes:
+    """GET *url* and return the body, reusing this thread's connection.
+
+    Follows redirects and raises ``urllib.error.HTTPError`` on 4xx/5xx,
+    like ``urllib.request.urlopen``.
+    """
+    for _ in range(_MAX_REDIRECTS + 1):
+        resp, data = _send("GET", url, None, _HEADERS, timeout)
+        location = resp.getheader("Location")
+        if resp.status in (301, 302, 303, 307, 308) and location:
+            url = urllib.parse.urljoin(url, location)
+            continue
+        return data
+    raise urllib.error.HTTPError(url, resp.status, "Too many redirects", resp.headers, None)
+
+
+def post_json(url: str, body: bytes, timeout: float = 15) -> bytes:
+    """POST a JSON *body* to *url* and return the response body."""
+    headers = {**_HEADERS, "Content-Type": "application/json"}
+    return _send("POST", url, body, headers, timeout)[1]
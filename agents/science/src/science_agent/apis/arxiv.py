@@ -1,35 +1,52 @@
 """arXiv API client using stdlib only."""
 
-import urllib.request
 import urllib.parse
 import xml.etree.ElementTree as ET
 
+from . import _http
+from ._cache import SEARCH_TTL, ResponseCache
+
 _BASE_URL = "https://export.arxiv.org/api/query"
-_NS = {"atom": "http://www.w3.org/2005/Atom"}
+_ATOM = "{http://www.w3.org/2005/Atom}"  # Clark-notation prefix of Atom tags
+
+_ENTRY_TAG = _ATOM + "entry"
+_NAME_TAG = _ATOM + "name"
+_FEED_CHUNK = 64 * 1024  # bytes fed to the parser at a time
+
+# Parsed responses by request URL.
+_cache = ResponseCache()
 
 
 def _parse_entry(entry: ET.Element) -> dict:
     """Parse a single Atom entry into a normalized dict."""
-    title_el = entry.find("atom:title", _NS)
-    title = (title_el.text or "").strip().replace("\n", " ") if title_el is not None else ""
-
+    title = abstract = source_url = pdf_url = ""
     authors = []
-    for author in entry.findall("atom:author", _NS):
-        name_el = author.find("atom:name", _NS)
-        if name_el is not None and name_el.text:
-            authors.append(name_el.text.strip())
-
-    abstract_el = entry.find("atom:summary", _NS)
-    abstract = (abstract_el.text or "").strip() if abstract_el is not None else ""
-
-    published_el = entry.find("atom:published", _NS)
     year = None
-    if published_el is not None and published_el.text:
-        year = int(published_el.text[:4])
+
+    # One pass over the children instead of a namespaced find() per field.
+    for child in entry:
+        tag = child.tag
+        if not tag.startswith(_ATOM):
+            continue  # e.g. arxiv:comment, arxiv:primary_category
+        match tag[len(_ATOM):]:
+            case "title":
+                title = (child.text or "").strip().replace("\n", " ")
+            case "author":
+                name_el = child.find(_NAME_TAG)
+                if name_el is not None and name_el.text:
+                    authors.append(name_el.text.strip())
+            case "summary":
+                abstract = (child.text or "").strip()
+            case "published":
+                if child.text and not year:
+                    year = int(child.text[:4])
+            case "id":
+                source_url = (child.text or "").strip()
+            case "link":
+                if not pdf_url and child.get("title") == "pdf":
+                    pdf_url = child.get("href", "")
 
     # Extract arXiv ID from the entry id URL
-    id_el = entry.find("atom:id", _NS)
-    source_url = (id_el.text or "").strip() if id_el is not None else ""
     arxiv_id = ""
     if source_url:
         # URL format: http://arxiv.org/abs/XXXX.XXXXX[vN]
@@ -37,13 +54,6 @@ def _parse_entry(entry: ET.Element) -> dict:
         if len(parts) == 2:
             arxiv_id = parts[1]
 
-    # PDF link
-    pdf_url = ""
-    for link in entry.findall("atom:link", _NS):
-        if link.get("title") == "pdf":
-            pdf_url = link.get("href", "")
-            break
-
     return {
         "title": title,
         "authors": authors,
@@ -55,6 +65,25 @@ def _parse_entry(entry: ET.Element) -> dict:
     }
 
 
+def _parse_feed(data: bytes) -> list[dict]:
+    """Parse every Atom entry in a feed response.
+
+    Fed to a pull parser in chunks; each entry is converted and cleared as
+    soon as it closes, so the feed is never held as a full tree.
+    """
+    parser = ET.XMLPullParser(("end",))
+    view = memoryview(data)
+    results = []
+    for start in range(0, len(view), _FEED_CHUNK):
+        parser.feed(view[start:start + _FEED_CHUNK])
+        for _, el in parser.read_events():
+            if el.tag == _ENTRY_TAG:
+                results.append(_parse_entry(el))
+                el.clear()
+    parser.close()
+    return results
+
+
 def search(
     query: str = "",
     *,
@@ -92,12 +121,12 @@ def search(
         "sortOrder": "descending",
     })
     url = f"{_BASE_URL}?{params}"
-    req = urllib.request.Request(url, headers={"User-Agent": "MIST/0.1"})
-    with urllib.request.urlopen(req, timeout=15) as resp:
-        data = resp.read()
-    root = ET.fromstring(data)
-    entries = root.findall("atom:entry", _NS)
-    return [_parse_entry(e) for e in entries]
+    cached = _cache.get(url)
+    if cached is not None:
+        return cached
+    results = _parse_feed(_http.get(url, timeout=15))
+    _cache.put(url, results, ttl=SEARCH_TTL)
+    return results
 
 
 def fetch_paper(arxiv_id: str) -> dict | None:
@@ -107,11 +136,12 @@ def fetch_paper(arxiv_id: str) -> dict | None:
         "max_results": 1,
     })
     url = f"{_BASE_URL}?{params}"
-    req = urllib.request.Request(url, headers={"User-Agent": "MIST/0.1"})
-    with urllib.request.urlopen(req, timeout=15) as resp:
-        data = resp.read()
-    root = ET.fromstring(data)
-    entries = root.findall("atom:entry", _NS)
+    cached = _cache.get(url)
+    if cached is not None:
+        return cached
+    entries = _parse_feed(_http.get(url, timeout=15))
     if not entries:
         return None
-    return _parse_entry(entries[0])
+    paper = entries[0]
+    _cache.put(url, paper)
+    return paper
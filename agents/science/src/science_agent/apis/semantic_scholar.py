@@ -1,36 +1,49 @@
 """Semantic Scholar API client using stdlib only."""
 
 import json
-import urllib.request
+import urllib.error
 import urllib.parse
+from operator import itemgetter
+
+try:  # optional: pip install science-agent[fast]
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+from . import _http
+from ._cache import SEARCH_TTL, ResponseCache
 
 _BASE_URL = "https://api.semanticscholar.org/graph/v1"
 _FIELDS = "title,authors,abstract,year,externalIds,url,openAccessPdf"
+_FIELDS_PARAM = urllib.parse.urlencode({"fields": _FIELDS})  # same on every search
+_BATCH_SIZE = 500  # /paper/batch limit
 
+# Parsed responses by request URL.
+_cache = ResponseCache()
 
-def _normalize(paper: dict) -> dict:
-    """Normalize an S2 paper response into a standard dict."""
-    authors = []
-    for a in paper.get("authors") or []:
-        name = a.get("name", "")
-        if name:
-            authors.append(name)
 
-    ext_ids = paper.get("externalIds") or {}
-    arxiv_id = ext_ids.get("ArXiv", "")
+# Response keys _normalize reads, with the value used when S2 omits one.
+_PAPER_DEFAULTS = {
+    "title": None, "authors": None, "abstract": None, "year": None,
+    "paperId": "", "externalIds": None, "url": "", "openAccessPdf": None,
+}
+_paper_fields = itemgetter(*_PAPER_DEFAULTS)
 
-    pdf_info = paper.get("openAccessPdf") or {}
-    pdf_url = pdf_info.get("url", "")
 
+def _normalize(paper: dict) -> dict:
+    """Normalize an S2 paper response into a standard dict."""
+    title, authors, abstract, year, paper_id, ext_ids, url, pdf_info = (
+        _paper_fields(_PAPER_DEFAULTS | paper)
+    )
     return {
-        "title": (paper.get("title") or "").strip(),
-        "authors": authors,
-        "abstract": (paper.get("abstract") or "").strip(),
-        "year": paper.get("year"),
-        "s2_id": paper.get("paperId", ""),
-        "arxiv_id": arxiv_id,
-        "source_url": paper.get("url", ""),
-        "pdf_url": pdf_url,
+        "title": (title or "").strip(),
+        "authors": [name for a in authors or () if (name := a.get("name"))],
+        "abstract": (abstract or "").strip(),
+        "year": year,
+        "s2_id": paper_id,
+        "arxiv_id": (ext_ids or {}).get("ArXiv", ""),
+        "source_url": url,
+        "pdf_url": (pdf_info or {}).get("url", ""),
     }
 
 
@@ -50,25 +63,31 @@ def search(
     *open_access*: restrict to open-access papers.
     *fields_of_study*: e.g. ``"Computer Science"``.
     """
-    params: dict[str, str | int] = {
-        "query": query or "",
-        "limit": limit,
-        "fields": _FIELDS,
-    }
+    quote = urllib.parse.quote_plus
+    params = [f"query={quote(query or '')}", f"limit={limit}", _FIELDS_PARAM]
     if year:
-        params["year"] = year
+        params.append(f"year={quote(year)}")
     if min_citations > 0:
-        params["minCitationCount"] = min_citations
+        params.append(f"minCitationCount={min_citations}")
     if open_access:
-        params["openAccessPdf"] = "true"
+        params.append("openAccessPdf=true")
     if fields_of_study:
-        params["fieldsOfStudy"] = fields_of_study
-    url = f"{_BASE_URL}/paper/search?{urllib.parse.urlencode(params)}"
-    req = urllib.request.Request(url, headers={"User-Agent": "MIST/0.1"})
-    with urllib.request.urlopen(req, timeout=15) as resp:
-        data = json.loads(resp.read())
+        params.append(f"fieldsOfStudy={quote(fields_of_study)}")
+    url = f"{_BASE_URL}/paper/search?{'&'.join(params)}"
+    cached = _cache.get(url)
+    if cached is not None:
+        return cached
+    data = _loads(_http.get(url, timeout=15))
     papers = data.get("data") or []
-    return [_normalize(p) for p in papers]
+    results = [_normalize(p) for p in papers]
+    _cache.put(url, results, ttl=SEARCH_TTL)
+    return results
+
+
+def _paper_url(paper_id: str) -> str:
+    """Single-paper URL; also the cache key for that paper."""
+    encoded = urllib.parse.quote(paper_id, safe=":")
+    return f"{_BASE_URL}/paper/{encoded}?fields={_FIELDS}"
 
 
 def fetch_paper(paper_id: str) -> dict | None:
@@ -77,14 +96,37 @@ def fetch_paper(paper_id: str) -> dict | None:
     For arXiv IDs, prefix with ``ARXIV:``.  For DOIs, prefix with ``DOI:``.
     Plain strings are treated as S2 paper IDs.
     """
-    encoded = urllib.parse.quote(paper_id, safe=":")
-    url = f"{_BASE_URL}/paper/{encoded}?fields={_FIELDS}"
-    req = urllib.request.Request(url, headers={"User-Agent": "MIST/0.1"})
+    url = _paper_url(paper_id)
+    cached = _cache.get(url)
+    if cached is not None:
+        return cached
     try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read())
+        data = _loads(_http.get(url, timeout=15))
     except urllib.error.HTTPError as exc:
         if exc.code == 404:
             return None
         raise
-    return _normalize(data)
+    paper = _normalize(data)
+    _cache.put(url, paper)
+    return paper
+
+
+def fetch_papers(paper_ids: list[str]) -> list[dict | None]:
+    """Fetch several papers with one ``/paper/batch`` request per 500 IDs.
+
+    IDs take the same prefixes as `fetch_paper`. Returns one result per
+    ID, in order, with None for papers S2 does not know.
+    """
+    results: list[dict | None] = [_cache.get(_paper_url(pid)) for pid in paper_ids]
+    missing = [i for i, paper in enumerate(results) if paper is None]
+    for start in range(0, len(missing), _BATCH_SIZE):
+        chunk = missing[start:start + _BATCH_SIZE]
+        body = json.dumps({"ids": [paper_ids[i] for i in chunk]}).encode()
+        data = _loads(_http.post_json(
+            f"{_BASE_URL}/paper/batch?fields={_FIELDS}", body, timeout=30,
+        ))
+        for i, raw in zip(chunk, data):
+            if raw:
+                results[i] = paper = _normalize(raw)
+                _cache.put(_paper_url(paper_ids[i]), paper)
+    return results
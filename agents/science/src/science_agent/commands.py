@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import re
 
 from mist_client import BrokerClient
 from mist_client.protocol import Message
@@ -10,26 +12,53 @@ from mist_client.protocol import Message
 from .apis import arxiv, semantic_scholar
 
 
+def _in_thread(func, /, *args, **kwargs) -> asyncio.Future:
+    """Run blocking *func* on the default executor.
+
+    Like ``asyncio.to_thread`` minus the per-call context copy; the API
+    clients read no context variables.
+    """
+    if kwargs:
+        func = functools.partial(func, *args, **kwargs)
+        args = ()
+    return asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+# Identifier shapes, checked in order by _detect_identifier.
+_ARXIV_URL_RE = re.compile(r"arxiv\.org.*?/(?:abs|pdf)/(.*)")
+_ARXIV_ID_RE = re.compile(r"[0-9]{4}\.[0-9A-Za-z/-]*")
+_S2_ID_RE = re.compile(r"[0-9a-fA-F]{40}")
+
+
 def _detect_identifier(raw: str) -> tuple[str, str]:
     """Detect identifier type: ("arxiv"|"doi"|"s2"|"unknown", value)."""
     raw = raw.strip()
-    if "arxiv.org" in raw:
-        for prefix in ("/abs/", "/pdf/"):
-            if prefix in raw:
-                aid = raw.split(prefix)[-1].rstrip("/").replace(".pdf", "")
-                return ("arxiv", aid)
-    if raw.replace(".", "").replace("/", "").replace("-", "").isalnum():
-        parts = raw.split(".")
-        if len(parts) == 2 and parts[0].isdigit() and len(parts[0]) == 4:
-            return ("arxiv", raw)
+    m = _ARXIV_URL_RE.search(raw)
+    if m:
+        return ("arxiv", m[1].rstrip("/").replace(".pdf", ""))
+    if _ARXIV_ID_RE.fullmatch(raw):
+        return ("arxiv", raw)
     if raw.startswith("10.") or raw.lower().startswith("doi:"):
         doi = raw.removeprefix("doi:").removeprefix("DOI:").strip()
         return ("doi", doi)
-    if len(raw) == 40 and all(c in "0123456789abcdef" for c in raw.lower()):
+    if _S2_ID_RE.fullmatch(raw):
         return ("s2", raw)
     return ("unknown", raw)
 
 
+# Search flag -> key in the flags dict. "--oa" is the only bare switch;
+# the rest take the next token as their value.
+_SEARCH_FLAGS = {
+    "--author": "author", "--au": "author",
+    "--title": "title", "--ti": "title",
+    "--year": "year",
+    "--cat": "cat",
+    "--citations": "citations", "--cite": "citations",
+    "--source": "source",
+    "--oa": "oa",
+}
+
+
 def _parse_search_flags(arg: str) -> dict:
     """Parse search flags from command text."""
     tokens = arg.split()
@@ -38,27 +67,26 @@ def _parse_search_flags(arg: str) -> dict:
         "cat": "", "citations": 0, "oa": False, "source": "both",
     }
     query_parts: list[str] = []
+    last = len(tokens) - 1
     i = 0
-    while i < len(tokens):
+    while i <= last:
         tok = tokens[i]
-        if tok in ("--author", "--au") and i + 1 < len(tokens):
-            flags["author"] = tokens[i + 1]; i += 2
-        elif tok in ("--title", "--ti") and i + 1 < len(tokens):
-            flags["title"] = tokens[i + 1]; i += 2
-        elif tok == "--year" and i + 1 < len(tokens):
-            flags["year"] = tokens[i + 1]; i += 2
-        elif tok == "--cat" and i + 1 < len(tokens):
-            flags["cat"] = tokens[i + 1]; i += 2
-        elif tok in ("--citations", "--cite") and i + 1 < len(tokens):
-            try: flags["citations"] = int(tokens[i + 1])
-            except ValueError: pass
-            i += 2
-        elif tok == "--oa":
-            flags["oa"] = True; i += 1
-        elif tok == "--source" and i + 1 < len(tokens):
-            flags["source"] = tokens[i + 1].lower(); i += 2
+        key = _SEARCH_FLAGS.get(tok)
+        if key == "oa":
+            flags["oa"] = True
+        elif key is None or i == last:  # plain word, or a flag missing its value
+            query_parts.append(tok)
         else:
-            query_parts.append(tok); i += 1
+            i += 1
+            value = tokens[i]
+            if key == "citations":
+                try: flags["citations"] = int(value)
+                except ValueError: pass
+            elif key == "source":
+                flags["source"] = value.lower()
+            else:
+                flags[key] = value
+        i += 1
     flags["query"] = " ".join(query_parts)
     return flags
 
@@ -100,6 +128,12 @@ async def dispatch(client: BrokerClient, msg: Message) -> None:
             await client.respond_error(msg, f"Unknown command: {command}")
 
 
+def _short_authors(authors: list[str], limit: int) -> str:
+    """First *limit* author names, with "et al." if there are more."""
+    shown = ", ".join(authors[:limit])
+    return f"{shown} et al." if len(authors) > limit else shown
+
+
 async def _handle_search(client: BrokerClient, msg: Message, query: str) -> None:
     """Search arXiv and Semantic Scholar."""
     if not query:
@@ -110,104 +144,131 @@ async def _handle_search(client: BrokerClient, msg: Message, query: str) -> None
     base_query = flags["query"]
     source = flags["source"]
 
-    results = []
-
+    # Each source is a blocking HTTP call; run them side by side.
+    searches = []
     if source in ("both", "arxiv"):
-        try:
-            arxiv_results = await asyncio.to_thread(
-                arxiv.search,
-                base_query,
-                author=flags["author"],
-                title=flags["title"],
-                category=flags["cat"],
-                max_results=5,
-            )
-            for paper in arxiv_results:
-                results.append({**paper, "_source": "arXiv"})
-        except Exception as exc:
-            results.append({"title": f"arXiv error: {exc}", "authors": [], "_source": "arXiv"})
-
+        searches.append(("arXiv", _in_thread(
+            arxiv.search,
+            base_query,
+            author=flags["author"],
+            title=flags["title"],
+            category=flags["cat"],
+            max_results=5,
+        )))
     if source in ("both", "s2"):
-        try:
-            s2_results = await asyncio.to_thread(
-                semantic_scholar.search,
-                base_query,
-                year=flags["year"],
-                min_citations=flags["citations"],
-                open_access=flags["oa"],
-                limit=5,
-            )
-            for paper in s2_results:
-                results.append({**paper, "_source": "S2"})
-        except Exception as exc:
-            results.append({"title": f"S2 error: {exc}", "authors": [], "_source": "S2"})
+        searches.append(("S2", _in_thread(
+            semantic_scholar.search,
+            base_query,
+            year=flags["year"],
+            min_citations=flags["citations"],
+            open_access=flags["oa"],
+            limit=5,
+        )))
+    outcomes = await asyncio.gather(*(c for _, c in searches), return_exceptions=True)
+
+    results = []
+    for (label, _), outcome in zip(searches, outcomes):
+        if isinstance(outcome, Exception):
+            results.append({"title": f"{label} error: {outcome}", "authors": [], "_source": label})
+        else:
+            results.extend({**paper, "_source": label} for paper in outcome)
 
     if not results:
         await client.respond_text(msg, "No results found.")
         return
 
     columns = ["#", "Source", "Title", "Authors", "Year"]
-    rows = []
-    for i, paper in enumerate(results, 1):
-        authors = ", ".join(paper.get("authors", [])[:3])
-        if len(paper.get("authors", [])) > 3:
-            authors += " et al."
-        rows.append([
+    rows = [
+        [
             str(i),
             paper.get("_source", ""),
             paper.get("title", ""),
-            authors,
+            _short_authors(paper.get("authors", []), 3),
             str(paper.get("year", "")),
-        ])
+        ]
+        for i, paper in enumerate(results, 1)
+    ]
 
     await client.respond_table(msg, columns, rows, title=f"Results for '{base_query or query}'")
 
 
+async def _fetch_s2(paper_ids: list[str]) -> list[dict | None]:
+    """Look up S2 IDs: a plain GET for one, a batch request for several."""
+    if len(paper_ids) == 1:
+        return [await _in_thread(semantic_scholar.fetch_paper, paper_ids[0])]
+    return await _in_thread(semantic_scholar.fetch_papers, paper_ids)
+
+
 async def _handle_import(client: BrokerClient, msg: Message, identifier: str) -> None:
-    """Import a paper by arXiv ID, DOI, or URL."""
-    if not identifier:
-        await client.respond_error(msg, "Usage: import <arxiv_id|doi|url>")
+    """Import papers by arXiv ID, DOI, or URL (whitespace-separated)."""
+    identifiers = identifier.split()
+    if not identifiers:
+        await client.respond_error(msg, "Usage: import <arxiv_id|doi|url> ...")
         return
 
-    id_type, value = _detect_identifier(identifier)
-    paper = None
+    detected = [_detect_identifier(i) for i in identifiers]
+    papers: list[dict | None] = [None] * len(detected)
+    errors: dict[int, BaseException] = {}
+
+    # arXiv first for arXiv-looking and unknown IDs; a failed lookup
+    # counts as not found and falls through to S2 ...
+    tried = [i for i, (t, _) in enumerate(detected) if t in ("arxiv", "unknown")]
+    found = await asyncio.gather(*(
+        _in_thread(arxiv.fetch_paper, detected[i][1]) for i in tried
+    ), return_exceptions=True)
+    for i, paper in zip(tried, found):
+        if isinstance(paper, BaseException):
+            errors[i] = paper
+        else:
+            papers[i] = paper
 
-    try:
+    # ... then everything still missing from S2, in one request.
+    s2_ids: dict[int, str] = {}
+    for i, (id_type, value) in enumerate(detected):
+        if papers[i] is not None:
+            continue
         if id_type == "arxiv":
-            paper = await asyncio.to_thread(arxiv.fetch_paper, value)
-            if paper is None:
-                paper = await asyncio.to_thread(
-                    semantic_scholar.fetch_paper, f"ARXIV:{value}",
-                )
+            s2_ids[i] = f"ARXIV:{value}"
         elif id_type == "doi":
-            paper = await asyncio.to_thread(
-                semantic_scholar.fetch_paper, f"DOI:{value}",
-            )
-        elif id_type == "s2":
-            paper = await asyncio.to_thread(semantic_scholar.fetch_paper, value)
+            s2_ids[i] = f"DOI:{value}"
         else:
-            paper = await asyncio.to_thread(arxiv.fetch_paper, value)
-            if paper is None:
-                paper = await asyncio.to_thread(semantic_scholar.fetch_paper, value)
-    except Exception as exc:
-        await client.respond_error(msg, f"Error fetching paper: {exc}")
-        return
-
-    if paper is None:
-        await client.respond_error(msg, f"Could not find paper: {identifier}")
+            s2_ids[i] = value
+    if s2_ids:
+        try:
+            found = await _fetch_s2(list(s2_ids.values()))
+        except Exception as exc:
+            found = [None] * len(s2_ids)
+            errors.update(dict.fromkeys(s2_ids, exc))
+        for i, paper in zip(s2_ids, found):
+            papers[i] = paper
+
+    misses = {
+        i: f"Error fetching paper {raw}: {errors[i]}" if i in errors
+        else f"Could not find paper: {raw}"
+        for i, (raw, paper) in enumerate(zip(identifiers, papers))
+        if paper is None
+    }
+    if len(misses) == len(papers):
+        await client.respond_error(msg, "\n".join(misses.values()))
         return
 
-    result = await client.create_article(
-        title=paper["title"],
-        authors=paper["authors"],
-        abstract=paper.get("abstract"),
-        year=paper.get("year"),
-        source_url=paper.get("source_url"),
-        arxiv_id=paper.get("arxiv_id"),
-        s2_id=paper.get("s2_id"),
-    )
-    article_id = result.get("article_id", "?")
-    await client.respond_text(msg, f"Imported article #{article_id}: {paper['title']}")
+    lines = []
+    for i, paper in enumerate(papers):
+        if paper is None:
+            lines.append(misses[i])
+            continue
+        result = await client.create_article(
+            title=paper["title"],
+            authors=paper["authors"],
+            abstract=paper.get("abstract"),
+            year=paper.get("year"),
+            source_url=paper.get("source_url"),
+            arxiv_id=paper.get("arxiv_id"),
+            s2_id=paper.get("s2_id"),
+        )
+        article_id = result.get("article_id", "?")
+        lines.append(f"Imported article #{article_id}: {paper['title']}")
+    await client.respond_text(msg, "\n".join(lines))
 
 
 async def _handle_articles(client: BrokerClient, msg: Message, tag: str) -> None:
@@ -219,19 +280,16 @@ async def _handle_articles(client: BrokerClient, msg: Message, tag: str) -> None
         return
 
     columns = ["ID", "Title", "Authors", "Year", "Tags"]
-    rows = []
-    for a in articles:
-        authors = ", ".join(a.get("authors", [])[:2])
-        if len(a.get("authors", [])) > 2:
-            authors += " et al."
-        tags = ", ".join(a.get("tags", []))
-        rows.append([
+    rows = [
+        [
             str(a.get("id", "")),
             a.get("title", ""),
-            authors,
+            _short_authors(a.get("authors", []), 2),
             str(a.get("year", "")),
-            tags,
-        ])
+            ", ".join(a.get("tags", [])),
+        ]
+        for a in articles
+    ]
     title = f"Articles (tag: {tag})" if tag else "Saved Articles"
     await client.respond_table(msg, columns, rows, title=title)
 
@@ -252,24 +310,23 @@ async def _handle_article(client: BrokerClient, msg: Message, article_id) -> Non
         await client.respond_error(msg, f"Article #{aid} not found.")
         return
 
+    get = article.get
     lines = [
         f"**{article['title']}**",
-        f"Authors: {', '.join(article.get('authors', []))}",
-        f"Year: {article.get('year', 'N/A')}",
+        f"Authors: {', '.join(get('authors', []))}",
+        f"Year: {get('year', 'N/A')}",
     ]
-    if article.get("arxiv_id"):
-        lines.append(f"arXiv: {article['arxiv_id']}")
-    if article.get("s2_id"):
-        lines.append(f"S2: {article['s2_id']}")
-    if article.get("source_url"):
-        lines.append(f"URL: {article['source_url']}")
-    tags = article.get("tags", [])
-    if tags:
+    if arxiv_id := get("arxiv_id"):
+        lines.append(f"arXiv: {arxiv_id}")
+    if s2_id := get("s2_id"):
+        lines.append(f"S2: {s2_id}")
+    if source_url := get("source_url"):
+        lines.append(f"URL: {source_url}")
+    if tags := get("tags"):
         lines.append(f"Tags: {', '.join(tags)}")
-    if article.get("abstract"):
-        abstract = article["abstract"][:500]
-        if len(article.get("abstract", "")) > 500:
-            abstract += "..."
+    if abstract := get("abstract"):
+        if len(abstract) > 500:
+            abstract = abstract[:500] + "..."
         lines.append(f"\n{abstract}")
 
     await client.respond_text(msg, "\n".join(lines), format="markdown")
@@ -6,7 +6,7 @@ MANIFEST = (
     ManifestBuilder("science")
     .description("Scientific article search and library management")
     .command("search", "Search arXiv and Semantic Scholar", args={"query": "str"})
-    .command("import", "Import a paper by ID or URL", args={"identifier": "str"})
+    .command("import", "Import papers by ID or URL", args={"identifier": "str"})
     .command("articles", "List saved articles", args={"tag": "str"})
     .command("article", "Show article details", args={"id": "int"})
     .command("tag", "Tag an article", args={"article_id": "int", "tag": "str"})
@@ -2,7 +2,17 @@
 
 from __future__ import annotations
 
-from science_agent.apis.arxiv import _parse_entry
+import json
+import threading
+import urllib.error
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from science_agent.apis import _http, arxiv, semantic_scholar
+from science_agent.apis._cache import ResponseCache
+from science_agent.apis.arxiv import _parse_entry, _parse_feed
 from science_agent.apis.semantic_scholar import _normalize
 
 
@@ -30,6 +40,38 @@ class TestArxivParseEntry:
         assert result["arxiv_id"] == "2301.12345v1"
         assert "abstract" in result
 
+    def test_ignores_non_atom_children(self):
+        import xml.etree.ElementTree as ET
+
+        xml_str = """
+        <entry xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+            <arxiv:title>Not this one</arxiv:title>
+            <title>Real Title</title>
+            <link rel="alternate" href="http://arxiv.org/abs/1"/>
+            <link title="pdf" href="http://arxiv.org/pdf/1"/>
+        </entry>
+        """
+        result = _parse_entry(ET.fromstring(xml_str))
+        assert result["title"] == "Real Title"
+        assert result["pdf_url"] == "http://arxiv.org/pdf/1"
+        assert result["year"] is None
+
+class TestArxivParseFeed:
+    def test_entries_in_order_across_chunks(self, monkeypatch):
+        monkeypatch.setattr(arxiv, "_FEED_CHUNK", 16)
+        feed = b"""<?xml version="1.0" encoding="UTF-8"?>
+        <feed xmlns="http://www.w3.org/2005/Atom">
+            <title>ArXiv Query</title>
+            <entry><id>http://arxiv.org/abs/1</id><title>One</title></entry>
+            <entry><id>http://arxiv.org/abs/2</id><title>Two \xc3\xa9</title></entry>
+        </feed>
+        """
+        papers = _parse_feed(feed)
+        assert [(p["arxiv_id"], p["title"]) for p in papers] == [("1", "One"), ("2", "Two \u00e9")]
+
+    def test_empty_feed(self):
+        assert _parse_feed(b'<feed xmlns="http://www.w3.org/2005/Atom"/>') == []
+
 
 class TestS2Normalize:
     def test_basic(self):
@@ -56,3 +98,143 @@ class TestS2Normalize:
         assert result["title"] == "Minimal"
         assert result["authors"] == []
         assert result["year"] is None
+
+    def test_null_fields(self):
+        paper = {
+            "paperId": "xyz", "title": None, "authors": [{"name": ""}, {"name": "Ann"}],
+            "externalIds": None, "openAccessPdf": None, "abstract": None,
+        }
+        result = _normalize(paper)
+        assert result["title"] == ""
+        assert result["authors"] == ["Ann"]
+        assert result["arxiv_id"] == ""
+        assert result["pdf_url"] == ""
+        assert result["source_url"] == ""
+
+
+class TestS2Search:
+    def test_query_string_matches_urlencode(self, monkeypatch):
+        urls = []
+        monkeypatch.setattr(_http, "get", lambda url, timeout: urls.append(url) or b"{}")
+        semantic_scholar._cache.clear()
+        semantic_scholar.search(
+            "graph nets & more", year="2020-2024", min_citations=5,
+            open_access=True, fields_of_study="Computer Science", limit=5,
+        )
+        expected = urllib.parse.urlencode({
+            "query": "graph nets & more", "limit": 5, "fields": semantic_scholar._FIELDS,
+            "year": "2020-2024", "minCitationCount": 5, "openAccessPdf": "true",
+            "fieldsOfStudy": "Computer Science",
+        })
+        assert urls == [f"{semantic_scholar._BASE_URL}/paper/search?{expected}"]
+
+
+class TestResponseCache:
+    def test_get_put_and_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", [1])
+        cache.put("b", [2])
+        assert cache.get("a") == [1]  # touches "a"
+        cache.put("c", [3])
+        assert cache.get("b") is None
+        assert cache.get("a") == [1]
+        assert cache.get("c") == [3]
+
+    def test_hits_are_independent_copies(self):
+        cache = ResponseCache()
+        paper = {"title": "T", "authors": ["A"]}
+        cache.put("u", [paper])
+        paper["authors"].append("later")
+        hit = cache.get("u")
+        hit[0]["authors"].append("X")
+        hit.append({})
+        assert cache.get("u") == [{"title": "T", "authors": ["A"]}]
+
+    def test_ttl_expiry(self):
+        cache = ResponseCache()
+        cache.put("a", "fresh", ttl=60)
+        cache.put("b", "stale", ttl=-1)
+        assert cache.get("a") == "fresh"
+        assert cache.get("b") is None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    ports: list[int] = []
+    posted: list[list[str]] = []
+
+    def do_GET(self):
+        self.ports.append(self.client_address[1])
+        if self.path == "/moved":
+            self.send_response(302)
+            self.send_header("Location", "/ok?x=1")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        # Via a proxy the request line carries the absolute URL.
+        status, body = (200, self.path.encode()) if "/ok" in self.path else (404, b"")
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        ids = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["ids"]
+        self.posted.append(ids)
+        body = json.dumps([
+            {"paperId": i, "title": i.upper()} if i != "nope" else None for i in ids
+        ]).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHttpGet:
+    @pytest.fixture
+    def base_url(self, monkeypatch):
+        for var in ("http_proxy", "HTTP_PROXY", "https_proxy", "HTTPS_PROXY", "no_proxy", "NO_PROXY"):
+            monkeypatch.delenv(var, raising=False)
+        _Handler.ports = []
+        _Handler.posted = []
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        yield f"http://127.0.0.1:{server.server_port}"
+        server.shutdown()
+        server.server_close()
+
+    def test_reuses_connection(self, base_url):
+        assert _http.get(f"{base_url}/ok?a=1") == b"/ok?a=1"
+        assert _http.get(f"{base_url}/ok") == b"/ok"
+        assert len(set(_Handler.ports)) == 1
+
+    def test_follows_redirect(self, base_url):
+        assert _http.get(f"{base_url}/moved") == b"/ok?x=1"
+
+    def test_proxy_from_environment(self, base_url, monkeypatch):
+        monkeypatch.setenv("http_proxy", base_url)
+        assert _http.get("http://papers.invalid/ok?q=1") == b"http://papers.invalid/ok?q=1"
+
+    def test_timeout_applies_to_open_connection(self, base_url):
+        _http.get(f"{base_url}/ok")
+        _http.get(f"{base_url}/ok", timeout=3)
+        host = base_url.removeprefix("http://")
+        assert _http._local.pool[("http", host)].sock.gettimeout() == 3
+
+    def test_http_error(self, base_url):
+        with pytest.raises(urllib.error.HTTPError) as exc:
+            _http.get(f"{base_url}/missing")
+        assert exc.value.code == 404
+
+    def test_fetch_papers_batches_uncached(self, base_url, monkeypatch):
+        monkeypatch.setattr(semantic_scholar, "_BASE_URL", base_url)
+        semantic_scholar._cache.clear()
+        assert [p and p["title"] for p in semantic_scholar.fetch_papers(["a", "nope"])] == [
+            "A", None,
+        ]
+        papers = semantic_scholar.fetch_papers(["a", "b"])
+        assert [p["title"] for p in papers] == ["A", "B"]
+        assert _Handler.posted == [["a", "nope"], ["b"]]  # "a" came from the cache
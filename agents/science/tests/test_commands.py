@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -21,6 +22,7 @@ from science_agent.commands import (
     _parse_search_flags,
     dispatch,
 )
+from science_agent.manifest import MANIFEST
 
 
 class FakeBrokerClient:
@@ -103,6 +105,13 @@ class TestDetectIdentifier:
     def test_arxiv_id(self):
         assert _detect_identifier("2301.12345") == ("arxiv", "2301.12345")
 
+    def test_arxiv_versioned_id_and_url(self):
+        assert _detect_identifier(" 2301.12345v2 ") == ("arxiv", "2301.12345v2")
+        assert _detect_identifier("https://arxiv.org/abs/2301.12345v2/") == (
+            "arxiv", "2301.12345v2",
+        )
+        assert _detect_identifier("230.12345")[0] == "unknown"
+
     def test_doi(self):
         assert _detect_identifier("10.1234/test")[0] == "doi"
 
@@ -112,6 +121,7 @@ class TestDetectIdentifier:
     def test_s2_id(self):
         hex40 = "a" * 40
         assert _detect_identifier(hex40) == ("s2", hex40)
+        assert _detect_identifier("g" * 40)[0] == "unknown"
 
     def test_unknown(self):
         assert _detect_identifier("some random text")[0] == "unknown"
@@ -136,6 +146,13 @@ class TestParseSearchFlags:
         flags = _parse_search_flags("test --source arxiv")
         assert flags["source"] == "arxiv"
 
+    def test_aliases_switches_and_dangling_flag(self):
+        flags = _parse_search_flags("--au Hinton --cite x --oa nets --ti")
+        assert flags["author"] == "Hinton"
+        assert flags["citations"] == 0
+        assert flags["oa"] is True
+        assert flags["query"] == "nets --ti"
+
 
 class TestSearchCommand:
     async def test_search_requires_query(self, client):
@@ -153,6 +170,26 @@ class TestSearchCommand:
         assert resp.payload["type"] == RESP_TABLE
         assert "Attention" in str(resp.payload["content"]["rows"])
 
+    async def test_search_queries_sources_concurrently(self, client):
+        msg = _cmd("search", args={"query": "transformers"})
+        barrier = threading.Barrier(2, timeout=2)
+
+        def arxiv_search(*args, **kwargs):
+            barrier.wait()  # only passes if S2 is in flight at the same time
+            return [{"title": "From arXiv", "authors": []}]
+
+        def s2_search(*args, **kwargs):
+            barrier.wait()
+            raise RuntimeError("rate limited")
+
+        with patch("science_agent.commands.arxiv.search", side_effect=arxiv_search):
+            with patch("science_agent.commands.semantic_scholar.search", side_effect=s2_search):
+                await dispatch(client, msg)
+        rows = client.sent[0].payload["content"]["rows"]
+        assert [r[1] for r in rows] == ["arXiv", "S2"]
+        assert rows[0][2] == "From arXiv"
+        assert "rate limited" in rows[1][2]
+
 
 class TestImportCommand:
     async def test_import_requires_id(self, client):
@@ -178,6 +215,46 @@ class TestImportCommand:
         resp = client.sent[0]
         assert resp.payload["type"] == RESP_ERROR
 
+    async def test_import_many_batches_s2_lookups(self, client):
+        msg = _cmd("import", text="2301.00001 10.1/x 2301.00002")
+        arxiv_hit = {"title": "A", "authors": [], "arxiv_id": "2301.00001"}
+        doi_hit = {"title": "D", "authors": []}
+        with patch(
+            "science_agent.commands.arxiv.fetch_paper",
+            side_effect=lambda aid: arxiv_hit if aid == "2301.00001" else None,
+        ), patch(
+            "science_agent.commands.semantic_scholar.fetch_papers",
+            return_value=[doi_hit, None],
+        ) as batch:
+            await dispatch(client, msg)
+        batch.assert_called_once_with(["DOI:10.1/x", "ARXIV:2301.00002"])
+        assert client.sent[0].payload["content"]["text"].splitlines() == [
+            "Imported article #1: A",
+            "Imported article #2: D",
+            "Could not find paper: 2301.00002",
+        ]
+
+    async def test_import_many_survives_one_failed_lookup(self, client):
+        msg = _cmd("import", text="2301.00001 2301.00002")
+        arxiv_hit = {"title": "A", "authors": [], "arxiv_id": "2301.00001"}
+
+        def fetch(aid):
+            if aid == "2301.00002":
+                raise OSError("unreachable")
+            return arxiv_hit
+
+        with patch("science_agent.commands.arxiv.fetch_paper", side_effect=fetch), patch(
+            "science_agent.commands.semantic_scholar.fetch_paper", return_value=None,
+        ) as s2:
+            await dispatch(client, msg)
+        s2.assert_called_once_with("ARXIV:2301.00002")
+        resp = client.sent[0]
+        assert resp.payload["type"] == RESP_TEXT
+        assert resp.payload["content"]["text"].splitlines() == [
+            "Imported article #1: A",
+            "Error fetching paper 2301.00002: unreachable",
+        ]
+
 
 class TestArticlesCommand:
     async def test_articles_empty(self, client):
@@ -185,6 +262,12 @@ class TestArticlesCommand:
         await dispatch(client, msg)
         assert "No saved" in client.sent[0].payload["content"]["text"]
 
+    async def test_articles_table(self, client):
+        await client.create_article("Paper", ["A", "B", "C"], year=2024, tags=["ml"])
+        await dispatch(client, _cmd("articles"))
+        content = client.sent[0].payload["content"]
+        assert content["rows"] == [["1", "Paper", "A, B et al.", "2024", "ml"]]
+
 
 class TestArticleCommand:
     async def test_article_not_found(self, client):
@@ -192,6 +275,14 @@ class TestArticleCommand:
         await dispatch(client, msg)
         assert client.sent[0].payload["type"] == RESP_ERROR
 
+    async def test_article_details(self, client):
+        await client.create_article("Paper", ["A"], arxiv_id="2301.1", abstract="x" * 600)
+        await dispatch(client, _cmd("article", args={"id": 1}))
+        text = client.sent[0].payload["content"]["text"]
+        assert "arXiv: 2301.1" in text
+        assert "S2:" not in text
+        assert text.endswith("x" * 500 + "...")
+
     async def test_article_invalid_id(self, client):
         msg = _cmd("article", text="abc")
         await dispatch(client, msg)
@@ -210,3 +301,9 @@ class TestUnknownCommand:
         msg = _cmd("foobar")
         await dispatch(client, msg)
         assert client.sent[0].payload["type"] == RESP_ERROR
+
+    @pytest.mark.parametrize("command", [c["name"] for c in MANIFEST["commands"]])
+    async def test_every_manifest_command_is_dispatched(self, client, command):
+        await dispatch(client, _cmd(command))
+        content = client.sent[-1].payload["content"]
+        assert not content.get("message", "").startswith("Unknown command")
@@ -9,6 +9,7 @@ from typing import Any
 
 from .client import BrokerClient
 from .protocol import (
+    MAX_LINE_LENGTH,
     Message,
     MSG_AGENT_REGISTER,
     MSG_AGENT_READY,
@@ -23,6 +24,9 @@ log = logging.getLogger(__name__)
 
 DEFAULT_SOCKET_PATH = Path("data/broker/mist.sock")
 
+# Line terminator, written after each encoded message via writelines().
+_NEWLINE = b"\n"
+
 
 class AgentBase:
     """Base class for MIST agents.
@@ -41,10 +45,14 @@ class AgentBase:
         asyncio.run(agent.run())
     """
 
+    # Commands handled at the same time; 1 keeps them strictly in order.
+    max_concurrent_commands = 1
+
     def __init__(self, socket_path: Path | str = DEFAULT_SOCKET_PATH) -> None:
         self._socket_path = Path(socket_path)
         self.client: BrokerClient | None = None
         self.agent_id: str | None = None
+        self._command_tasks: set[asyncio.Task] = set()
 
     def manifest(self) -> dict[str, Any]:
         """Return the agent's manifest. Override in subclass."""
@@ -58,11 +66,22 @@ class AgentBase:
         """Handle an inter-agent message. Override if needed."""
         log.warning("unhandled agent message from %s", msg.sender)
 
+    async def _handle_message(self, msg: Message) -> None:
+        try:
+            if msg.type == MSG_AGENT_MESSAGE:
+                await self.on_agent_message(msg)
+            else:
+                await self.handle_command(msg)
+        except Exception:
+            log.exception("error handling %s", msg.type)
+            if msg.type == MSG_COMMAND:
+                await self.client.respond_error(msg, "internal agent error")
+
     async def run(self) -> None:
         """Connect, register, and loop handling commands."""
         # Connect to broker
         reader, writer = await asyncio.open_unix_connection(
-            str(self._socket_path)
+            str(self._socket_path), limit=MAX_LINE_LENGTH,
         )
 
         try:
@@ -74,12 +93,12 @@ class AgentBase:
                 to="broker",
                 payload=manifest,
             )
-            writer.write((encode_message(reg_msg) + "\n").encode())
+            writer.writelines((encode_message(reg_msg).encode(), _NEWLINE))
             await writer.drain()
 
             # Wait for ready
             raw = await reader.readuntil(b"\n")
-            ready = decode_message(raw.decode().rstrip("\n"))
+            ready = decode_message(raw)
             if ready.type != MSG_AGENT_READY:
                 raise RuntimeError(f"expected agent.ready, got {ready.type}")
             self.agent_id = ready.payload["agent_id"]
@@ -92,23 +111,26 @@ class AgentBase:
             self.client._writer = writer
             self.client._listen_task = asyncio.create_task(self.client._listen_loop())
 
-            # Command loop
+            # Command loop: each message runs as its own task, at most
+            # max_concurrent_commands at once (stop reading when full).
+            slots = asyncio.Semaphore(self.max_concurrent_commands)
             while True:
                 msg = await self.client.recv_command()
-                try:
-                    if msg.type == MSG_AGENT_MESSAGE:
-                        await self.on_agent_message(msg)
-                    else:
-                        await self.handle_command(msg)
-                except Exception:
-                    log.exception("error handling %s", msg.type)
-                    if msg.type == MSG_COMMAND:
-                        await self.client.respond_error(msg, "internal agent error")
+                await slots.acquire()
+                task = asyncio.create_task(self._handle_message(msg))
+                self._command_tasks.add(task)
+                task.add_done_callback(self._command_tasks.discard)
+                task.add_done_callback(lambda _: slots.release())
 
         except asyncio.CancelledError:
             log.info("agent shutting down")
         finally:
-            # Send disconnect
+            # Let in-flight commands finish while the connection is open
+            if self._command_tasks:
+                await asyncio.gather(*self._command_tasks, return_exceptions=True)
+            # Send disconnect, after anything the client still has queued
+            if self.client:
+                self.client._flush_outbox()
             if self.agent_id:
                 try:
                     disc = Message.create(
@@ -116,7 +138,7 @@ class AgentBase:
                         sender=self.agent_id,
                         to="broker",
                     )
-                    writer.write((encode_message(disc) + "\n").encode())
+                    writer.writelines((encode_message(disc).encode(), _NEWLINE))
                     await writer.drain()
                 except Exception:
                     pass
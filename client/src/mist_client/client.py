@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any
 
 from .protocol import (
+    MAX_LINE_LENGTH,
     Message,
     decode_message,
     encode_message,
@@ -25,6 +26,9 @@ from .protocol import (
     RESP_PROGRESS,
 )
 
+# Line terminator, written after each encoded message via writelines().
+_NEWLINE = b"\n"
+
 
 class BrokerClient:
     """Agent-side client for communicating with the MIST broker.
@@ -45,11 +49,14 @@ class BrokerClient:
         self._pending: dict[str, asyncio.Future[Message]] = {}
         self._command_queue: asyncio.Queue[Message] = asyncio.Queue()
         self._listen_task: asyncio.Task | None = None
+        # Encoded lines waiting for the end-of-tick flush in _send
+        self._outbox: list[bytes] = []
+        self._outbox_flushed: asyncio.Future[None] | None = None
 
     async def connect(self) -> None:
         """Connect to the broker's Unix socket."""
         self._reader, self._writer = await asyncio.open_unix_connection(
-            str(self._socket_path)
+            str(self._socket_path), limit=MAX_LINE_LENGTH,
         )
         self._listen_task = asyncio.create_task(self._listen_loop())
 
@@ -62,14 +69,42 @@ class BrokerClient:
             except asyncio.CancelledError:
                 pass
         if self._writer:
+            self._flush_outbox()
             self._writer.close()
             await self._writer.wait_closed()
 
+    def _flush_outbox(self) -> None:
+        """Write every queued line in one writelines call."""
+        lines, self._outbox = self._outbox, []
+        flushed, self._outbox_flushed = self._outbox_flushed, None
+        if flushed is None:
+            return  # already flushed (e.g. by close())
+        try:
+            if self._writer is None:
+                raise RuntimeError("not connected")
+            self._writer.writelines(lines)
+        except Exception as exc:
+            if not flushed.done():
+                flushed.set_exception(exc)
+        else:
+            if not flushed.done():
+                flushed.set_result(None)
+
     async def _send(self, msg: Message) -> None:
+        # Messages sent in the same loop iteration (e.g. replies from
+        # concurrent commands) are coalesced into a single socket write.
         if self._writer is None:
             raise RuntimeError("not connected")
-        line = encode_message(msg) + "\n"
-        self._writer.write(line.encode())
+        if self._outbox_flushed is None:
+            loop = asyncio.get_running_loop()
+            self._outbox_flushed = loop.create_future()
+            loop.call_soon(self._flush_outbox)
+        flushed = self._outbox_flushed
+        self._outbox += (encode_message(msg).encode(), _NEWLINE)
+        # Wait until this message is on the transport, then for backpressure.
+        # The future is shared by the whole batch, so one cancelled sender
+        # must not cancel it for the others.
+        await asyncio.shield(flushed)
         await self._writer.drain()
 
     async def _listen_loop(self) -> None:
@@ -79,11 +114,13 @@ class BrokerClient:
             while True:
                 try:
                     raw = await self._reader.readuntil(b"\n")
-                except (asyncio.IncompleteReadError, ConnectionResetError):
+                except (
+                    asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionResetError,
+                ):
                     break
                 if not raw:
                     break
-                msg = decode_message(raw.decode().rstrip("\n"))
+                msg = decode_message(raw)
 
                 # Route reply to pending future
                 if msg.reply_to and msg.reply_to in self._pending:
@@ -148,6 +185,11 @@ class BrokerClient:
     async def parse_buffer(self) -> list[dict]:
         return await self._service_request("storage", "parse_buffer")
 
+    async def tail_buffer(self, count: int, source: str | None = None) -> list[dict]:
+        return await self._service_request(
+            "storage", "tail_buffer", {"count": count, "source": source},
+        )
+
     async def clear_buffer(self) -> bool:
         return await self._service_request("storage", "clear_buffer")
 
@@ -169,6 +211,11 @@ class BrokerClient:
             "storage", "load_topic_buffer", {"slug": slug},
         )
 
+    async def load_topic_buffers(self, slugs: list[str]) -> list[list[dict]]:
+        return await self._service_request(
+            "storage", "load_topic_buffers", {"slugs": slugs},
+        )
+
     async def append_to_topic_buffer(self, slug: str, entries: list[dict]) -> bool:
         return await self._service_request(
             "storage", "append_to_topic_buffer",
@@ -290,6 +337,10 @@ class BrokerClient:
             "events", "create", {"title": title, "start_time": start_time, **kwargs},
         )
 
+    async def create_events(self, events: list[dict]) -> dict:
+        """Create several events in one storage transaction."""
+        return await self._service_request("events", "create_many", {"events": events})
+
     async def list_events(self) -> list[dict]:
         return await self._service_request("events", "list")
 
@@ -121,6 +121,61 @@ async def test_agent_registers_and_handles_command(sock_path):
         await server.wait_closed()
 
 
+class GateAgent(EchoAgent):
+    """Echo agent whose commands only finish once two are in flight."""
+
+    max_concurrent_commands = 2
+
+    def __init__(self, socket_path):
+        super().__init__(socket_path=socket_path)
+        self.started = 0
+        self.both_started = asyncio.Event()
+
+    async def handle_command(self, msg):
+        self.started += 1
+        if self.started == 2:
+            self.both_started.set()
+        await self.both_started.wait()
+        await super().handle_command(msg)
+
+
+async def test_agent_handles_commands_concurrently(sock_path):
+    """With max_concurrent_commands > 1 a slow command doesn't block the next."""
+    texts = []
+
+    async def mock_broker(reader, writer):
+        reg = decode_message(await reader.readuntil(b"\n"))
+        ready = Message.reply(reg, "broker", MSG_AGENT_READY, {"agent_id": "echo-0"})
+        writer.write((encode_message(ready) + "\n").encode())
+        for text in ("a", "b"):
+            cmd = Message.create(MSG_COMMAND, "ui", "echo-0", {"text": text})
+            writer.write((encode_message(cmd) + "\n").encode())
+        await writer.drain()
+        for _ in range(2):
+            raw = await asyncio.wait_for(reader.readuntil(b"\n"), timeout=5.0)
+            texts.append(decode_message(raw).payload["content"]["text"])
+        writer.close()
+
+    server = await asyncio.start_unix_server(mock_broker, path=str(sock_path))
+    try:
+        agent = GateAgent(sock_path)
+        agent_task = asyncio.create_task(agent.run())
+        for _ in range(100):
+            if len(texts) == 2:
+                break
+            await asyncio.sleep(0.05)
+        assert sorted(texts) == ["echo: a", "echo: b"]
+
+        agent_task.cancel()
+        try:
+            await agent_task
+        except (asyncio.CancelledError, ConnectionError):
+            pass
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
 async def test_agent_manifest_not_implemented(sock_path):
     """AgentBase without overrides raises NotImplementedError."""
     agent = AgentBase(socket_path=sock_path)
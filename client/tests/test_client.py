@@ -159,6 +159,58 @@ class TestServiceError:
             await server.wait_closed()
 
 
+class TestOutbox:
+    async def test_same_tick_sends_share_one_write(self, client, mock_broker):
+        writes = []
+        real = client._writer.writelines
+        client._writer.writelines = lambda lines: writes.append(list(lines)) or real(lines)
+
+        original = Message.create(MSG_COMMAND, "ui", "test-agent", {"text": "hi"})
+        await asyncio.gather(
+            client.respond_text(original, "one"),
+            client.respond_text(original, "two"),
+        )
+        await asyncio.sleep(0.05)
+
+        assert len(writes) == 1 and len(writes[0]) == 4
+        assert [m.payload["content"]["text"] for m in mock_broker.received] == ["one", "two"]
+
+    async def test_write_error_reaches_sender(self, client):
+        def broken(lines):
+            raise ConnectionResetError("gone")
+
+        client._writer.writelines = broken
+        original = Message.create(MSG_COMMAND, "ui", "test-agent", {"text": "hi"})
+        with pytest.raises(ConnectionResetError):
+            await client.respond_text(original, "lost")
+
+    async def test_drain_waits_for_this_message(self, client):
+        order = []
+        real_writelines, real_drain = client._writer.writelines, client._writer.drain
+        client._writer.writelines = lambda lines: order.append("write") or real_writelines(lines)
+
+        async def drain():
+            order.append("drain")
+            await real_drain()
+
+        client._writer.drain = drain
+        original = Message.create(MSG_COMMAND, "ui", "test-agent", {"text": "hi"})
+        await client.respond_text(original, "one")
+        assert order == ["write", "drain"]
+
+    async def test_cancelled_sender_does_not_cancel_batch(self, client, mock_broker):
+        original = Message.create(MSG_COMMAND, "ui", "test-agent", {"text": "hi"})
+        cancelled = asyncio.create_task(client.respond_text(original, "one"))
+        kept = asyncio.create_task(client.respond_text(original, "two"))
+        await asyncio.sleep(0)  # both queued in the same tick
+        cancelled.cancel()
+        await kept
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        await asyncio.sleep(0.05)
+        assert [m.payload["content"]["text"] for m in mock_broker.received] == ["one", "two"]
+
+
 class TestStructuredResponses:
     async def test_respond_text_format(self, mock_broker, sock_path):
         """Verify the wire format of respond_text."""
@@ -6,6 +6,7 @@ import asyncio
 import logging
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from ..protocol import (
@@ -14,6 +15,7 @@ from ..protocol import (
     MSG_RESPONSE,
     RESP_ERROR,
     RESP_LIST,
+    RESP_PROGRESS,
     RESP_TABLE,
     RESP_TEXT,
 )
@@ -49,6 +51,20 @@ ADMIN_MANIFEST = {
 }
 
 
+@lru_cache(maxsize=8)
+def _render_system_prompt(persona: str, user_profile: str, context: str) -> str:
+    """Fill SYSTEM_PROMPT; inputs rarely change between turns, so memoise."""
+    return SYSTEM_PROMPT.format(
+        persona=persona, user_profile=user_profile, context=context,
+    )
+
+
+DEFAULT_PERSONA = "You are MIST, a personal information and knowledge assistant."
+
+# Minimum seconds between streamed progress updates for one reply
+STREAM_PROGRESS_INTERVAL = 0.25
+
+
 class AdminAgent:
     """In-process privileged agent that routes and handles commands.
 
@@ -77,6 +93,7 @@ class AdminAgent:
         self._services = services
         self._router = router
         self._agent_id: str | None = None
+        self._persona_cache: tuple[int, str] | None = None  # (mtime_ns, text)
 
     @property
     def agent_id(self) -> str:
@@ -308,23 +325,41 @@ class AdminAgent:
         context = ""
         user_profile = ""
 
-        system = SYSTEM_PROMPT.format(
-            persona=persona, user_profile=user_profile, context=context,
-        )
+        system = _render_system_prompt(persona, user_profile, context)
         prompt = USER_PROMPT.format(text=text)
 
+        # Stream the reply to the UI as progress updates, throttled so long
+        # replies don't send one message per token.
+        loop = asyncio.get_running_loop()
+        parts: list[str] = []
+        sends: list[asyncio.Task] = []
+        last_sent = loop.time()
+
+        def on_chunk(piece: str) -> None:
+            nonlocal last_sent
+            parts.append(piece)
+            now = loop.time()
+            if now - last_sent >= STREAM_PROGRESS_INTERVAL:
+                last_sent = now
+                sends.append(loop.create_task(
+                    self._respond_progress(msg, "".join(parts)),
+                ))
+
         try:
             response = await self._llm_queue.submit(
                 prompt=prompt,
                 system=system,
                 priority=PRIORITY_ADMIN,
                 command="reflect",
+                on_chunk=on_chunk,
             )
         except Exception:
             log.exception("LLM reflection failed")
+            await asyncio.gather(*sends, return_exceptions=True)
             await self._respond_error(msg, "LLM request failed")
             return
 
+        await asyncio.gather(*sends, return_exceptions=True)
         await self._respond_text(msg, response)
 
         # Optional extraction
@@ -341,11 +376,15 @@ class AdminAgent:
                     await self._respond_text(msg, f"Auto-extracted:\n{summary}")
 
     def _load_persona(self) -> str:
-        """Load the admin persona from disk."""
-        path = self._paths.agent_dir(self.agent_id) / "config" / "persona.md"
-        if path.exists():
-            return path.read_text().strip()
-        return "You are MIST, a personal information and knowledge assistant."
+        """Load the admin persona from disk, re-reading only when it changes."""
+        path = self._paths.agent_persona(self.agent_id)
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return DEFAULT_PERSONA
+        if self._persona_cache is None or self._persona_cache[0] != mtime:
+            self._persona_cache = (mtime, path.read_text().strip())
+        return self._persona_cache[1]
 
     # ── Response helpers ──────────────────────────────────────────────
 
@@ -358,6 +397,13 @@ class AdminAgent:
         })
         await self._router.deliver_response(response)
 
+    async def _respond_progress(self, msg: Message, text: str) -> None:
+        response = Message.reply(msg, self.agent_id, MSG_RESPONSE, {
+            "type": RESP_PROGRESS,
+            "content": {"message": text},
+        })
+        await self._router.deliver_response(response)
+
     async def _respond_table(
         self, msg: Message, columns: list[str], rows: list[list],
         title: str = "",
@@ -19,6 +19,8 @@ log = logging.getLogger(__name__)
 def _strip_code_fences(text: str) -> str:
     """Remove markdown code fences from LLM output."""
     text = text.strip()
+    if not text.startswith("```") and not text.endswith("```"):
+        return text  # common case: no fences, skip the regexes
     text = re.sub(r"^```(?:json)?\s*\n?", "", text)
     text = re.sub(r"\n?```\s*$", "", text)
     return text.strip()
@@ -86,23 +88,25 @@ async def apply_extracted_items(
             desc += f" (due {due})"
         created.append(desc)
 
+    new_events = []
     for e in items.get("events", []):
         title = e.get("title", "").strip()
         start = e.get("start_time")
         if not title or not start:
             continue
-        end = e.get("end_time")
-        freq = e.get("frequency")
-        event_id = await asyncio.to_thread(
-            events_store.create,
-            title=title,
-            start_time=start,
-            end_time=end,
-            frequency=freq,
-        )
-        desc = f"Created event #{event_id}: {title} at {start}"
-        if freq:
-            desc += f" ({freq})"
-        created.append(desc)
+        new_events.append({
+            "title": title,
+            "start_time": start,
+            "end_time": e.get("end_time"),
+            "frequency": e.get("frequency"),
+        })
+
+    if new_events:
+        event_ids = await asyncio.to_thread(events_store.create_many, new_events)
+        for event_id, e in zip(event_ids, new_events):
+            desc = f"Created event #{event_id}: {e['title']} at {e['start_time']}"
+            if e["frequency"]:
+                desc += f" ({e['frequency']})"
+            created.append(desc)
 
     return created
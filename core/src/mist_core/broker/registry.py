@@ -26,6 +26,7 @@ class AgentRegistry:
         self._agents: dict[str, AgentEntry] = {}
         self._conn_to_agent: dict[int, str] = {}
         self._name_counter: dict[str, int] = {}
+        self._catalog_cache: list[dict] | None = None  # reset on any mutation
 
     def register(
         self,
@@ -47,6 +48,7 @@ class AgentRegistry:
             privileged=privileged,
         )
         self._agents[agent_id] = entry
+        self._catalog_cache = None
         if conn is not None:
             self._conn_to_agent[id(conn)] = agent_id
         return entry
@@ -54,14 +56,17 @@ class AgentRegistry:
     def unregister(self, agent_id: str) -> AgentEntry | None:
         """Remove an agent by ID. Returns the entry or None."""
         entry = self._agents.pop(agent_id, None)
-        if entry is not None and entry.conn is not None:
-            self._conn_to_agent.pop(id(entry.conn), None)
+        if entry is not None:
+            self._catalog_cache = None
+            if entry.conn is not None:
+                self._conn_to_agent.pop(id(entry.conn), None)
         return entry
 
     def unregister_by_conn(self, conn: Connection) -> AgentEntry | None:
         """Remove an agent by its connection. Returns the entry or None."""
         agent_id = self._conn_to_agent.pop(id(conn), None)
         if agent_id is not None:
+            self._catalog_cache = None
             return self._agents.pop(agent_id, None)
         return None
 
@@ -95,8 +100,14 @@ class AgentRegistry:
         return None
 
     def build_catalog(self) -> list[dict]:
-        """Build a catalog of connected agents for agent.catalog responses."""
-        return [
+        """Build a catalog of connected agents for agent.catalog responses.
+
+        The list is cached until the next register/unregister; callers
+        must not mutate it.
+        """
+        if self._catalog_cache is not None:
+            return self._catalog_cache
+        self._catalog_cache = [
             {
                 "agent_id": e.agent_id,
                 "name": e.name,
@@ -106,3 +117,4 @@ class AgentRegistry:
             }
             for e in self._agents.values()
         ]
+        return self._catalog_cache
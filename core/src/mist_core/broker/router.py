@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Awaitable, Callable
 
 from ..protocol import (
     Message,
+    encode_message,
     MSG_AGENT_CATALOG,
     MSG_AGENT_DISCONNECT,
     MSG_AGENT_LIST,
@@ -30,9 +32,16 @@ log = logging.getLogger(__name__)
 
 BROKER_ID = "broker"
 
+# Cap on in-flight commands awaiting a response; the oldest entry is
+# evicted beyond this so agents that never reply cannot grow it unbounded.
+MAX_PENDING = 65536
+
 # Type for the admin agent's in-process handler
 AdminHandler = Callable[[Message], Awaitable[None]]
 
+# Per-message-type handler bound on the router instance
+MessageHandler = Callable[[Message, Connection | WebSocketConnection], Awaitable[None]]
+
 
 @dataclass
 class PendingCommand:
@@ -54,9 +63,21 @@ class MessageRouter:
     ) -> None:
         self._registry = registry
         self._services = services
-        self._pending: dict[str, PendingCommand] = {}
+        self._pending: OrderedDict[str, PendingCommand] = OrderedDict()
         self._admin_handler: AdminHandler | None = None
         self._ui_connections: list[WebSocketConnection] = []
+        services.set_event_sink(self.broadcast_to_ui)
+        # msg.type -> bound handler; one dict lookup per message
+        self._handlers: dict[str, MessageHandler] = {
+            MSG_AGENT_REGISTER: self._on_register,
+            MSG_AGENT_DISCONNECT: self._on_disconnect,
+            MSG_AGENT_LIST: self._on_list,
+            MSG_COMMAND: self._on_command,
+            MSG_RESPONSE: self._on_response,
+            MSG_SERVICE_REQUEST: self._on_service_request,
+            MSG_AGENT_MESSAGE: self._on_agent_message,
+            MSG_AGENT_BROADCAST: self._on_agent_broadcast,
+        }
 
     def set_admin_handler(self, handler: AdminHandler) -> None:
         """Set the in-process admin agent's message handler."""
@@ -70,36 +91,23 @@ class MessageRouter:
 
     async def broadcast_to_ui(self, msg: Message) -> None:
         """Send a message to all connected UI clients."""
+        line = encode_message(msg)  # serialize once for every recipient
         for conn in list(self._ui_connections):
             try:
-                await conn.send(msg)
+                await conn.send_raw(line)
             except Exception:
                 self.remove_ui_connection(conn)
 
     async def handle(self, msg: Message, conn: Connection | WebSocketConnection) -> None:
         """Main dispatch — route by msg.type."""
         try:
-            match msg.type:
-                case "agent.register":
-                    await self._on_register(msg, conn)
-                case "agent.disconnect":
-                    await self._on_disconnect(msg, conn)
-                case "agent.list":
-                    await self._on_list(msg, conn)
-                case "command":
-                    await self._on_command(msg, conn)
-                case "response":
-                    await self._on_response(msg, conn)
-                case "service.request":
-                    await self._on_service_request(msg, conn)
-                case "agent.message":
-                    await self._on_agent_message(msg, conn)
-                case "agent.broadcast":
-                    await self._on_agent_broadcast(msg, conn)
-                case _:
-                    await self._send_error(
-                        msg, conn, f"unknown message type: {msg.type}",
-                    )
+            handler = self._handlers.get(msg.type)
+            if handler is None:
+                await self._send_error(
+                    msg, conn, f"unknown message type: {msg.type}",
+                )
+            else:
+                await handler(msg, conn)
         except (ConnectionResetError, BrokenPipeError) as exc:
             log.warning("connection lost during handling: %s", exc)
             if isinstance(conn, Connection):
@@ -141,11 +149,11 @@ class MessageRouter:
             return
 
         # Track the pending command for response routing
-        self._pending[msg.id] = PendingCommand(
+        self._track_pending(PendingCommand(
             msg_id=msg.id,
             origin_conn=conn,
             target_agent_id=target_id,
-        )
+        ))
 
         # In-process admin agent
         if target.privileged and target.conn is None and self._admin_handler:
@@ -221,6 +229,7 @@ class MessageRouter:
         if isinstance(conn, Connection):
             sender_entry = self._registry.get_by_conn(conn)
 
+        line = encode_message(msg)  # serialize once for every recipient
         for entry in self._registry.all_agents():
             if sender_entry and entry.agent_id == sender_entry.agent_id:
                 continue
@@ -229,7 +238,7 @@ class MessageRouter:
                     await self._admin_handler(msg)
                 continue
             try:
-                await entry.conn.send(msg)
+                await entry.conn.send_raw(line)
             except (ConnectionResetError, BrokenPipeError):
                 pass
 
@@ -277,12 +286,12 @@ class MessageRouter:
         # Transfer pending tracking from original → forwarded
         pending = self._pending.pop(original_msg.id, None)
         if pending:
-            self._pending[fwd.id] = PendingCommand(
+            self._track_pending(PendingCommand(
                 msg_id=fwd.id,
                 origin_conn=pending.origin_conn,
                 target_agent_id=target_id,
                 original_msg_id=original_msg.id,
-            )
+            ))
 
         # Send to target agent
         if target.privileged and target.conn is None and self._admin_handler:
@@ -317,6 +326,15 @@ class MessageRouter:
         except (ConnectionResetError, BrokenPipeError):
             log.warning("failed to send error to client")
 
+    def _track_pending(self, pending: PendingCommand) -> None:
+        self._pending[pending.msg_id] = pending
+        if len(self._pending) > MAX_PENDING:
+            evicted_id, evicted = self._pending.popitem(last=False)
+            log.warning(
+                "pending table full; dropping %s (target=%s)",
+                evicted_id, evicted.target_agent_id,
+            )
+
     def _cleanup_pending_for(self, agent_id: str) -> None:
         to_remove = [
             mid for mid, pc in self._pending.items()
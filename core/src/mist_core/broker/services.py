@@ -5,12 +5,18 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import asdict
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from ..db import Database
 from ..llm.queue import LLMQueue, PRIORITY_AGENT
 from ..paths import Paths
-from ..protocol import Message, MSG_SERVICE_RESPONSE, MSG_SERVICE_ERROR
+from ..protocol import (
+    Message,
+    EVENT_TOPIC_CHANGED,
+    MSG_EVENT,
+    MSG_SERVICE_ERROR,
+    MSG_SERVICE_RESPONSE,
+)
 from ..storage.articles import ArticleStore
 from ..storage.events import EventStore
 from ..storage.logs import LogEntry
@@ -23,6 +29,9 @@ log = logging.getLogger(__name__)
 
 BROKER_ID = "broker"
 
+# Receives broker-originated event messages (the router fans them out to UIs)
+EventSink = Callable[[Message], Awaitable[None]]
+
 
 class ServiceDispatcher:
     """Dispatch service.request messages to class-based stores.
@@ -46,6 +55,22 @@ class ServiceDispatcher:
         self._events = EventStore(db)
         self._articles = ArticleStore(db)
         self._note_stores: dict[str, NoteStorage] = {}
+        self._storage_batch: list[tuple[Callable[..., Any], tuple, dict, asyncio.Future]] = []
+        self._batch_tasks: set[asyncio.Task] = set()
+        self._event_sink: EventSink | None = None
+
+    def set_event_sink(self, sink: EventSink) -> None:
+        """Set where topic-change events are published."""
+        self._event_sink = sink
+
+    async def _publish_topic_changed(self, agent_id: str, slug: str | None) -> None:
+        """Tell subscribers a topic (or, with no slug, the index) changed."""
+        if self._event_sink is None:
+            return
+        await self._event_sink(Message.create(
+            MSG_EVENT, BROKER_ID, "*",
+            {"topic": EVENT_TOPIC_CHANGED, "agent_id": agent_id, "slug": slug},
+        ))
 
     def _get_note_storage(self, agent_id: str) -> NoteStorage:
         """Lazy-create a NoteStorage scoped to *agent_id*."""
@@ -124,6 +149,9 @@ class ServiceDispatcher:
             case "create":
                 eid = await asyncio.to_thread(self._events.create, **params)
                 return {"event_id": eid}
+            case "create_many":
+                eids = await asyncio.to_thread(self._events.create_many, **params)
+                return {"event_ids": eids}
             case "get":
                 return await asyncio.to_thread(self._events.get, **params)
             case "update":
@@ -165,83 +193,126 @@ class ServiceDispatcher:
 
     # ── Storage (namespaced by agent_id) ─────────────────────────────
 
+    async def _storage_call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a NoteStorage call in the next storage batch.
+
+        Requests arriving in the same event-loop tick share one worker
+        thread hop and run in arrival order.
+        """
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._storage_batch.append((fn, args, kwargs, fut))
+        if len(self._storage_batch) == 1:
+            loop.call_soon(self._flush_storage_batch)
+        return await fut
+
+    def _flush_storage_batch(self) -> None:
+        batch, self._storage_batch = self._storage_batch, []
+        task = asyncio.ensure_future(self._run_storage_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_storage_batch(self, batch: list) -> None:
+        outcomes = await asyncio.to_thread(_call_all, batch)
+        for (_, _, _, fut), (result, exc) in zip(batch, outcomes):
+            if fut.done():
+                continue
+            if exc is not None:
+                fut.set_exception(exc)
+            else:
+                fut.set_result(result)
+
     async def _handle_storage(self, payload: dict, agent_id: str) -> Any:
         action = payload.get("action")
         params = payload.get("params", {})
         ns = self._get_note_storage(agent_id)
         match action:
             case "save_raw_input":
-                await asyncio.to_thread(ns.save_raw_input, **params)
+                await self._storage_call(ns.save_raw_input, **params)
                 return True
             case "parse_buffer":
-                entries = await asyncio.to_thread(ns.parse_buffer)
-                return [asdict(e) for e in entries]
+                return await self._storage_call(
+                    lambda: [e.to_dict() for e in ns.iter_buffer()],
+                )
+            case "tail_buffer":
+                entries = await self._storage_call(ns.tail_buffer, **params)
+                return [e.to_dict() for e in entries]
             case "clear_buffer":
-                await asyncio.to_thread(ns.clear_buffer)
+                await self._storage_call(ns.clear_buffer)
                 return True
             case "write_buffer":
                 raw = [LogEntry(**e) for e in params.get("entries", [])]
-                await asyncio.to_thread(ns.write_buffer, raw)
+                await self._storage_call(ns.write_buffer, raw)
                 return True
             case "load_topic_index":
-                topics = await asyncio.to_thread(ns.load_topic_index)
+                topics = await self._storage_call(ns.load_topic_index)
                 return [asdict(t) for t in topics]
             case "add_topic":
-                topic = await asyncio.to_thread(ns.add_topic, **params)
+                topic = await self._storage_call(ns.add_topic, **params)
+                await self._publish_topic_changed(agent_id, topic.slug)
                 return asdict(topic)
             case "find_topic":
-                topic = await asyncio.to_thread(ns.find_topic, **params)
+                topic = await self._storage_call(ns.find_topic, **params)
                 return asdict(topic) if topic else None
             case "load_topic_buffer":
-                entries = await asyncio.to_thread(ns.load_topic_buffer, **params)
-                return [asdict(e) for e in entries]
+                entries = await self._storage_call(ns.load_topic_buffer, **params)
+                return [e.to_dict() for e in entries]
+            case "load_topic_buffers":
+                buffers = await self._storage_call(ns.load_topic_buffers, **params)
+                return [[e.to_dict() for e in entries] for entries in buffers]
             case "append_to_topic_buffer":
                 raw = [LogEntry(**e) for e in params.get("entries", [])]
                 slug = params["slug"]
-                await asyncio.to_thread(ns.append_to_topic_buffer, slug, raw)
+                await self._storage_call(ns.append_to_topic_buffer, slug, raw)
+                await self._publish_topic_changed(agent_id, slug)
                 return True
             case "load_topic_note_feed":
-                return await asyncio.to_thread(ns.load_topic_note_feed, **params)
+                return await self._storage_call(ns.load_topic_note_feed, **params)
             case "save_topic_note_feed":
-                await asyncio.to_thread(ns.save_topic_note_feed, **params)
+                await self._storage_call(ns.save_topic_note_feed, **params)
+                await self._publish_topic_changed(agent_id, params.get("slug"))
                 return True
             case "load_topic_synthesis":
-                return await asyncio.to_thread(ns.load_topic_synthesis, **params)
+                return await self._storage_call(ns.load_topic_synthesis, **params)
             case "save_topic_synthesis":
-                await asyncio.to_thread(ns.save_topic_synthesis, **params)
+                await self._storage_call(ns.save_topic_synthesis, **params)
+                await self._publish_topic_changed(agent_id, params.get("slug"))
                 return True
             case "list_drafts":
-                return await asyncio.to_thread(ns.list_drafts)
+                return await self._storage_call(ns.list_drafts)
             case "load_draft":
-                return await asyncio.to_thread(ns.load_draft, **params)
+                return await self._storage_call(ns.load_draft, **params)
             case "save_draft":
-                await asyncio.to_thread(ns.save_draft, **params)
+                await self._storage_call(ns.save_draft, **params)
                 return True
             case "create_draft":
-                filename, _ = await asyncio.to_thread(ns.create_draft, **params)
+                filename, _ = await self._storage_call(ns.create_draft, **params)
                 return {"filename": filename}
             case "list_topic_notes":
-                return await asyncio.to_thread(ns.list_topic_notes, **params)
+                return await self._storage_call(ns.list_topic_notes, **params)
             case "load_topic_note":
-                return await asyncio.to_thread(ns.load_topic_note, **params)
+                return await self._storage_call(ns.load_topic_note, **params)
             case "save_topic_note":
-                await asyncio.to_thread(ns.save_topic_note, **params)
+                await self._storage_call(ns.save_topic_note, **params)
+                await self._publish_topic_changed(agent_id, params.get("slug"))
                 return True
             case "create_topic_note":
-                filename, _ = await asyncio.to_thread(ns.create_topic_note, **params)
+                filename, _ = await self._storage_call(ns.create_topic_note, **params)
+                await self._publish_topic_changed(agent_id, params.get("slug"))
                 return {"filename": filename}
             case "merge_topics":
-                count = await asyncio.to_thread(ns.merge_topics, **params)
+                count = await self._storage_call(ns.merge_topics, **params)
+                await self._publish_topic_changed(agent_id, None)
                 return {"entries_moved": count}
             case "get_last_aggregate_time":
-                return await asyncio.to_thread(ns.get_last_aggregate_time)
+                return await self._storage_call(ns.get_last_aggregate_time)
             case "set_last_aggregate_time":
-                await asyncio.to_thread(ns.set_last_aggregate_time, **params)
+                await self._storage_call(ns.set_last_aggregate_time, **params)
                 return True
             case "get_last_sync_time":
-                return await asyncio.to_thread(ns.get_last_sync_time)
+                return await self._storage_call(ns.get_last_sync_time)
             case "set_last_sync_time":
-                await asyncio.to_thread(ns.set_last_sync_time, **params)
+                await self._storage_call(ns.set_last_sync_time, **params)
                 return True
             case _:
                 raise ValueError(f"unknown storage action: {action}")
@@ -285,3 +356,14 @@ class ServiceDispatcher:
                 return Settings.is_valid_key(**params)
             case _:
                 raise ValueError(f"unknown settings action: {action}")
+
+
+def _call_all(batch: list) -> list[tuple[Any, BaseException | None]]:
+    """Run each (fn, args, kwargs, _) in order, capturing results and errors."""
+    outcomes: list[tuple[Any, BaseException | None]] = []
+    for fn, args, kwargs, _ in batch:
+        try:
+            outcomes.append((fn(*args, **kwargs), None))
+        except Exception as exc:
+            outcomes.append((None, exc))
+    return outcomes
@@ -28,6 +28,8 @@ CREATE TABLE IF NOT EXISTS events (
     updated_at TEXT NOT NULL
 );
 
+CREATE INDEX IF NOT EXISTS idx_events_start ON events(start_time);
+
 CREATE TABLE IF NOT EXISTS recurrence_rules (
     id        INTEGER PRIMARY KEY,
     event_id  INTEGER NOT NULL REFERENCES events(id) ON DELETE CASCADE,
@@ -81,6 +83,10 @@ class Database:
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
         self._conn.execute("PRAGMA foreign_keys = ON")
+        # One long-lived connection: set the per-connection tuning once here.
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute("PRAGMA temp_store = MEMORY")
         self._conn.row_factory = sqlite3.Row
 
     @property
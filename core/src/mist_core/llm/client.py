@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from ollama import chat, ChatResponse
+from typing import Iterator
+
+from ollama import ChatResponse, Client
 
 from ..storage.settings import Settings
 
@@ -17,6 +19,9 @@ class OllamaClient:
 
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
+        # Own one HTTP client so every request reuses its keep-alive pool,
+        # independent of how the ollama version wires its module helpers.
+        self._ollama = Client()
 
     def chat(
         self,
@@ -32,12 +37,35 @@ class OllamaClient:
         """
         if model is None:
             model = self._settings.get_model(command)
-        messages: list[dict[str, str]] = []
-        if system:
-            messages.append({"role": "system", "content": system})
-        messages.append({"role": "user", "content": prompt})
-        response: ChatResponse = chat(
+        response: ChatResponse = self._ollama.chat(
             model=model,
-            messages=messages,
+            messages=_messages(prompt, system),
         )
         return response["message"]["content"]
+
+    def stream_chat(
+        self,
+        prompt: str,
+        model: str | None = None,
+        command: str | None = None,
+        temperature: float = 0.3,
+        system: str | None = None,
+    ) -> Iterator[str]:
+        """Like `chat`, but yield the reply in pieces as it is generated."""
+        if model is None:
+            model = self._settings.get_model(command)
+        stream = self._ollama.chat(
+            model=model, messages=_messages(prompt, system), stream=True,
+        )
+        for part in stream:
+            text = part["message"]["content"]
+            if text:
+                yield text
+
+
+def _messages(prompt: str, system: str | None) -> list[dict[str, str]]:
+    messages: list[dict[str, str]] = []
+    if system:
+        messages.append({"role": "system", "content": system})
+    messages.append({"role": "user", "content": prompt})
+    return messages
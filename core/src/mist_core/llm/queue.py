@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Callable
 
 from .client import OllamaClient
 
@@ -22,11 +22,17 @@ class _QueueItem:
     seq: int = field(compare=True)
     kwargs: dict[str, Any] = field(compare=False)
     future: asyncio.Future = field(compare=False)
+    on_chunk: Callable[[str], None] | None = field(default=None, compare=False)
 
 
 class LLMQueue:
     """Async priority queue for LLM chat requests.
 
+    A fixed pool of ``max_concurrent`` workers drains the queue in priority
+    order. Identical requests submitted while one is already pending share
+    its result instead of running the model again. Requests with an
+    ``on_chunk`` callback are streamed and never coalesced.
+
     Usage:
         queue = LLMQueue(client, max_concurrent=1)
         asyncio.create_task(queue.run())
@@ -36,7 +42,8 @@ class LLMQueue:
     def __init__(self, client: OllamaClient, max_concurrent: int = 1) -> None:
         self._client = client
         self._queue: asyncio.PriorityQueue[_QueueItem] = asyncio.PriorityQueue()
-        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._max_concurrent = max_concurrent
+        self._inflight: dict[tuple, asyncio.Future[str]] = {}
         self._seq = 0
         self._running = False
 
@@ -48,10 +55,24 @@ class LLMQueue:
         command: str | None = None,
         temperature: float = 0.3,
         system: str | None = None,
+        on_chunk: Callable[[str], None] | None = None,
     ) -> str:
-        """Enqueue an LLM request and return the result when ready."""
+        """Enqueue an LLM request and return the result when ready.
+
+        If *on_chunk* is given the reply is streamed, and it is called on
+        the event loop with each piece as the model produces it.
+        """
+        key = (prompt, model, command, temperature, system)
+        if on_chunk is None:
+            pending = self._inflight.get(key)
+            if pending is not None:
+                return await asyncio.shield(pending)
+
         loop = asyncio.get_running_loop()
         future: asyncio.Future[str] = loop.create_future()
+        if on_chunk is None:
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
         self._seq += 1
         item = _QueueItem(
             priority=priority,
@@ -64,31 +85,53 @@ class LLMQueue:
                 "system": system,
             },
             future=future,
+            on_chunk=on_chunk,
         )
         await self._queue.put(item)
-        return await future
+        return await asyncio.shield(future)
 
     async def run(self) -> None:
-        """Process queue items. Run this as a background task."""
+        """Process queue items with the worker pool. Run this as a background task."""
         self._running = True
+        workers = [
+            asyncio.create_task(self._worker()) for _ in range(self._max_concurrent)
+        ]
         try:
-            while self._running:
-                item = await self._queue.get()
-                asyncio.create_task(self._process(item))
+            await asyncio.gather(*workers)
         except asyncio.CancelledError:
+            pass
+        finally:
             self._running = False
+            for worker in workers:
+                worker.cancel()
+
+    async def _worker(self) -> None:
+        while self._running:
+            item = await self._queue.get()
+            await self._process(item)
 
     async def _process(self, item: _QueueItem) -> None:
-        async with self._semaphore:
-            try:
+        try:
+            if item.on_chunk is None:
                 result = await asyncio.to_thread(
                     self._client.chat, **item.kwargs,
                 )
-                if not item.future.done():
-                    item.future.set_result(result)
-            except Exception as exc:
-                if not item.future.done():
-                    item.future.set_exception(exc)
+            else:
+                loop = asyncio.get_running_loop()
+                result = await asyncio.to_thread(self._stream, item, loop)
+            if not item.future.done():
+                item.future.set_result(result)
+        except Exception as exc:
+            if not item.future.done():
+                item.future.set_exception(exc)
+
+    def _stream(self, item: _QueueItem, loop: asyncio.AbstractEventLoop) -> str:
+        """Worker-thread side of a streamed request: forward pieces, return all."""
+        parts: list[str] = []
+        for piece in self._client.stream_chat(**item.kwargs):
+            parts.append(piece)
+            loop.call_soon_threadsafe(item.on_chunk, piece)
+        return "".join(parts)
 
     def stop(self) -> None:
         self._running = False
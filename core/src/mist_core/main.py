@@ -17,6 +17,11 @@ from .llm.queue import LLMQueue
 from .storage.settings import Settings
 from .transport import Server, WebSocketServer
 
+try:  # optional: pip install mist-core[fast]
+    import uvloop
+except ImportError:
+    uvloop = None
+
 log = logging.getLogger(__name__)
 
 
@@ -115,7 +120,10 @@ def main() -> None:
 
     paths = Paths(root=args.data_dir)
     core = Core(paths=paths, ws_host=args.ws_host, ws_port=args.ws_port)
-    asyncio.run(core.run())
+    if uvloop is not None:
+        uvloop.run(core.run())
+    else:
+        asyncio.run(core.run())
 
 
 if __name__ == "__main__":
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import json
-import uuid
-from dataclasses import asdict, dataclass, field
+import os
+import sys
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
 
@@ -30,6 +32,10 @@ MSG_SERVICE_ERROR = "service.error"
 MSG_AGENT_MESSAGE = "agent.message"
 MSG_AGENT_BROADCAST = "agent.broadcast"
 
+# Broker push notifications (to UI clients)
+MSG_EVENT = "event"
+EVENT_TOPIC_CHANGED = "topic:changed"
+
 MSG_ERROR = "error"
 
 # ── Response type constants ─────────────────────────────────────────
@@ -49,12 +55,43 @@ class ProtocolError(ValueError):
     """Raised when a message cannot be decoded."""
 
 
+# ── Message ids ─────────────────────────────────────────────────────
+
+# Random bytes are drawn in batches (one os.urandom call per _ID_BATCH ids)
+# from a per-thread pool; each id keeps the UUID4 version/variant bits.
+_ID_BATCH = 1024
+_id_local = threading.local()
+
+
+def _reset_id_pool() -> None:
+    global _id_local
+    _id_local = threading.local()
+
+
+# A forked child must not replay the parent's remaining pool.
+os.register_at_fork(after_in_child=_reset_id_pool)
+
+
+def _new_id() -> str:
+    """Return a fresh UUID4 as 32 hex digits."""
+    local = _id_local
+    pos = getattr(local, "pos", _ID_BATCH * 16)
+    if pos >= _ID_BATCH * 16:
+        local.pool = os.urandom(_ID_BATCH * 16)
+        pos = 0
+    b = bytearray(local.pool[pos:pos + 16])
+    local.pos = pos + 16
+    b[6] = (b[6] & 0x0F) | 0x40
+    b[8] = (b[8] & 0x3F) | 0x80
+    return b.hex()
+
+
 # ── Message envelope ────────────────────────────────────────────────
 
 _REQUIRED_WIRE_KEYS = {"type", "id", "from", "to", "payload"}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Message:
     """Immutable message envelope.
 
@@ -84,9 +121,9 @@ class Message:
         """Build a new message with a fresh UUID and auto-set timestamp."""
         return cls(
             type=type,
-            id=uuid.uuid4().hex,
-            sender=sender,
-            to=to,
+            id=_new_id(),
+            sender=sys.intern(sender),
+            to=sys.intern(to),
             payload=payload if payload is not None else {},
             reply_to=reply_to,
             timestamp=datetime.now(timezone.utc).isoformat(timespec="seconds"),
@@ -109,45 +146,72 @@ class Message:
             reply_to=original.id,
         )
 
+    # ── Wire form ───────────────────────────────────────────────────
+
+    def to_wire(self) -> dict[str, Any]:
+        """Return the wire dict (``sender`` as ``"from"``; no null ``reply_to``)."""
+        d = {
+            "type": self.type,
+            "id": self.id,
+            "from": self.sender,
+            "to": self.to,
+            "payload": self.payload,
+            "timestamp": self.timestamp,
+        }
+        if self.reply_to is not None:
+            d["reply_to"] = self.reply_to
+        return d
+
 
 # ── Serialization ───────────────────────────────────────────────────
 
+# Messages are newline-delimited JSON; json escapes newlines inside strings,
+# so a raw b"\n" always ends a frame. Stream readers must allow lines up to
+# this size (asyncio's default 64 KiB is too small for buffer payloads).
+MAX_LINE_LENGTH = 16 * 1024 * 1024
+
 
 def encode_message(msg: Message) -> str:
     """Serialize *msg* to a single JSON line (no trailing newline).
 
-    The ``sender`` field is written as ``"from"`` on the wire.
+    The ``sender`` field is written as ``"from"`` on the wire. Non-ASCII
+    text is emitted as UTF-8 rather than ``\\uXXXX`` escapes, which keeps
+    frames carrying note content smaller.
     """
-    d = asdict(msg)
-    d["from"] = d.pop("sender")
-    if d["reply_to"] is None:
-        del d["reply_to"]
-    return json.dumps(d, separators=(",", ":"))
+    return json.dumps(msg.to_wire(), separators=(",", ":"), ensure_ascii=False)
 
 
-def decode_message(line: str) -> Message:
+def decode_message(line: str | bytes) -> Message:
     """Deserialize a JSON line into a `Message`.
 
+    Accepts the raw bytes read off a socket as well as text; a trailing
+    newline is ignored either way.
+
     Raises `ProtocolError` on invalid input.
     """
     try:
         data = json.loads(line)
-    except json.JSONDecodeError as exc:
+    except ValueError as exc:  # JSONDecodeError, or UnicodeDecodeError on bytes
         raise ProtocolError(f"invalid JSON: {exc}") from exc
 
     if not isinstance(data, dict):
         raise ProtocolError("message must be a JSON object")
 
-    missing = _REQUIRED_WIRE_KEYS - data.keys()
-    if missing:
-        raise ProtocolError(f"missing required keys: {sorted(missing)}")
-
-    return Message(
-        type=data["type"],
-        id=data["id"],
-        sender=data["from"],
-        to=data["to"],
-        payload=data["payload"],
-        reply_to=data.get("reply_to"),
-        timestamp=data.get("timestamp"),
-    )
+    # EAFP: valid messages skip the required-key set difference entirely.
+    # Routing fields repeat across messages, so intern them: one shared
+    # object per name, and dict lookups keyed on them hit by identity.
+    try:
+        return Message(
+            type=sys.intern(data["type"]),
+            id=data["id"],
+            sender=sys.intern(data["from"]),
+            to=sys.intern(data["to"]),
+            payload=data["payload"],
+            reply_to=data.get("reply_to"),
+            timestamp=data.get("timestamp"),
+        )
+    except KeyError:
+        missing = _REQUIRED_WIRE_KEYS - data.keys()
+        raise ProtocolError(f"missing required keys: {sorted(missing)}") from None
+    except TypeError:
+        raise ProtocolError("type, from and to must be strings") from None
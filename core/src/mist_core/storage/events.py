@@ -3,15 +3,53 @@
 from __future__ import annotations
 
 import calendar
+import heapq
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
 
 from ..db import Database
 
+try:  # optional: pip install mist-core[fast]
+    from ciso8601 import parse_datetime as _fromiso
+except ImportError:
+    _fromiso = datetime.fromisoformat
+
+
+# Events joined with their (optional) recurrence rule; callers append
+# WHERE/ORDER BY clauses.
+_SELECT_EVENTS = (
+    "SELECT e.*, r.frequency, r.interval AS rec_interval, r.end_date AS rec_end_date "
+    "FROM events e LEFT JOIN recurrence_rules r ON r.event_id = e.id "
+)
+_SELECT_UPCOMING_ONCE = _SELECT_EVENTS + (
+    "WHERE r.event_id IS NULL AND e.start_time >= ? AND e.start_time < ? "
+    "ORDER BY e.start_time"
+)
+_SELECT_UPCOMING_RECURRING = _SELECT_EVENTS + (
+    "WHERE r.event_id IS NOT NULL AND e.start_time < ? "
+    "AND (r.end_date IS NULL OR r.end_date >= ?)"
+)
+_INSERT_EVENT = (
+    "INSERT INTO events (id, title, start_time, end_time, location, notes, "
+    "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_RULE = (
+    "INSERT INTO recurrence_rules (event_id, frequency, interval, end_date) "
+    "VALUES (?, ?, ?, ?)"
+)
+
 
 def _now() -> str:
     return datetime.now().isoformat(timespec="seconds")
 
 
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime:
+    """Parse a stored ISO timestamp; memoised since rows rarely change."""
+    return _fromiso(value)
+
+
 class EventStore:
     """Event storage backed by a shared Database instance."""
 
@@ -19,12 +57,13 @@ class EventStore:
         self.db = db
 
     def _next_id(self) -> int:
-        rows = self.db.conn.execute("SELECT id FROM events ORDER BY id").fetchall()
-        used = {r[0] for r in rows}
-        n = 1
-        while n in used:
-            n += 1
-        return n
+        """Lowest free positive id, found by SQLite via the primary key."""
+        row = self.db.conn.execute(
+            "SELECT CASE WHEN NOT EXISTS (SELECT 1 FROM events WHERE id = 1) THEN 1 "
+            "ELSE (SELECT MIN(e.id + 1) FROM events e WHERE NOT EXISTS "
+            "(SELECT 1 FROM events x WHERE x.id = e.id + 1)) END",
+        ).fetchone()
+        return row[0]
 
     def create(
         self,
@@ -41,34 +80,55 @@ class EventStore:
         now = _now()
         event_id = self._next_id()
         self.db.conn.execute(
-            "INSERT INTO events (id, title, start_time, end_time, location, notes, "
-            "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            _INSERT_EVENT,
             (event_id, title, start_time, end_time, location, notes, now, now),
         )
         if frequency:
             self.db.conn.execute(
-                "INSERT INTO recurrence_rules (event_id, frequency, interval, end_date) "
-                "VALUES (?, ?, ?, ?)",
-                (event_id, frequency, interval, end_date),
+                _INSERT_RULE, (event_id, frequency, interval, end_date),
             )
         self.db.conn.commit()
         return event_id
 
+    def create_many(self, events: list[dict]) -> list[int]:
+        """Insert several events in one transaction and return their ids.
+
+        Each dict takes the keyword arguments of `create`. Ids are the
+        lowest free ones, as with repeated `create` calls.
+        """
+        used = {r[0] for r in self.db.conn.execute("SELECT id FROM events")}
+        ids: list[int] = []
+        n = 1
+        for _ in events:
+            while n in used:
+                n += 1
+            ids.append(n)
+            n += 1
+
+        now = _now()
+        self.db.conn.executemany(_INSERT_EVENT, [
+            (eid, e["title"], e["start_time"], e.get("end_time"),
+             e.get("location"), e.get("notes"), now, now)
+            for eid, e in zip(ids, events)
+        ])
+        self.db.conn.executemany(_INSERT_RULE, [
+            (eid, e["frequency"], e.get("interval", 1), e.get("end_date"))
+            for eid, e in zip(ids, events) if e.get("frequency")
+        ])
+        self.db.conn.commit()
+        return ids
+
     def list(self) -> list[dict]:
         """Return all events with their recurrence rules."""
         rows = self.db.conn.execute(
-            "SELECT e.*, r.frequency, r.interval AS rec_interval, r.end_date AS rec_end_date "
-            "FROM events e LEFT JOIN recurrence_rules r ON r.event_id = e.id "
-            "ORDER BY e.start_time, e.id",
+            _SELECT_EVENTS + "ORDER BY e.start_time, e.id",
         ).fetchall()
         return [dict(r) for r in rows]
 
     def get(self, event_id: int) -> dict | None:
         """Return a single event by id, or None."""
         row = self.db.conn.execute(
-            "SELECT e.*, r.frequency, r.interval AS rec_interval, r.end_date AS rec_end_date "
-            "FROM events e LEFT JOIN recurrence_rules r ON r.event_id = e.id "
-            "WHERE e.id = ?",
+            _SELECT_EVENTS + "WHERE e.id = ?",
             (event_id,),
         ).fetchone()
         return dict(row) if row else None
@@ -101,53 +161,58 @@ class EventStore:
         window_start = now
         window_end = now + timedelta(days=days)
 
-        rows = self.db.conn.execute(
-            "SELECT e.*, r.frequency, r.interval AS rec_interval, r.end_date AS rec_end_date "
-            "FROM events e LEFT JOIN recurrence_rules r ON r.event_id = e.id "
-            "ORDER BY e.start_time",
-        ).fetchall()
+        # Pre-filter in SQL on date-prefix bounds (ISO strings sort
+        # chronologically); the exact datetime checks below still apply.
+        lo = window_start.date().isoformat()
+        hi = (window_end + timedelta(days=1)).date().isoformat()
 
-        results: list[dict] = []
-        for row in rows:
+        recurring: list[dict] = []
+        for row in self.db.conn.execute(_SELECT_UPCOMING_RECURRING, (hi, lo)):
             event = dict(row)
-            start = datetime.fromisoformat(event["start_time"])
-            end = datetime.fromisoformat(event["end_time"]) if event["end_time"] else None
-            freq = event.get("frequency")
-
-            if freq:
-                rec_end = (
-                    datetime.fromisoformat(event["rec_end_date"])
-                    if event.get("rec_end_date")
-                    else None
-                )
-                occurrences = _expand_recurrence(
-                    start, end, freq, event.get("rec_interval") or 1,
-                    rec_end, window_start, window_end,
-                )
-                for occ_start, occ_end in occurrences:
-                    results.append({
-                        "id": event["id"],
-                        "title": event["title"],
-                        "start_time": occ_start.isoformat(timespec="minutes"),
-                        "end_time": occ_end.isoformat(timespec="minutes") if occ_end else None,
-                        "location": event["location"],
-                        "notes": event["notes"],
-                        "frequency": freq,
-                    })
-            else:
-                if window_start <= start <= window_end:
-                    results.append({
-                        "id": event["id"],
-                        "title": event["title"],
-                        "start_time": event["start_time"],
-                        "end_time": event["end_time"],
-                        "location": event["location"],
-                        "notes": event["notes"],
-                        "frequency": None,
-                    })
-
-        results.sort(key=lambda e: e["start_time"])
-        return results[:limit]
+            freq = event["frequency"]
+            start = _parse_iso(event["start_time"])
+            end = _parse_iso(event["end_time"]) if event["end_time"] else None
+            rec_end = (
+                _parse_iso(event["rec_end_date"])
+                if event.get("rec_end_date")
+                else None
+            )
+            occurrences = _expand_recurrence(
+                start, end, freq, event.get("rec_interval") or 1,
+                rec_end, window_start, window_end,
+            )
+            for occ_start, occ_end in occurrences:
+                recurring.append({
+                    "id": event["id"],
+                    "title": event["title"],
+                    "start_time": occ_start.isoformat(timespec="minutes"),
+                    "end_time": occ_end.isoformat(timespec="minutes") if occ_end else None,
+                    "location": event["location"],
+                    "notes": event["notes"],
+                    "frequency": freq,
+                })
+        recurring.sort(key=_start_key)
+
+        # One-off rows arrive sorted from SQLite; read only as many as needed.
+        cursor = self.db.conn.execute(_SELECT_UPCOMING_ONCE, (lo, hi))
+        one_off = (
+            {
+                "id": row["id"],
+                "title": row["title"],
+                "start_time": row["start_time"],
+                "end_time": row["end_time"],
+                "location": row["location"],
+                "notes": row["notes"],
+                "frequency": None,
+            }
+            for row in cursor
+            if window_start <= _parse_iso(row["start_time"]) <= window_end
+        )
+        return list(islice(heapq.merge(one_off, recurring, key=_start_key), limit))
+
+
+def _start_key(event: dict) -> str:
+    return event["start_time"]
 
 
 # ── Recurrence helpers ──────────────────────────────────────────────
@@ -173,6 +238,19 @@ def _expand_recurrence(
 ) -> list[tuple[datetime, datetime | None]]:
     """Generate occurrences within [window_start, window_end]."""
     duration = (end - start) if end else None
+
+    # Fixed-length steps: index the first and last occurrence directly.
+    if frequency in ("daily", "weekly"):
+        days = max(interval, 1) * (1 if frequency == "daily" else 7)
+        step = timedelta(days=days)
+        stop = min(window_end, rec_end) if rec_end else window_end
+        if stop < start:
+            return []
+        first = max(0, -((start - window_start) // step))  # ceil division
+        last = (stop - start) // step
+        starts = [start + i * step for i in range(first, last + 1)]
+        return [(s, (s + duration) if duration else None) for s in starts]
+
     occurrences: list[tuple[datetime, datetime | None]] = []
     current = start
 
@@ -184,11 +262,7 @@ def _expand_recurrence(
         if current >= window_start:
             occ_end = (current + duration) if duration else None
             occurrences.append((current, occ_end))
-        if frequency == "daily":
-            current += timedelta(days=interval)
-        elif frequency == "weekly":
-            current += timedelta(weeks=interval)
-        elif frequency == "monthly":
+        if frequency == "monthly":
             current = _add_months(current, interval)
         elif frequency == "yearly":
             current = _add_months(current, 12 * interval)
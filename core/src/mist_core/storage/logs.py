@@ -3,11 +3,28 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, NamedTuple
 
+try:  # optional: pip install mist-core[fast]
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(obj: dict) -> bytes:
+        return json.dumps(obj).encode()
+
+
+@dataclass(slots=True)
 class LogEntry:
     """A single timestamped log entry."""
 
@@ -15,45 +32,166 @@ class LogEntry:
     source: str
     text: str
 
+    def to_dict(self) -> dict[str, str]:
+        """Return the plain dict form; cheaper than dataclasses.asdict."""
+        return {"time": self.time, "source": self.source, "text": self.text}
 
-def parse_jsonl(path: Path) -> list[LogEntry]:
-    """Parse a JSONL file into LogEntry objects. Returns [] if missing."""
-    try:
-        content = path.read_text(encoding="utf-8")
-    except FileNotFoundError:
-        return []
-    entries = []
-    for line in content.splitlines():
-        line = line.strip()
-        if not line:
+
+def _iter_entries(lines: Iterable[bytes]) -> Iterator[LogEntry]:
+    """Yield LogEntry objects from raw JSONL lines (e.g. a binary file)."""
+    # Both json backends take UTF-8 bytes and ignore the trailing newline,
+    # so lines go straight to the parser without a decode or strip.
+    for line in lines:
+        if not line or line.isspace():
             continue
         try:
-            obj = json.loads(line)
-            entries.append(LogEntry(
+            obj = _loads(line)
+            yield LogEntry(
                 time=obj["time"],
                 source=obj["source"],
                 text=obj["text"],
-            ))
-        except (json.JSONDecodeError, KeyError):
+            )
+        except (ValueError, KeyError, TypeError):  # also covers bad UTF-8
+            continue
+
+
+def _parse_block(data: bytes) -> list[LogEntry]:
+    """Parse a chunk of JSONL with one parser call over a wrapped array.
+
+    Falls back to line-by-line parsing when any line is malformed.
+    """
+    lines = [line for line in data.split(b"\n") if line and not line.isspace()]
+    try:
+        objs = _loads(b"[" + b",".join(lines) + b"]")
+    except ValueError:
+        objs = None
+    if objs is None or len(objs) != len(lines):  # e.g. two objects on one line
+        return list(_iter_entries(lines))
+    entries = []
+    for obj in objs:
+        try:
+            entries.append(LogEntry(time=obj["time"], source=obj["source"], text=obj["text"]))
+        except (KeyError, TypeError):
             continue
     return entries
 
 
-def _entry_to_json(entry: LogEntry) -> str:
-    return json.dumps({"time": entry.time, "source": entry.source, "text": entry.text})
+def iter_jsonl(path: Path) -> Iterator[LogEntry]:
+    """Yield LogEntry objects from a JSONL file line by line. Yields nothing if missing."""
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return
+    with f:
+        yield from _iter_entries(f)
+
+
+class _Parsed(NamedTuple):
+    """What parse_jsonl remembers about a file between calls."""
+
+    mtime_ns: int
+    offset: int  # bytes parsed
+    ino: int
+    head: bytes  # first _CHECK_BLOCK bytes of what was parsed
+    tail: bytes  # last _CHECK_BLOCK bytes of what was parsed
+    entries: list[LogEntry]
+
+
+_CHECK_BLOCK = 4096
+_parse_cache: dict[Path, _Parsed] = {}
+
+
+def _prefix_unchanged(f: BinaryIO, cached: _Parsed) -> bool:
+    """True if the already-parsed part of *f* still has its old first and
+    last blocks, ending on a line break; leaves f at the cached offset."""
+    if cached.offset and not cached.tail.endswith(b"\n"):
+        return False
+    f.seek(0)
+    if f.read(len(cached.head)) != cached.head:
+        return False
+    f.seek(cached.offset - len(cached.tail))
+    return f.read(len(cached.tail)) == cached.tail
+
+
+def parse_jsonl(path: Path) -> list[LogEntry]:
+    """Parse a JSONL file into LogEntry objects. Returns [] if missing.
+
+    Results are cached per path. An unchanged file (same mtime, size and
+    inode) is not read again; a file that only grew past an unchanged
+    start has just its new tail parsed. Anything else is parsed from scratch.
+    """
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        _parse_cache.pop(path, None)
+        return []
+    with f:
+        st = os.fstat(f.fileno())
+        cached = _parse_cache.get(path)
+        if cached is not None and cached.ino == st.st_ino:
+            if (cached.mtime_ns, cached.offset) == (st.st_mtime_ns, st.st_size):
+                return list(cached.entries)
+            if cached.offset < st.st_size and _prefix_unchanged(f, cached):
+                data = f.read()
+                head = cached.head
+                if len(head) < _CHECK_BLOCK:
+                    head = (head + data)[:_CHECK_BLOCK]
+                _parse_cache[path] = _Parsed(
+                    st.st_mtime_ns, cached.offset + len(data), st.st_ino,
+                    head, (cached.tail + data)[-_CHECK_BLOCK:],
+                    cached.entries + _parse_block(data),
+                )
+                return list(_parse_cache[path].entries)
+        f.seek(0)
+        data = f.read()
+        entries = _parse_block(data)
+        # len(data) rather than st_size: a concurrent append may land mid-read.
+        _parse_cache[path] = _Parsed(
+            st.st_mtime_ns, len(data), st.st_ino,
+            data[:_CHECK_BLOCK], data[-_CHECK_BLOCK:], entries,
+        )
+    return list(entries)
+
+
+def _entry_to_json(entry: LogEntry) -> bytes:
+    return _dumps(entry.to_dict())
+
+
+def _encode_lines(entries: list[LogEntry]) -> bytes:
+    """Encode entries as one JSONL blob, so writers issue a single write."""
+    return b"".join([_entry_to_json(e) + b"\n" for e in entries])
 
 
 def append_jsonl(path: Path, entries: list[LogEntry]) -> None:
     """Append entries to a JSONL file, creating it if needed."""
+    blob = _encode_lines(entries)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "a", encoding="utf-8") as f:
-        for entry in entries:
-            f.write(_entry_to_json(entry) + "\n")
+    # Raw fd with O_APPEND: no buffered writer to set up, and the kernel
+    # places each write at end-of-file atomically.
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        view = memoryview(blob)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 def write_jsonl(path: Path, entries: list[LogEntry]) -> None:
-    """Overwrite a JSONL file with the given entries."""
+    """Overwrite a JSONL file with the given entries.
+
+    Written to a temporary file and renamed over *path*, so readers see
+    either the old or the new contents, never a partial write.
+    """
+    blob = _encode_lines(entries)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        for entry in entries:
-            f.write(_entry_to_json(entry) + "\n")
+    tmp = path.with_name(f".{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    # Only now: a parse racing the write could otherwise re-cache old data.
+    _parse_cache.pop(path, None)
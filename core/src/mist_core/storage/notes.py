@@ -2,18 +2,82 @@
 
 from __future__ import annotations
 
+import heapq
 import json
+import os
 import re
 import shutil
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
+from typing import Iterator
 
 from ..paths import Paths
-from .logs import LogEntry, append_jsonl, parse_jsonl, write_jsonl
+from .logs import LogEntry, append_jsonl, iter_jsonl, parse_jsonl, write_jsonl
 
+# Infix of hidden directories awaiting deletion (see _discard_dir).
+_TRASH_MARKER = ".trash-"
 
-@dataclass
+# Runs of characters that may not appear in a slug.
+_NON_SLUG_RE = re.compile(r"[^a-z0-9]+")
+# ASCII fast path: one translate pass maps every non-slug character to "-".
+_SLUG_TABLE = str.maketrans({
+    c: chr(c) if chr(c) in "abcdefghijklmnopqrstuvwxyz0123456789" else "-"
+    for c in range(128)
+})
+
+
+def _slugify(text: str) -> str:
+    """Lowercase, replace non-alnum with hyphens, collapse, strip."""
+    lowered = text.lower()
+    if lowered.isascii():
+        return "-".join(filter(None, lowered.translate(_SLUG_TABLE).split("-")))
+    return _NON_SLUG_RE.sub("-", lowered).strip("-")
+
+
+def _list_md(directory: Path) -> list[str]:
+    """Sorted .md filenames in *directory*; [] if it is missing."""
+    try:
+        with os.scandir(directory) as it:
+            return sorted(e.name for e in it if e.name.endswith(".md"))
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _discard_dir(path: Path) -> None:
+    """Remove a directory without blocking on the delete.
+
+    One rename moves it out of the way; the tree is then deleted on a
+    daemon thread. Leftovers from an interrupted delete are swept when
+    the next NoteStorage for the agent is created.
+    """
+    trash = path.with_name(f".{path.name}{_TRASH_MARKER}{time.time_ns()}")
+    path.rename(trash)
+    _in_background(shutil.rmtree, trash, True)
+
+
+def _sweep_trash(directory: Path) -> None:
+    """Delete directories left behind by interrupted _discard_dir calls."""
+    for leftover in directory.glob(f".*{_TRASH_MARKER}*"):
+        shutil.rmtree(leftover, ignore_errors=True)
+
+
+def _in_background(func, *args) -> None:
+    """Run *func* on a daemon thread; for deletes nobody waits on."""
+    threading.Thread(target=func, args=args, daemon=True).start()
+
+
+def _merge_entries(a: list[LogEntry], b: list[LogEntry]) -> list[LogEntry]:
+    """Merge two time-ordered entry lists, keeping every entry."""
+    return list(heapq.merge(a, b, key=attrgetter("time")))
+
+
+@dataclass(slots=True)
 class TopicInfo:
     id: int
     name: str
@@ -30,6 +94,10 @@ class NoteStorage:
     def __init__(self, paths: Paths, agent_id: str) -> None:
         self.paths = paths
         self.agent_id = agent_id
+        # (st_mtime_ns, st_size, topics) of the index file as last read/written
+        self._index_cache: tuple[int, int, list[TopicInfo]] | None = None
+        # Constructed on the broker's event loop: keep the sweep off it.
+        _in_background(_sweep_trash, paths.agent_topics_dir(agent_id))
 
     # ── Note buffer (raw input) ─────────────────────────────────────
 
@@ -44,11 +112,20 @@ class NoteStorage:
         """Read the agent's note buffer."""
         return parse_jsonl(self.paths.agent_note_buffer(self.agent_id))
 
+    def iter_buffer(self) -> Iterator[LogEntry]:
+        """Stream the agent's note buffer without building a list."""
+        return iter_jsonl(self.paths.agent_note_buffer(self.agent_id))
+
+    def tail_buffer(self, count: int, source: str | None = None) -> list[LogEntry]:
+        """Return the last *count* buffer entries, optionally from one *source*."""
+        entries = self.iter_buffer()
+        if source is not None:
+            entries = (e for e in entries if e.source == source)
+        return list(deque(entries, maxlen=count))
+
     def clear_buffer(self) -> None:
         """Truncate the agent's note buffer."""
-        buf = self.paths.agent_note_buffer(self.agent_id)
-        buf.parent.mkdir(parents=True, exist_ok=True)
-        buf.write_text("", encoding="utf-8")
+        write_jsonl(self.paths.agent_note_buffer(self.agent_id), [])
 
     def write_buffer(self, entries: list[LogEntry]) -> None:
         """Overwrite the agent's note buffer."""
@@ -57,20 +134,30 @@ class NoteStorage:
     # ── Topic index ─────────────────────────────────────────────────
 
     def load_topic_index(self) -> list[TopicInfo]:
-        """Read the topic index, returning [] if missing."""
+        """Read the topic index, returning [] if missing.
+
+        The parsed index is kept in memory and reused while the file's
+        mtime and size are unchanged.
+        """
         path = self.paths.agent_topic_index(self.agent_id)
         try:
-            content = path.read_text(encoding="utf-8")
+            st = path.stat()
         except FileNotFoundError:
+            self._index_cache = None
             return []
+        cached = self._index_cache
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return list(cached[2])
         try:
-            items = json.loads(content)
-        except json.JSONDecodeError:
+            items = json.loads(path.read_bytes())
+        except (FileNotFoundError, ValueError):
             return []
-        return [
+        topics = [
             TopicInfo(id=t["id"], name=t["name"], slug=t["slug"], created=t["created"])
             for t in items
         ]
+        self._index_cache = (st.st_mtime_ns, st.st_size, topics)
+        return list(topics)
 
     def save_topic_index(self, topics: list[TopicInfo]) -> None:
         """Write the topic index."""
@@ -81,6 +168,8 @@ class NoteStorage:
             for t in topics
         ]
         path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+        st = path.stat()
+        self._index_cache = (st.st_mtime_ns, st.st_size, list(topics))
 
     def add_topic(self, name: str, slug: str) -> TopicInfo:
         """Create a new topic entry + directory."""
@@ -125,6 +214,13 @@ class NoteStorage:
         """Read a topic's noteBuffer.jsonl."""
         return parse_jsonl(self.paths.agent_topic_note_buffer(self.agent_id, slug))
 
+    def load_topic_buffers(self, slugs: list[str]) -> list[list[LogEntry]]:
+        """Read several topics' buffers, in order, overlapping the file reads."""
+        if len(slugs) <= 1:
+            return [self.load_topic_buffer(slug) for slug in slugs]
+        with ThreadPoolExecutor(max_workers=min(8, len(slugs))) as pool:
+            return list(pool.map(self.load_topic_buffer, slugs))
+
     # ── Per-topic note feed and synthesis ───────────────────────────
 
     def load_topic_note_feed(self, slug: str) -> str:
@@ -159,7 +255,7 @@ class NoteStorage:
 
     @staticmethod
     def _slugify_title(title: str) -> str:
-        slug = re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+        slug = _slugify(title)
         return slug or "untitled"
 
     def create_draft(self, title: str) -> tuple[str, Path]:
@@ -175,10 +271,7 @@ class NoteStorage:
 
     def list_drafts(self) -> list[str]:
         """List .md filenames in the drafts dir."""
-        drafts = self.paths.agent_drafts_dir(self.agent_id)
-        if not drafts.is_dir():
-            return []
-        return sorted(p.name for p in drafts.glob("*.md"))
+        return _list_md(self.paths.agent_drafts_dir(self.agent_id))
 
     def load_draft(self, filename: str) -> str:
         """Read a draft note, returning '' if missing."""
@@ -211,10 +304,7 @@ class NoteStorage:
 
     def list_topic_notes(self, slug: str) -> list[str]:
         """List .md filenames in a topic's notes/ dir."""
-        notes_dir = self._topic_notes_dir(slug)
-        if not notes_dir.is_dir():
-            return []
-        return sorted(p.name for p in notes_dir.glob("*.md"))
+        return _list_md(self._topic_notes_dir(slug))
 
     def load_topic_note(self, slug: str, filename: str) -> str:
         try:
@@ -231,10 +321,17 @@ class NoteStorage:
 
     def merge_topics(self, source_slug: str, target_slug: str) -> int:
         """Merge source topic into target. Returns count of entries moved."""
-        # 1. Move buffer entries
+        # 1. Move buffer entries, keeping the target buffer in time order
         entries = self.load_topic_buffer(source_slug)
         if entries:
-            self.append_to_topic_buffer(target_slug, entries)
+            target = self.load_topic_buffer(target_slug)
+            if not target or entries[0].time >= target[-1].time:
+                self.append_to_topic_buffer(target_slug, entries)
+            else:
+                write_jsonl(
+                    self.paths.agent_topic_note_buffer(self.agent_id, target_slug),
+                    _merge_entries(target, entries),
+                )
 
         # 2. Move note files
         source_notes = self._topic_notes_dir(source_slug)
@@ -262,7 +359,7 @@ class NoteStorage:
         # 5. Delete source directory
         source_dir = self.paths.agent_topic_dir(self.agent_id, source_slug)
         if source_dir.exists():
-            shutil.rmtree(source_dir)
+            _discard_dir(source_dir)
 
         return len(entries)
 
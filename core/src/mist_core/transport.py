@@ -13,6 +13,7 @@ from websockets.asyncio.server import Server as WsServer, ServerConnection
 
 from .protocol import (
     Message,
+    MAX_LINE_LENGTH,
     ProtocolError,
     decode_message,
     encode_message,
@@ -21,6 +22,9 @@ from .protocol import (
 
 log = logging.getLogger(__name__)
 
+# Line terminator, written after each encoded message via writelines().
+_NEWLINE = b"\n"
+
 Handler = Callable[[Message, "Connection"], Awaitable[None]]
 
 
@@ -39,18 +43,23 @@ class Connection:
         self._writer = writer
 
     async def send(self, msg: Message) -> None:
-        line = encode_message(msg) + "\n"
-        self._writer.write(line.encode())
+        await self.send_raw(encode_message(msg))
+
+    async def send_raw(self, line: str) -> None:
+        """Send an already-encoded message line (for encode-once fanout)."""
+        self._writer.writelines((line.encode(), _NEWLINE))
         await self._writer.drain()
 
     async def recv(self) -> Message | None:
         try:
             raw = await self._reader.readuntil(b"\n")
-        except (asyncio.IncompleteReadError, ConnectionResetError):
+        except (
+            asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionResetError,
+        ):
             return None
         if not raw:
             return None
-        return decode_message(raw.decode().rstrip("\n"))
+        return decode_message(raw)
 
     def close(self) -> None:
         self._writer.close()
@@ -77,6 +86,7 @@ class Server:
         self._server = await asyncio.start_unix_server(
             self._client_connected,
             path=str(self._path),
+            limit=MAX_LINE_LENGTH,
         )
         log.info("Unix socket listening on %s", self._path)
 
@@ -103,14 +113,15 @@ class Server:
             while True:
                 try:
                     raw = await reader.readuntil(b"\n")
-                except (asyncio.IncompleteReadError, ConnectionResetError):
+                except (
+                    asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionResetError,
+                ):
                     break
                 if not raw:
                     break
 
-                line = raw.decode().rstrip("\n")
                 try:
-                    msg = decode_message(line)
+                    msg = decode_message(raw)
                 except ProtocolError as exc:
                     log.warning("malformed message: %s", exc)
                     err = Message.create(
@@ -135,45 +146,85 @@ class Server:
 
 
 class Client:
-    """Unix-socket client for sending and receiving messages."""
+    """Unix-socket client for sending and receiving messages.
+
+    A background reader routes replies to in-flight `request` calls by
+    ``reply_to``, so several requests can share the connection; any other
+    message is queued for `recv`.
+    """
 
     def __init__(self, path: Path | str) -> None:
         self._path = Path(path)
         self._conn: Connection | None = None
+        self._pending: dict[str, asyncio.Future[Message]] = {}
+        self._inbox: asyncio.Queue[Message | None] = asyncio.Queue()
+        self._reader_task: asyncio.Task | None = None
 
     async def connect(self) -> None:
-        reader, writer = await asyncio.open_unix_connection(str(self._path))
+        reader, writer = await asyncio.open_unix_connection(
+            str(self._path), limit=MAX_LINE_LENGTH,
+        )
         self._conn = Connection(reader, writer)
+        self._reader_task = asyncio.create_task(self._read_loop(self._conn))
 
     def _require_conn(self) -> Connection:
         if self._conn is None:
             raise RuntimeError("call connect() first")
         return self._conn
 
+    async def _read_loop(self, conn: Connection) -> None:
+        try:
+            while True:
+                try:
+                    msg = await conn.recv()
+                except ProtocolError as exc:
+                    log.warning("malformed message: %s", exc)
+                    continue
+                if msg is None:
+                    break
+                future = self._pending.pop(msg.reply_to, None) if msg.reply_to else None
+                if future is None:
+                    self._inbox.put_nowait(msg)
+                elif not future.done():
+                    future.set_result(msg)
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("server closed connection"))
+            self._pending.clear()
+            self._inbox.put_nowait(None)
+
     async def send(self, msg: Message) -> None:
         await self._require_conn().send(msg)
 
     async def recv(self) -> Message | None:
-        return await self._require_conn().recv()
+        """Next message that is not a reply to a pending request; None at EOF."""
+        self._require_conn()
+        msg = await self._inbox.get()
+        if msg is None:
+            self._inbox.put_nowait(None)  # keep reporting end of stream
+        return msg
 
     async def request(self, msg: Message, timeout: float = 5.0) -> Message:
         """Send *msg* and wait for a reply whose ``reply_to`` matches."""
         conn = self._require_conn()
-        await conn.send(msg)
-        deadline = asyncio.get_event_loop().time() + timeout
-        while True:
-            remaining = deadline - asyncio.get_event_loop().time()
-            if remaining <= 0:
-                raise TimeoutError(f"no reply to {msg.id} within {timeout}s")
-            reply = await asyncio.wait_for(conn.recv(), timeout=remaining)
-            if reply is None:
-                raise ConnectionError("server closed connection")
-            if reply.reply_to == msg.id:
-                return reply
+        if self._reader_task is None or self._reader_task.done():
+            raise ConnectionError("server closed connection")
+        future: asyncio.Future[Message] = asyncio.get_running_loop().create_future()
+        self._pending[msg.id] = future
+        try:
+            await conn.send(msg)
+            return await asyncio.wait_for(future, timeout=timeout)
+        except TimeoutError:
+            raise TimeoutError(f"no reply to {msg.id} within {timeout}s") from None
+        finally:
+            self._pending.pop(msg.id, None)
 
     def close(self) -> None:
         if self._conn is not None:
             self._conn.close()
+        if self._reader_task is not None:
+            self._reader_task.cancel()
 
     async def wait_closed(self) -> None:
         if self._conn is not None:
@@ -183,7 +234,7 @@ class Client:
         return self
 
     async def __anext__(self) -> Message:
-        msg = await self._require_conn().recv()
+        msg = await self.recv()
         if msg is None:
             raise StopAsyncIteration
         return msg
@@ -201,12 +252,13 @@ class WebSocketConnection:
     async def send(self, msg: Message) -> None:
         await self._ws.send(encode_message(msg))
 
+    async def send_raw(self, line: str) -> None:
+        """Send an already-encoded message line (for encode-once fanout)."""
+        await self._ws.send(line)
+
     async def recv(self) -> Message | None:
         try:
-            raw = await self._ws.recv()
-            if isinstance(raw, bytes):
-                raw = raw.decode()
-            return decode_message(raw)
+            return decode_message(await self._ws.recv())
         except (websockets.exceptions.ConnectionClosed, ProtocolError):
             return None
 
@@ -256,8 +308,6 @@ class WebSocketServer:
         conn = WebSocketConnection(ws)
         try:
             async for raw in ws:
-                if isinstance(raw, bytes):
-                    raw = raw.decode()
                 try:
                     msg = decode_message(raw)
                 except ProtocolError as exc:
@@ -0,0 +1,28 @@
+"""Shared fixtures for mist_core tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from mist_core.db import Database
+from mist_core.paths import Paths
+from mist_core.storage.settings import Settings
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return Paths(root=tmp_path / "data")
+
+
+@pytest.fixture
+def db(paths):
+    database = Database(paths.db)
+    database.connect()
+    database.init_schema()
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def settings(paths):
+    return Settings(paths)
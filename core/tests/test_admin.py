@@ -3,17 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import os
 
 import pytest
 
-from mist_core.admin.agent import AdminAgent, ADMIN_MANIFEST
+from mist_core.admin.agent import AdminAgent, ADMIN_MANIFEST, _render_system_prompt
 from mist_core.broker.registry import AgentRegistry
 from mist_core.broker.router import MessageRouter
 from mist_core.broker.services import ServiceDispatcher
-from mist_core.db import Database
 from mist_core.llm.client import OllamaClient
 from mist_core.llm.queue import LLMQueue
-from mist_core.paths import Paths
 from mist_core.protocol import (
     Message,
     MSG_COMMAND,
@@ -23,7 +22,6 @@ from mist_core.protocol import (
     RESP_TABLE,
     RESP_TEXT,
 )
-from mist_core.storage.settings import Settings
 
 
 class FakeConn:
@@ -36,25 +34,6 @@ class FakeConn:
         self.sent.append(msg)
 
 
-@pytest.fixture
-def paths(tmp_path):
-    return Paths(root=tmp_path / "data")
-
-
-@pytest.fixture
-def db(paths):
-    database = Database(paths.db)
-    database.connect()
-    database.init_schema()
-    yield database
-    database.close()
-
-
-@pytest.fixture
-def settings(paths):
-    return Settings(paths)
-
-
 @pytest.fixture
 def registry():
     return AgentRegistry()
@@ -210,6 +189,35 @@ class TestAdminSettings:
         assert resp.payload["type"] == RESP_ERROR
 
 
+class TestAdminPersona:
+    def test_default_persona(self, admin):
+        assert "MIST" in admin._load_persona()
+
+    def test_persona_reloads_on_change(self, admin, paths):
+        path = paths.agent_persona(admin.agent_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("First persona\n")
+        assert admin._load_persona() == "First persona"
+
+        path.write_text("Second persona\n")
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+        assert admin._load_persona() == "Second persona"
+
+    def test_persona_cached_while_unchanged(self, admin, paths):
+        path = paths.agent_persona(admin.agent_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("Cached persona")
+        admin._load_persona()
+        admin._persona_cache = (admin._persona_cache[0], "from cache")
+        assert admin._load_persona() == "from cache"
+
+    def test_system_prompt_rendered_once_per_persona(self):
+        first = _render_system_prompt("Persona A", "", "")
+        assert first.startswith("Persona A\n")
+        assert _render_system_prompt("Persona A", "", "") is first
+        assert _render_system_prompt("Persona B", "", "").startswith("Persona B\n")
+
+
 class TestAdminManifest:
     def test_manifest_has_required_fields(self):
         assert ADMIN_MANIFEST["name"] == "admin"
@@ -2,19 +2,9 @@
 
 import pytest
 
-from mist_core.db import Database
 from mist_core.storage.articles import ArticleStore
 
 
-@pytest.fixture
-def db(tmp_path):
-    database = Database(tmp_path / "test.db")
-    database.connect()
-    database.init_schema()
-    yield database
-    database.close()
-
-
 @pytest.fixture
 def articles(db):
     return ArticleStore(db)
@@ -5,15 +5,6 @@ import pytest
 from mist_core.db import Database, CURRENT_SCHEMA_VERSION
 
 
-@pytest.fixture
-def db(tmp_path):
-    database = Database(tmp_path / "test.db")
-    database.connect()
-    database.init_schema()
-    yield database
-    database.close()
-
-
 class TestDatabase:
     def test_creates_db_file(self, tmp_path):
         db = Database(tmp_path / "sub" / "test.db")
@@ -41,6 +32,10 @@ class TestDatabase:
         row = db.conn.execute("PRAGMA foreign_keys").fetchone()
         assert row[0] == 1
 
+    def test_wal_journal_mode(self, db):
+        row = db.conn.execute("PRAGMA journal_mode").fetchone()
+        assert row[0] == "wal"
+
     def test_init_schema_idempotent(self, db):
         db.init_schema()
         db.init_schema()
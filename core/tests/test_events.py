@@ -4,17 +4,7 @@ from datetime import datetime, timedelta
 
 import pytest
 
-from mist_core.db import Database
-from mist_core.storage.events import EventStore
-
-
-@pytest.fixture
-def db(tmp_path):
-    database = Database(tmp_path / "test.db")
-    database.connect()
-    database.init_schema()
-    yield database
-    database.close()
+from mist_core.storage.events import EventStore, _expand_recurrence
 
 
 @pytest.fixture
@@ -61,6 +51,28 @@ class TestEventCRUD:
     def test_delete_nonexistent(self, events):
         assert not events.delete(999)
 
+    def test_reuses_lowest_free_id(self, events):
+        ids = [events.create(f"E{i}", start_time="2024-06-01T10:00") for i in range(4)]
+        assert ids == [1, 2, 3, 4]
+        events.delete(1)
+        events.delete(3)
+        assert events.create("A", start_time="2024-06-01T10:00") == 1
+        assert events.create("B", start_time="2024-06-01T10:00") == 3
+        assert events.create("C", start_time="2024-06-01T10:00") == 5
+
+    def test_create_many_fills_gaps_in_order(self, events):
+        for i in range(3):
+            events.create(f"E{i}", start_time="2024-06-01T10:00")
+        events.delete(2)
+        ids = events.create_many([
+            {"title": "A", "start_time": "2024-06-02T10:00"},
+            {"title": "B", "start_time": "2024-06-03T10:00", "frequency": "weekly"},
+        ])
+        assert ids == [2, 4]
+        assert events.get(2)["title"] == "A"
+        assert events.get(4)["frequency"] == "weekly"
+        assert events.get(2)["frequency"] is None
+
 
 class TestRecurrence:
     def test_create_with_recurrence(self, events):
@@ -104,3 +116,52 @@ class TestUpcoming:
         events.create("Weekly", start_time=now, frequency="weekly")
         result = events.get_upcoming(days=30)
         assert len(result) >= 4  # ~4 weeks in 30 days
+
+    def test_upcoming_window_filtering(self, events):
+        far = (datetime.now() + timedelta(days=60)).isoformat(timespec="minutes")
+        events.create("Far", start_time=far)
+        events.create("Ended", start_time="2020-01-01T10:00", frequency="daily",
+                      end_date="2020-02-01T00:00")
+        events.create("Ongoing", start_time="2024-01-01T10:00", frequency="weekly")
+        titles = {e["title"] for e in events.get_upcoming(days=7)}
+        assert titles == {"Ongoing"}
+
+    def test_upcoming_merges_sorted_and_limited(self, events):
+        base = datetime.now().replace(second=0, microsecond=0)
+        for h in (5, 1, 3):
+            events.create(f"Once {h}", start_time=(base + timedelta(hours=h)).isoformat())
+        daily = (base - timedelta(days=1) + timedelta(hours=2)).isoformat()
+        events.create("Daily", start_time=daily, frequency="daily")
+        upcoming = events.get_upcoming(days=7, limit=4)
+        assert [e["title"] for e in upcoming] == ["Once 1", "Daily", "Once 3", "Once 5"]
+
+
+class TestExpandRecurrence:
+    def test_daily_closed_form_matches_stepping(self):
+        start = datetime(2024, 1, 1, 9, 30)
+        end = start + timedelta(hours=1)
+        ws, we = datetime(2024, 3, 10, 12, 0), datetime(2024, 3, 20, 9, 30)
+        occ = _expand_recurrence(start, end, "daily", 3, None, ws, we)
+        expected = []
+        cur = start
+        while cur <= we:
+            if cur >= ws:
+                expected.append((cur, cur + timedelta(hours=1)))
+            cur += timedelta(days=3)
+        assert occ == expected
+
+    def test_weekly_respects_rec_end(self):
+        start = datetime(2024, 1, 1, 9, 0)
+        occ = _expand_recurrence(
+            start, None, "weekly", 1, datetime(2024, 1, 15, 9, 0),
+            datetime(2024, 1, 1), datetime(2024, 2, 1),
+        )
+        assert [o[0].day for o in occ] == [1, 8, 15]
+        assert all(o[1] is None for o in occ)
+
+    def test_window_before_start(self):
+        start = datetime(2024, 6, 1)
+        occ = _expand_recurrence(
+            start, None, "daily", 1, None, datetime(2024, 1, 1), datetime(2024, 2, 1),
+        )
+        assert occ == []
@@ -13,29 +13,13 @@ from mist_core.admin.extraction import (
     apply_extracted_items,
     extract_items,
 )
-from mist_core.db import Database
 from mist_core.llm.client import OllamaClient
 from mist_core.llm.queue import LLMQueue
-from mist_core.paths import Paths
 from mist_core.storage.events import EventStore
 from mist_core.storage.settings import Settings
 from mist_core.storage.tasks import TaskStore
 
 
-@pytest.fixture
-def paths(tmp_path):
-    return Paths(root=tmp_path / "data")
-
-
-@pytest.fixture
-def db(paths):
-    database = Database(paths.db)
-    database.connect()
-    database.init_schema()
-    yield database
-    database.close()
-
-
 @pytest.fixture
 def tasks_store(db):
     return TaskStore(db)
@@ -56,6 +40,12 @@ class TestStripCodeFences:
     def test_plain_fences(self):
         assert _strip_code_fences('```\n{"a": 1}\n```') == '{"a": 1}'
 
+    def test_no_fences_strips_whitespace(self):
+        assert _strip_code_fences('  \n{"a": 1}\n ') == '{"a": 1}'
+
+    def test_trailing_fence_only(self):
+        assert _strip_code_fences('{"a": 1}\n```') == '{"a": 1}'
+
 
 class TestExtractItems:
     async def test_extracts_tasks_and_events(self, paths):
@@ -140,3 +140,103 @@ class TestLLMQueue:
                 await task
             except asyncio.CancelledError:
                 pass
+
+    async def test_identical_inflight_requests_coalesce(self, mock_client):
+        def slow_chat(**kwargs):
+            import time
+            time.sleep(0.05)
+            return f"reply to {kwargs['prompt']}"
+
+        mock_client.chat = MagicMock(side_effect=slow_chat)
+        queue = LLMQueue(mock_client, max_concurrent=2)
+        task = asyncio.create_task(queue.run())
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    queue.submit(prompt="same"),
+                    queue.submit(prompt="same"),
+                    queue.submit(prompt="other"),
+                ),
+                timeout=2.0,
+            )
+            assert results == ["reply to same", "reply to same", "reply to other"]
+            assert mock_client.chat.call_count == 2
+
+            # Once finished, the same prompt runs the model again
+            await asyncio.wait_for(queue.submit(prompt="same"), timeout=2.0)
+            assert mock_client.chat.call_count == 3
+        finally:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def test_workers_honour_priority(self, mock_client):
+        call_order = []
+
+        def chat(**kwargs):
+            call_order.append(kwargs["prompt"])
+            return "ok"
+
+        mock_client.chat = chat
+        queue = LLMQueue(mock_client, max_concurrent=1)
+        # Queue up work before any worker is running
+        pending = [
+            asyncio.ensure_future(queue.submit(prompt="agent", priority=PRIORITY_AGENT)),
+            asyncio.ensure_future(queue.submit(prompt="admin", priority=PRIORITY_ADMIN)),
+        ]
+        await asyncio.sleep(0)
+        task = asyncio.create_task(queue.run())
+        try:
+            await asyncio.wait_for(asyncio.gather(*pending), timeout=2.0)
+            assert call_order == ["admin", "agent"]
+        finally:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def test_streamed_request_forwards_chunks(self, mock_client):
+        mock_client.stream_chat = MagicMock(side_effect=lambda **kw: iter(["Hel", "lo"]))
+        queue = LLMQueue(mock_client, max_concurrent=2)
+        task = asyncio.create_task(queue.run())
+        chunks: list[str] = []
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    queue.submit(prompt="hi", on_chunk=chunks.append),
+                    queue.submit(prompt="hi", on_chunk=chunks.append),
+                ),
+                timeout=2.0,
+            )
+            assert results == ["Hello", "Hello"]
+            assert mock_client.stream_chat.call_count == 2  # never coalesced
+            assert sorted(chunks) == ["Hel", "Hel", "lo", "lo"]
+            mock_client.chat.assert_not_called()
+        finally:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+class TestOllamaClient:
+    def test_stream_chat_yields_pieces(self, tmp_path):
+        client = OllamaClient(Settings(Paths(root=tmp_path)))
+        parts = [{"message": {"content": c}} for c in ["a", "", "b"]]
+        with patch.object(client._ollama, "chat", return_value=iter(parts)) as chat:
+            assert list(client.stream_chat("hi", model="m", system="sys")) == ["a", "b"]
+        kwargs = chat.call_args.kwargs
+        assert kwargs["stream"] is True
+        assert kwargs["messages"][0] == {"role": "system", "content": "sys"}
+
+    def test_reuses_one_http_client(self, tmp_path):
+        client = OllamaClient(Settings(Paths(root=tmp_path)))
+        reply = {"message": {"content": "ok"}}
+        with patch.object(client._ollama, "chat", return_value=reply) as chat:
+            assert client.chat("a", model="m") == "ok"
+            assert client.chat("b", model="m") == "ok"
+        assert chat.call_count == 2
@@ -1,6 +1,7 @@
 """Tests for mist_core.storage.logs."""
 
-from mist_core.storage.logs import LogEntry, append_jsonl, parse_jsonl, write_jsonl
+from mist_core.storage import logs
+from mist_core.storage.logs import LogEntry, append_jsonl, iter_jsonl, parse_jsonl, write_jsonl
 
 
 class TestParseJsonl:
@@ -36,6 +37,36 @@ class TestParseJsonl:
         entries = parse_jsonl(f)
         assert len(entries) == 2
 
+    def test_skips_non_object_lines(self, tmp_path):
+        f = tmp_path / "log.jsonl"
+        f.write_text(
+            '{"time":"t","source":"s","text":"good"}\n'
+            "42\n"
+            '{"time":"t","source":"s","text":"x"},{"time":"t","source":"s","text":"y"}\n',
+            encoding="utf-8",
+        )
+        assert [e.text for e in parse_jsonl(f)] == ["good"]
+
+    def test_blank_lines_and_non_ascii(self, tmp_path):
+        f = tmp_path / "log.jsonl"
+        f.write_bytes(
+            b'\n  \r\n{"time":"t","source":"s","text":"caf\xc3\xa9"}\r\n'
+            b'{"time":"t","source":"s","text":"\xff"}\n'
+        )
+        assert [e.text for e in parse_jsonl(f)] == ["café"]
+
+
+class TestIterJsonl:
+    def test_missing_file(self, tmp_path):
+        assert list(iter_jsonl(tmp_path / "missing.jsonl")) == []
+
+    def test_yields_lazily(self, tmp_path):
+        f = tmp_path / "log.jsonl"
+        write_jsonl(f, [LogEntry("t1", "s", "a"), LogEntry("t2", "s", "b")])
+        it = iter_jsonl(f)
+        assert next(it).text == "a"
+        assert [e.text for e in it] == ["b"]
+
 
 class TestWriteJsonl:
     def test_write_and_read_back(self, tmp_path):
@@ -72,3 +103,72 @@ class TestAppendJsonl:
         append_jsonl(f, [LogEntry(time="t2", source="s", text="second")])
         result = parse_jsonl(f)
         assert len(result) == 2
+
+
+class TestParseCache:
+    def test_reuses_parse_until_file_changes(self, tmp_path, monkeypatch):
+        f = tmp_path / "log.jsonl"
+        write_jsonl(f, [LogEntry("t1", "s", "a")])
+        assert [e.text for e in parse_jsonl(f)] == ["a"]
+
+        calls = []
+        monkeypatch.setattr(logs, "iter_jsonl", lambda p: calls.append(p) or iter(()))
+        assert [e.text for e in parse_jsonl(f)] == ["a"]
+        assert calls == []
+
+        monkeypatch.undo()
+        append_jsonl(f, [LogEntry("t2", "s", "b")])
+        assert [e.text for e in parse_jsonl(f)] == ["a", "b"]
+
+    def test_external_rewrite_detected(self, tmp_path):
+        f = tmp_path / "log.jsonl"
+        write_jsonl(f, [LogEntry("t1", "s", "a")])
+        parse_jsonl(f)
+        f.write_text('{"time":"t","source":"s","text":"other"}\n', encoding="utf-8")
+        assert [e.text for e in parse_jsonl(f)] == ["other"]
+
+    def test_in_place_rewrite_that_grows_reparsed_in_full(self, tmp_path):
+        f = tmp_path / "log.jsonl"
+        append_jsonl(f, [LogEntry("t1", "s", "a")])
+        parse_jsonl(f)
+        with open(f, "r+b") as fh:  # same inode, larger, different start
+            fh.write(logs._encode_lines([LogEntry("t9", "s", "x"), LogEntry("t10", "s", "y")]))
+        assert [e.time for e in parse_jsonl(f)] == ["t9", "t10"]
+
+    def test_write_replaces_file_and_leaves_no_temp(self, tmp_path):
+        f = tmp_path / "log.jsonl"
+        write_jsonl(f, [LogEntry("t1", "s", "a")])
+        ino = f.stat().st_ino
+        parse_jsonl(f)
+        write_jsonl(f, [LogEntry("t2", "s", "b")])
+        assert f.stat().st_ino != ino
+        assert [p.name for p in tmp_path.iterdir()] == ["log.jsonl"]
+        assert [e.text for e in parse_jsonl(f)] == ["b"]
+
+    def test_append_parses_only_new_tail(self, tmp_path, monkeypatch):
+        f = tmp_path / "log.jsonl"
+        write_jsonl(f, [LogEntry("t1", "s", "a")])
+        parse_jsonl(f)
+        append_jsonl(f, [LogEntry("t2", "s", "b")])
+
+        parsed = []
+        real = logs._loads
+        monkeypatch.setattr(logs, "_loads", lambda line: parsed.append(line) or real(line))
+        assert [e.text for e in parse_jsonl(f)] == ["a", "b"]
+        assert len(parsed) == 1
+
+    def test_partial_last_line_reparsed_in_full(self, tmp_path):
+        f = tmp_path / "log.jsonl"
+        write_jsonl(f, [LogEntry("t1", "s", "a")])
+        with open(f, "ab") as fh:
+            fh.write(b'{"time":"t2","source":"s",')
+        assert [e.text for e in parse_jsonl(f)] == ["a"]
+        with open(f, "ab") as fh:
+            fh.write(b'"text":"b"}\n')
+        assert [e.text for e in parse_jsonl(f)] == ["a", "b"]
+
+    def test_returns_fresh_list(self, tmp_path):
+        f = tmp_path / "log.jsonl"
+        write_jsonl(f, [LogEntry("t1", "s", "a")])
+        parse_jsonl(f).clear()
+        assert len(parse_jsonl(f)) == 1
@@ -1,15 +1,14 @@
 """Tests for mist_core.storage.notes."""
 
+import re
+import threading
+import time
+
 import pytest
 
-from mist_core.paths import Paths
+from mist_core.storage import notes as notes_module
 from mist_core.storage.logs import LogEntry
-from mist_core.storage.notes import NoteStorage
-
-
-@pytest.fixture
-def paths(tmp_path):
-    return Paths(root=tmp_path / "data")
+from mist_core.storage.notes import NoteStorage, _slugify
 
 
 @pytest.fixture
@@ -46,6 +45,17 @@ class TestNoteBuffer:
         result = notes.parse_buffer()
         assert len(result) == 2
 
+    def test_tail_buffer(self, notes):
+        notes.write_buffer([
+            LogEntry(time="t1", source="note", text="a"),
+            LogEntry(time="t2", source="terminal", text="b"),
+            LogEntry(time="t3", source="note", text="c"),
+            LogEntry(time="t4", source="note", text="d"),
+        ])
+        assert [e.text for e in notes.tail_buffer(2)] == ["c", "d"]
+        assert [e.text for e in notes.tail_buffer(5, source="note")] == ["a", "c", "d"]
+        assert [e.text for e in notes.tail_buffer(1, source="terminal")] == ["b"]
+
 
 class TestTopicIndex:
     def test_empty_initially(self, notes):
@@ -79,6 +89,17 @@ class TestTopicIndex:
     def test_find_topic_missing(self, notes):
         assert notes.find_topic("nonexistent") is None
 
+    def test_index_cached_until_file_changes(self, notes, monkeypatch):
+        notes.add_topic("ML", "ml")
+        path = notes.paths.agent_topic_index("test-agent")
+        monkeypatch.setattr(type(path), "read_bytes", lambda self: pytest.fail("re-read"))
+        assert [t.slug for t in notes.load_topic_index()] == ["ml"]
+        monkeypatch.undo()
+
+        path.write_text('[{"id": 7, "name": "Other", "slug": "other", "created": "c"}]\n',
+                        encoding="utf-8")
+        assert [t.id for t in notes.load_topic_index()] == [7]
+
 
 class TestTopicBuffer:
     def test_append_and_load(self, notes):
@@ -89,6 +110,13 @@ class TestTopicBuffer:
         assert len(result) == 1
         assert result[0].text == "note about ml"
 
+    def test_load_many_in_order(self, notes):
+        for slug in ("a", "b", "c"):
+            notes.add_topic(slug.upper(), slug)
+            notes.append_to_topic_buffer(slug, [LogEntry(time="t", source="s", text=slug)])
+        buffers = notes.load_topic_buffers(["c", "missing", "a"])
+        assert [[e.text for e in b] for b in buffers] == [["c"], [], ["a"]]
+
 
 class TestTopicSynthesis:
     def test_empty_initially(self, notes):
@@ -163,6 +191,43 @@ class TestMergeTopics:
         assert count == 1
         assert notes.load_topic_buffer("tgt")[0].text == "from source"
 
+    def test_merge_interleaves_by_time(self, notes):
+        shared = LogEntry(time="t2", source="s", text="both")
+        notes.append_to_topic_buffer("tgt", [LogEntry("t1", "s", "a"), shared,
+                                             LogEntry("t4", "s", "d")])
+        notes.append_to_topic_buffer("src", [shared, LogEntry("t3", "s", "c")])
+        count = notes.merge_topics("src", "tgt")
+        texts = [e.text for e in notes.load_topic_buffer("tgt")]
+        assert texts == ["a", "both", "both", "c", "d"]
+        assert count == 2
+
+    def test_merge_moves_source_dir_out_of_the_way(self, notes):
+        notes.add_topic("Source", "src")
+        notes.add_topic("Target", "tgt")
+        notes.merge_topics("src", "tgt")
+        topics_dir = notes.paths.agent_topics_dir("test-agent")
+        assert not (topics_dir / "src").exists()
+        assert (topics_dir / "tgt").is_dir()
+
+    def test_leftover_trash_swept_on_init_off_thread(self, notes, monkeypatch):
+        leftover = notes.paths.agent_topics_dir("test-agent") / ".src.trash-1"
+        (leftover / "notes").mkdir(parents=True)
+        threads = []
+        real_rmtree = notes_module.shutil.rmtree
+
+        def rmtree(path, ignore_errors=False):
+            threads.append(threading.current_thread())
+            real_rmtree(path, ignore_errors=ignore_errors)
+
+        monkeypatch.setattr(notes_module.shutil, "rmtree", rmtree)
+        NoteStorage(notes.paths, "test-agent")
+        for _ in range(100):
+            if not leftover.exists():
+                break
+            time.sleep(0.01)
+        assert not leftover.exists()
+        assert threads and threading.main_thread() not in threads
+
     def test_merge_removes_source_from_index(self, notes):
         notes.add_topic("Source", "src")
         notes.add_topic("Target", "tgt")
@@ -209,3 +274,12 @@ class TestNamespaceIsolation:
         assert a.parse_buffer()[0].text == "from agent a"
         assert len(b.parse_buffer()) == 1
         assert b.parse_buffer()[0].text == "from agent b"
+
+
+class TestSlugify:
+    @pytest.mark.parametrize("title", [
+        "Machine Learning", "C++ & Python", "  --a__b--  ", "Ünïcode Tïtle", "", "!!!",
+    ])
+    def test_matches_regex_definition(self, title):
+        expected = re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+        assert _slugify(title) == expected
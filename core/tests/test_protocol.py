@@ -24,6 +24,13 @@ class TestMessageCreate:
         assert len(msg.id) == 32
         uuid.UUID(msg.id, version=4)
 
+    def test_ids_unique_and_uuid4_across_batches(self):
+        ids = [Message.create(MSG_COMMAND, sender="a", to="b").id for _ in range(2500)]
+        assert len(set(ids)) == len(ids)
+        parsed = uuid.UUID(ids[-1])
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+
     def test_default_payload_is_empty_dict(self):
         msg = Message.create(MSG_COMMAND, sender="a", to="b")
         assert msg.payload == {}
@@ -70,6 +77,10 @@ class TestFrozen:
         with pytest.raises(AttributeError):
             msg.type = "other"  # type: ignore[misc]
 
+    def test_slotted_no_instance_dict(self):
+        msg = Message.create(MSG_COMMAND, sender="a", to="b")
+        assert not hasattr(msg, "__dict__")
+
 
 class TestRoundTrip:
     def test_encode_decode_preserves_equality(self):
@@ -113,6 +124,18 @@ class TestWireFormat:
         wire = json.loads(encode_message(msg))
         assert "timestamp" in wire
 
+    def test_to_wire_matches_encoded(self):
+        msg = Message.create(MSG_COMMAND, sender="a", to="b", reply_to="x")
+        assert msg.to_wire() == json.loads(encode_message(msg))
+        assert msg.to_wire()["from"] == "a"
+
+    def test_non_ascii_not_escaped(self):
+        msg = Message.create(MSG_COMMAND, sender="a", to="b", payload={"text": "café 日本"})
+        line = encode_message(msg)
+        assert "café 日本" in line
+        assert "\n" not in line
+        assert decode_message(line).payload["text"] == "café 日本"
+
 
 class TestDecodeErrors:
     def test_invalid_json(self):
@@ -131,3 +154,27 @@ class TestDecodeErrors:
         data = json.dumps({"type": "x", "id": "1", "to": "b", "payload": {}})
         with pytest.raises(ProtocolError, match="from"):
             decode_message(data)
+
+    def test_invalid_utf8_bytes(self):
+        with pytest.raises(ProtocolError, match="invalid JSON"):
+            decode_message(b'{"type": "\xff"}\n')
+
+    def test_non_string_routing_field(self):
+        data = json.dumps({"type": "x", "id": "1", "from": 7, "to": "b", "payload": {}})
+        with pytest.raises(ProtocolError, match="must be strings"):
+            decode_message(data)
+
+
+class TestDecodeBytes:
+    def test_raw_socket_line(self):
+        msg = Message.create("command", "widget", "mist-0", {"text": "café"})
+        raw = (encode_message(msg) + "\n").encode()
+        assert decode_message(raw) == msg
+
+
+class TestInterning:
+    def test_decoded_routing_fields_are_shared(self):
+        line = encode_message(Message.create("command", "widget", "mist-0"))
+        a, b = decode_message(line), decode_message(line)
+        assert a.sender is b.sender
+        assert a.to is b.to
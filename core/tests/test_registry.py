@@ -141,3 +141,19 @@ class TestCatalog:
         assert catalog[0]["agent_id"] == "mist-0"
         assert catalog[0]["description"] == "Main agent"
         assert catalog[0]["panels"] == [{"id": "chat", "type": "chat"}]
+
+    def test_catalog_cached_until_mutation(self):
+        reg = AgentRegistry()
+        conn = _mock_conn()
+        reg.register(conn, {"name": "a"})
+        first = reg.build_catalog()
+        assert reg.build_catalog() is first
+
+        reg.register(_mock_conn(), {"name": "b"})
+        assert [c["name"] for c in reg.build_catalog()] == ["a", "b"]
+
+        reg.unregister_by_conn(conn)
+        assert [c["name"] for c in reg.build_catalog()] == ["b"]
+
+        reg.unregister("b-0")
+        assert reg.build_catalog() == []
@@ -8,6 +8,7 @@ import pytest
 
 from mist_core.protocol import (
     Message,
+    MSG_AGENT_BROADCAST,
     MSG_AGENT_CATALOG,
     MSG_AGENT_LIST,
     MSG_AGENT_MESSAGE,
@@ -17,6 +18,7 @@ from mist_core.protocol import (
     MSG_ERROR,
     MSG_RESPONSE,
     MSG_SERVICE_REQUEST,
+    decode_message,
 )
 from mist_core.transport import Connection
 
@@ -29,6 +31,7 @@ from mist_core.broker.services import ServiceDispatcher
 def mock_conn():
     conn = MagicMock(spec=Connection)
     conn.send = AsyncMock()
+    conn.send_raw = AsyncMock()
     return conn
 
 
@@ -36,6 +39,7 @@ def mock_conn():
 def mock_conn2():
     conn = MagicMock(spec=Connection)
     conn.send = AsyncMock()
+    conn.send_raw = AsyncMock()
     return conn
 
 
@@ -131,6 +135,14 @@ class TestCommandRouting:
         assert reply.payload["text"] == "hello back"
         assert cmd_msg.id not in router._pending
 
+    async def test_pending_table_bounded(self, router, mock_conn, mock_conn2, registry, monkeypatch):
+        monkeypatch.setattr("mist_core.broker.router.MAX_PENDING", 2)
+        registry.register(mock_conn2, {"name": "mist"})
+        msgs = [Message.create(MSG_COMMAND, "widget", "mist-0", {}) for _ in range(3)]
+        for m in msgs:
+            await router.handle(m, mock_conn)
+        assert list(router._pending) == [msgs[1].id, msgs[2].id]
+
 
 class TestAdminHandler:
     async def test_command_to_admin_calls_handler(self, router, registry):
@@ -165,6 +177,22 @@ class TestInterAgentMessage:
         reply = _get_reply(mock_conn)
         assert reply.type == MSG_ERROR
 
+    async def test_broadcast_encodes_once_and_skips_sender(
+        self, router, mock_conn, mock_conn2, registry,
+    ):
+        mock_conn3 = MagicMock(spec=Connection)
+        mock_conn3.send_raw = AsyncMock()
+        registry.register(mock_conn, {"name": "notes"})
+        registry.register(mock_conn2, {"name": "science"})
+        registry.register(mock_conn3, {"name": "other"})
+        msg = Message.create(MSG_AGENT_BROADCAST, "notes-0", "*", {"data": "hi"})
+        await router.handle(msg, mock_conn)
+
+        mock_conn.send_raw.assert_not_called()
+        line = mock_conn2.send_raw.call_args[0][0]
+        assert mock_conn3.send_raw.call_args[0][0] is line
+        assert decode_message(line).payload == {"data": "hi"}
+
 
 class TestServiceRouting:
     async def test_service_request_delegates(self, router, mock_conn, services):
@@ -183,3 +211,20 @@ class TestUnknownType:
         reply = _get_reply(mock_conn)
         assert reply.type == MSG_ERROR
         assert "unknown message type" in reply.payload["error"]
+
+
+class TestUIBroadcast:
+    async def test_broadcast_to_ui_drops_failed_connection(self, router):
+        good = MagicMock()
+        good.send_raw = AsyncMock()
+        bad = MagicMock()
+        bad.send_raw = AsyncMock(side_effect=ConnectionResetError)
+        router.add_ui_connection(good)
+        router.add_ui_connection(bad)
+
+        msg = Message.create(MSG_RESPONSE, "broker", "*", {"x": 1})
+        await router.broadcast_to_ui(msg)
+        await router.broadcast_to_ui(msg)
+
+        assert good.send_raw.await_count == 2
+        assert bad.send_raw.await_count == 1
@@ -10,10 +10,8 @@ from mist_core.admin.agent import AdminAgent
 from mist_core.broker.registry import AgentRegistry
 from mist_core.broker.router import MessageRouter, PendingCommand
 from mist_core.broker.services import ServiceDispatcher
-from mist_core.db import Database
 from mist_core.llm.client import OllamaClient
 from mist_core.llm.queue import LLMQueue
-from mist_core.paths import Paths
 from mist_core.protocol import (
     Message,
     MSG_COMMAND,
@@ -21,7 +19,6 @@ from mist_core.protocol import (
     RESP_ERROR,
     RESP_TEXT,
 )
-from mist_core.storage.settings import Settings
 
 
 class FakeConn:
@@ -34,25 +31,6 @@ class FakeConn:
         self.sent.append(msg)
 
 
-@pytest.fixture
-def paths(tmp_path):
-    return Paths(root=tmp_path / "data")
-
-
-@pytest.fixture
-def db(paths):
-    database = Database(paths.db)
-    database.connect()
-    database.init_schema()
-    yield database
-    database.close()
-
-
-@pytest.fixture
-def settings(paths):
-    return Settings(paths)
-
-
 @pytest.fixture
 def registry():
     return AgentRegistry()
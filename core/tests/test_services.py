@@ -2,38 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from mist_core.db import Database
-from mist_core.paths import Paths
-from mist_core.protocol import Message, MSG_SERVICE_REQUEST, MSG_SERVICE_RESPONSE, MSG_SERVICE_ERROR
+from mist_core.protocol import (
+    Message, EVENT_TOPIC_CHANGED, MSG_EVENT, MSG_SERVICE_REQUEST,
+    MSG_SERVICE_RESPONSE, MSG_SERVICE_ERROR,
+)
 from mist_core.storage.settings import Settings
 from mist_core.transport import Connection
 
 from mist_core.broker.services import ServiceDispatcher
 
 
-@pytest.fixture
-def paths(tmp_path):
-    return Paths(root=tmp_path / "data")
-
-
-@pytest.fixture
-def db(paths):
-    database = Database(paths.db)
-    database.connect()
-    database.init_schema()
-    yield database
-    database.close()
-
-
-@pytest.fixture
-def settings(paths):
-    return Settings(paths)
-
-
 @pytest.fixture
 def dispatcher(paths, db, settings):
     return ServiceDispatcher(paths, db, settings)
@@ -101,6 +84,14 @@ class TestEvents:
         events = _get_reply(mock_conn).payload["result"]
         assert len(events) == 1
 
+    async def test_create_many(self, dispatcher, mock_conn):
+        msg = _service_msg("events", "create_many", {"events": [
+            {"title": "A", "start_time": "2025-06-01T10:00"},
+            {"title": "B", "start_time": "2025-06-02T10:00"},
+        ]})
+        await dispatcher.handle(msg, mock_conn)
+        assert _get_reply(mock_conn).payload["result"] == {"event_ids": [1, 2]}
+
 
 # ── Articles ─────────────────────────────────────────────────────────
 
@@ -137,6 +128,31 @@ class TestStorage:
         assert len(entries) == 1
         assert entries[0]["text"] == "hello"
 
+    async def test_concurrent_requests_share_batch_in_order(self, dispatcher, mock_conn):
+        save = _service_msg("storage", "save_raw_input", {"text": "hi", "source": "t"})
+        bad = _service_msg("storage", "load_topic_buffer", {"nope": 1})
+        parse = _service_msg("storage", "parse_buffer")
+        await asyncio.gather(
+            dispatcher.handle(save, mock_conn),
+            dispatcher.handle(bad, mock_conn),
+            dispatcher.handle(parse, mock_conn),
+        )
+        replies = {c.args[0].reply_to: c.args[0] for c in mock_conn.send.call_args_list}
+        assert replies[save.id].payload["result"] is True
+        assert replies[bad.id].type == MSG_SERVICE_ERROR
+        assert [e["text"] for e in replies[parse.id].payload["result"]] == ["hi"]
+
+    async def test_tail_buffer(self, dispatcher, mock_conn):
+        for text, source in [("a", "note"), ("b", "terminal"), ("c", "note")]:
+            msg = _service_msg("storage", "save_raw_input", {"text": text, "source": source})
+            await dispatcher.handle(msg, mock_conn)
+
+        mock_conn.send.reset_mock()
+        msg = _service_msg("storage", "tail_buffer", {"count": 1, "source": "note"})
+        await dispatcher.handle(msg, mock_conn)
+        entries = _get_reply(mock_conn).payload["result"]
+        assert [e["text"] for e in entries] == ["c"]
+
     async def test_topic_round_trip(self, dispatcher, mock_conn):
         msg = _service_msg("storage", "add_topic", {"name": "ML", "slug": "ml"})
         await dispatcher.handle(msg, mock_conn)
@@ -149,6 +165,35 @@ class TestStorage:
         index = _get_reply(mock_conn).payload["result"]
         assert len(index) == 1
 
+    async def test_load_topic_buffers(self, dispatcher, mock_conn):
+        for slug in ("a", "b"):
+            await dispatcher.handle(_service_msg("storage", "append_to_topic_buffer", {
+                "slug": slug, "entries": [{"time": "t", "source": "s", "text": slug}],
+            }), mock_conn)
+        mock_conn.send.reset_mock()
+        msg = _service_msg("storage", "load_topic_buffers", {"slugs": ["b", "a"]})
+        await dispatcher.handle(msg, mock_conn)
+        buffers = _get_reply(mock_conn).payload["result"]
+        assert [[e["text"] for e in b] for b in buffers] == [["b"], ["a"]]
+
+    async def test_topic_writes_publish_events(self, dispatcher, mock_conn):
+        sink = AsyncMock()
+        dispatcher.set_event_sink(sink)
+        await dispatcher.handle(
+            _service_msg("storage", "add_topic", {"name": "ML", "slug": "ml"}), mock_conn,
+        )
+        await dispatcher.handle(
+            _service_msg("storage", "save_topic_synthesis", {"slug": "ml", "content": "s"}),
+            mock_conn,
+        )
+        await dispatcher.handle(_service_msg("storage", "load_topic_index"), mock_conn)
+
+        events = [c.args[0] for c in sink.call_args_list]
+        assert [e.type for e in events] == [MSG_EVENT, MSG_EVENT]
+        assert events[0].payload == {
+            "topic": EVENT_TOPIC_CHANGED, "agent_id": "test-agent", "slug": "ml",
+        }
+
     async def test_aggregate_time(self, dispatcher, mock_conn):
         msg = _service_msg("storage", "get_last_aggregate_time")
         await dispatcher.handle(msg, mock_conn)
@@ -1,21 +1,8 @@
 """Tests for mist_core.storage.settings."""
 
-import pytest
-
-from mist_core.paths import Paths
 from mist_core.storage.settings import Settings, DEFAULT_MODEL
 
 
-@pytest.fixture
-def paths(tmp_path):
-    return Paths(root=tmp_path / "data")
-
-
-@pytest.fixture
-def settings(paths):
-    return Settings(paths)
-
-
 class TestSettings:
     def test_load_defaults(self, settings):
         s = settings.load()
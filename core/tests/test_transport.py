@@ -72,6 +72,53 @@ async def test_multiple_messages(sock_path):
         await server.stop()
 
 
+async def test_pipelined_requests_keep_other_messages(sock_path):
+    async def handler(msg: Message, conn) -> None:
+        await conn.send(Message.create(MSG_COMMAND, sender="srv", to="test",
+                                       payload={"push": msg.payload["i"]}))
+        await asyncio.sleep(0.01 * (3 - msg.payload["i"]))
+        await conn.send(Message.reply(msg, sender="srv", type=MSG_RESPONSE,
+                                      payload=msg.payload))
+
+    server = Server(handler, path=sock_path)
+    await server.start()
+    try:
+        client = Client(path=sock_path)
+        await client.connect()
+        try:
+            replies = await asyncio.gather(*(
+                client.request(Message.create(MSG_COMMAND, sender="test", to="srv",
+                                              payload={"i": i}), timeout=2.0)
+                for i in range(3)
+            ))
+            assert [r.payload["i"] for r in replies] == [0, 1, 2]
+            pushed = [await asyncio.wait_for(client.recv(), timeout=2.0) for _ in range(3)]
+            assert sorted(m.payload["push"] for m in pushed) == [0, 1, 2]
+        finally:
+            client.close()
+            await client.wait_closed()
+    finally:
+        await server.stop()
+
+
+async def test_message_larger_than_default_stream_limit(sock_path):
+    server = Server(_echo_handler, path=sock_path)
+    await server.start()
+    try:
+        client = Client(path=sock_path)
+        await client.connect()
+        try:
+            text = "line\n" * 50_000  # ~250 KiB, well past asyncio's 64 KiB default
+            msg = Message.create(MSG_COMMAND, sender="test", to="echo", payload={"t": text})
+            reply = await client.request(msg, timeout=2.0)
+            assert reply.payload["t"] == text
+        finally:
+            client.close()
+            await client.wait_closed()
+    finally:
+        await server.stop()
+
+
 async def test_concurrent_clients(sock_path):
     server = Server(_echo_handler, path=sock_path)
     await server.start()
@@ -6,6 +6,7 @@ import {
   MSG_AGENT_LIST,
   MSG_COMMAND,
   MSG_ERROR,
+  MSG_EVENT,
   MSG_RESPONSE,
   type AgentManifest,
   type Message,
@@ -23,6 +24,22 @@ let reconnectTimer: ReturnType<typeof setTimeout> | null = null;
 // One-shot response callbacks keyed by message ID
 const responseCallbacks = new Map<string, (payload: ResponsePayload) => void>();
 
+// Broker push-event listeners keyed by event topic (e.g. "topic:changed")
+const eventListeners = new Map<string, Set<(payload: Record<string, unknown>) => void>>();
+
+/** Subscribe to broker push events for *topic*. */
+export function onEvent(
+  topic: string,
+  listener: (payload: Record<string, unknown>) => void,
+): void {
+  let listeners = eventListeners.get(topic);
+  if (!listeners) {
+    listeners = new Set();
+    eventListeners.set(topic, listeners);
+  }
+  listeners.add(listener);
+}
+
 /** Register a one-shot callback for a specific message reply. */
 export function onResponse(
   msgId: string,
@@ -31,6 +48,11 @@ export function onResponse(
   responseCallbacks.set(msgId, callback);
 }
 
+/** Drop a pending callback; a late reply to *msgId* is then ignored. */
+export function cancelResponse(msgId: string): void {
+  responseCallbacks.delete(msgId);
+}
+
 export function connect(): void {
   if (ws && ws.readyState <= WebSocket.OPEN) return;
 
@@ -84,10 +106,12 @@ function requestCatalog(): void {
 }
 
 export function sendCommand(agentId: string, text: string): string {
-  // Parse "command arg1 arg2" into command + text
-  const parts = text.trim().split(/\s+/);
-  const command = parts[0] || "";
-  const rest = parts.slice(1).join(" ");
+  // Split "command rest..." at the first whitespace run only; the rest is
+  // passed through verbatim so multi-line note content keeps its layout.
+  const trimmed = text.trim();
+  const sep = trimmed.search(/\s/);
+  const command = sep === -1 ? trimmed : trimmed.slice(0, sep);
+  const rest = sep === -1 ? "" : trimmed.slice(sep).trimStart();
 
   const payload: Record<string, unknown> = {
     command,
@@ -155,6 +179,9 @@ function handleMessage(msg: Message): void {
     case MSG_ERROR:
       handleError(msg);
       break;
+    case MSG_EVENT:
+      handleEvent(msg);
+      break;
     default:
       console.log("Unhandled message type:", msg.type, msg);
   }
@@ -178,6 +205,14 @@ function handleResponse(msg: Message): void {
   }
 }
 
+function handleEvent(msg: Message): void {
+  const topic = msg.payload.topic as string | undefined;
+  if (!topic) return;
+  for (const listener of eventListeners.get(topic) ?? []) {
+    listener(msg.payload);
+  }
+}
+
 function handleError(msg: Message): void {
   const error = (msg.payload.error as string) ?? "Unknown error";
   if (msg.reply_to) {
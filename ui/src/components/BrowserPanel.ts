@@ -1,12 +1,13 @@
 /** Browser panel — dispatches to topic browser or generic table/list browser. */
 
-import { onResponse, sendStructuredCommand } from "../app";
-import type {
-  EditorContent,
-  ListContent,
-  ResponsePayload,
-  TableContent,
-  TopicDetailContent,
+import { cancelResponse, onEvent, onResponse, sendStructuredCommand } from "../app";
+import {
+  EVENT_TOPIC_CHANGED,
+  type EditorContent,
+  type ListContent,
+  type ResponsePayload,
+  type TableContent,
+  type TopicDetailContent,
 } from "../protocol";
 import { store, type State } from "../store";
 
@@ -14,6 +15,7 @@ import { store, type State } from "../store";
 
 export function mountBrowserPanel(container: HTMLElement): void {
   store.subscribe((state) => render(container, state));
+  onEvent(EVENT_TOPIC_CHANGED, onTopicChanged);
 }
 
 function render(container: HTMLElement, state: State): void {
@@ -31,6 +33,27 @@ function render(container: HTMLElement, state: State): void {
   }
 }
 
+// Latest in-flight request per fetch name. Starting a fetch drops the
+// callback of the one it supersedes, so a stale reply arriving late is
+// ignored instead of overwriting fresher data.
+const activeFetches = new Map<string, string>();
+
+function startFetch(
+  name: string,
+  command: string,
+  args: Record<string, unknown>,
+  callback: (resp: ResponsePayload) => void,
+): void {
+  const prev = activeFetches.get(name);
+  if (prev) cancelResponse(prev);
+  const id = sendStructuredCommand(command, args);
+  activeFetches.set(name, id);
+  onResponse(id, (resp) => {
+    if (activeFetches.get(name) === id) activeFetches.delete(name);
+    callback(resp);
+  });
+}
+
 // ══════════════════════════════════════════════════════════
 // Topics Browser (drill-down: list → detail → editor)
 // ══════════════════════════════════════════════════════════
@@ -47,11 +70,66 @@ let topicEditorContent = "";
 let topicEditorDirty = false;
 let topicLastPanelKey = "";
 let topicItems: string[] = [];
+// Topic list rows keyed by item text, so re-renders only build rows for
+// topics that are new since the last render and move the rest.
+let topicItemNodes = new Map<string, HTMLLIElement>();
+
+// Recently viewed topic details (LRU by Map insertion order). Shown at once
+// when a topic is reopened, then refreshed from the agent in the background.
+const TOPIC_DETAIL_CACHE_SIZE = 32;
+const topicDetailCache = new Map<string, TopicDetailContent>();
+
+function cacheTopicDetail(slug: string, detail: TopicDetailContent): void {
+  topicDetailCache.delete(slug);
+  topicDetailCache.set(slug, detail);
+  if (topicDetailCache.size > TOPIC_DETAIL_CACHE_SIZE) {
+    const oldest = topicDetailCache.keys().next().value;
+    if (oldest !== undefined) topicDetailCache.delete(oldest);
+  }
+}
+
+// Broker pushes topic:changed after topic storage writes; refetch only what
+// the user is looking at instead of polling the index. Events arrive in
+// bursts (one per topic an aggregate touches), so refetches are coalesced
+// into one per animation frame.
+let pendingTopicSlugs: Set<string> | null = null; // null: nothing queued
+let pendingAllTopics = false;
+
+function onTopicChanged(payload: Record<string, unknown>): void {
+  // Slugs are per agent; another agent's topics are not what we show.
+  if (payload.agent_id !== store.get().activeAgent) return;
+  const slug = payload.slug as string | null | undefined;
+  if (slug) {
+    topicDetailCache.delete(slug);
+  } else {
+    topicDetailCache.clear();
+    pendingAllTopics = true;
+  }
+  if (pendingTopicSlugs === null) {
+    pendingTopicSlugs = new Set();
+    requestAnimationFrame(flushTopicChanges);
+  }
+  if (slug) pendingTopicSlugs.add(slug);
+}
+
+function flushTopicChanges(): void {
+  const slugs = pendingTopicSlugs ?? new Set<string>();
+  const all = pendingAllTopics;
+  pendingTopicSlugs = null;
+  pendingAllTopics = false;
+  if (store.get().activePanel !== "topics") return;
+  if (topicViewState === "list") {
+    fetchTopics();
+  } else if (topicViewState === "detail" && (all || slugs.has(topicSlug))) {
+    openTopic(topicSlug);
+  }
+}
 
 function renderTopicsBrowser(container: HTMLElement, state: State): void {
   const panelKey = `${state.activeAgent}:${state.activePanel}`;
   if (panelKey !== topicLastPanelKey) {
     topicLastPanelKey = panelKey;
+    topicDetailCache.clear(); // cached details belong to the previous agent
     topicViewState = "list";
     topicDetailData = null;
     fetchTopics();
@@ -76,8 +154,7 @@ function renderTopicsBrowser(container: HTMLElement, state: State): void {
 }
 
 function fetchTopics(): void {
-  const id = sendStructuredCommand("topics", {});
-  onResponse(id, (resp) => {
+  startFetch("topics", "topics", {}, (resp) => {
     if (resp.type === "list") {
       topicItems = (resp.content as ListContent).items;
     }
@@ -106,33 +183,45 @@ function renderTopicList(parent: HTMLElement): void {
 
   const list = document.createElement("ul");
   list.className = "browser-topic-list";
+  const next = new Map<string, HTMLLIElement>();
   for (const item of topicItems) {
-    const li = document.createElement("li");
-    li.className = "browser-topic-item";
-    li.textContent = item;
-    const match = item.match(/\]\s+(\S+):/);
-    if (match) {
-      const slug = match[1];
-      li.addEventListener("click", () => openTopic(slug));
-    }
+    const li = topicItemNodes.get(item) ?? createTopicItem(item);
+    next.set(item, li);
     list.appendChild(li);
   }
+  topicItemNodes = next;
   parent.appendChild(list);
 }
 
+function createTopicItem(item: string): HTMLLIElement {
+  const li = document.createElement("li");
+  li.className = "browser-topic-item";
+  li.textContent = item;
+  const match = item.match(/\]\s+(\S+):/);
+  if (match) {
+    const slug = match[1];
+    li.addEventListener("click", () => openTopic(slug));
+  }
+  return li;
+}
+
 // ── Topic detail ────────────────────────────────────────
 
 function openTopic(slug: string): void {
   topicSlug = slug;
   topicViewState = "detail";
-  topicDetailData = null;
+  topicDetailData = topicDetailCache.get(slug) ?? null;
+  if (topicDetailData) topicName = topicDetailData.name;
   store.update({});
 
-  const id = sendStructuredCommand("topic", { action: "view", slug });
-  onResponse(id, (resp) => {
+  startFetch("topic_detail", "topic", { action: "view", slug }, (resp) => {
     if (resp.type === "topic_detail") {
-      topicDetailData = resp.content as TopicDetailContent;
-      topicName = topicDetailData.name;
+      const detail = resp.content as TopicDetailContent;
+      cacheTopicDetail(slug, detail);
+      if (topicSlug === slug) {
+        topicDetailData = detail;
+        topicName = detail.name;
+      }
     }
     store.update({});
   });
@@ -235,8 +324,7 @@ function openTopicEditor(slug: string, filename: string, title: string, content:
 }
 
 function loadAndOpenTopicEditor(slug: string, filename: string, title: string): void {
-  const id = sendStructuredCommand("topic", { action: "read", slug, filename });
-  onResponse(id, (resp) => {
+  startFetch("topic_read", "topic", { action: "read", slug, filename }, (resp) => {
     if (resp.type === "editor") {
       const ed = resp.content as EditorContent;
       openTopicEditor(slug, filename, ed.title || title, ed.content);
@@ -259,12 +347,12 @@ function renderTopicEditor(parent: HTMLElement): void {
   title.textContent = topicEditorTitle;
   header.appendChild(title);
 
+  // Keep direct references; handlers below run on every click/keystroke.
+  const textarea = document.createElement("textarea");
   const saveBtn = el("button", "browser-btn browser-save-btn") as HTMLButtonElement;
   saveBtn.textContent = "Save";
   saveBtn.disabled = !topicEditorDirty;
   saveBtn.addEventListener("click", () => {
-    const textarea = parent.querySelector<HTMLTextAreaElement>(".browser-editor-textarea");
-    if (!textarea) return;
     const content = textarea.value;
 
     const id = sendStructuredCommand("topic", {
@@ -276,10 +364,13 @@ function renderTopicEditor(parent: HTMLElement): void {
     onResponse(id, () => {
       topicEditorDirty = false;
       topicEditorContent = content;
-      const detailId = sendStructuredCommand("topic", { action: "view", slug: topicSlug });
-      onResponse(detailId, (resp) => {
+      const savedSlug = topicSlug;
+      topicDetailCache.delete(savedSlug);
+      startFetch("topic_detail", "topic", { action: "view", slug: savedSlug }, (resp) => {
         if (resp.type === "topic_detail") {
-          topicDetailData = resp.content as TopicDetailContent;
+          const detail = resp.content as TopicDetailContent;
+          cacheTopicDetail(savedSlug, detail);
+          if (topicSlug === savedSlug) topicDetailData = detail;
         }
       });
       store.update({});
@@ -288,14 +379,12 @@ function renderTopicEditor(parent: HTMLElement): void {
   header.appendChild(saveBtn);
   parent.appendChild(header);
 
-  const textarea = document.createElement("textarea");
   textarea.className = "browser-editor-textarea";
   textarea.value = topicEditorContent;
   textarea.spellcheck = false;
   textarea.addEventListener("input", () => {
     topicEditorDirty = true;
-    const btn = parent.querySelector<HTMLButtonElement>(".browser-save-btn");
-    if (btn) btn.disabled = false;
+    saveBtn.disabled = false;
   });
   parent.appendChild(textarea);
 }
@@ -371,8 +460,7 @@ function fetchGenericData(panelId: string): void {
   const command = PANEL_COMMANDS[panelId];
   if (!command) return;
 
-  const id = sendStructuredCommand(command, {});
-  onResponse(id, (resp) => {
+  startFetch(`generic:${panelId}`, command, {}, (resp) => {
     genericData.set(panelId, resp);
     store.update({});
   });
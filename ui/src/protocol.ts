@@ -16,6 +16,10 @@ export const MSG_SERVICE_ERROR = "service.error";
 
 export const MSG_AGENT_MESSAGE = "agent.message";
 export const MSG_AGENT_BROADCAST = "agent.broadcast";
+
+// Broker push notifications
+export const MSG_EVENT = "event";
+export const EVENT_TOPIC_CHANGED = "topic:changed";
 export const MSG_ERROR = "error";
 
 // Response type constants